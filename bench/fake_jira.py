@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 가짜 Jira Cloud 서버 (표준 라이브러리만 사용).
+
+jira_cli가 쓰는 엔드포인트를 메모리 상태로 흉내 낸다:
+  POST /rest/api/3/search/jql          nextPageToken 페이지, `key in (...)` (없는 키는 400), 필드 프로젝션
+  POST /rest/api/3/search/approximate-count  전체 이슈 수
+  GET/PUT /rest/api/3/issue/{key}      fields·expand=transitions
+  POST /rest/api/3/issue, /issue/bulk  생성 (이후 검색·조회에 나타남)
+  GET/POST /rest/api/3/issue/{key}/transitions
+  POST /rest/api/3/bulk/issues/transition, GET /bulk/queue/{id}
+  POST /rest/api/3/changelog/bulkfetch  상태 변경 이력 (전환할 때마다 기록, --history면 초기 이력 생성)
+  GET /rest/api/3/myself, /status, /issue/createmeta/{project}/issuetypes[/{id}]
+  GET /rest/api/3/users/search (startAt 페이지), /user/search?query= (이름·이메일 단어 접두어)
+  GET /_stats (요청 수·429 수), POST /_reset
+
+지연(--latency, --jitter), 응답 크기(--custom-fields, --description-chars), 429 주입(--rate 초과분, --error-rate 확률)을
+조절할 수 있다. 검색은 JQL을 해석하지 않고 전체 이슈를 순서대로 돌려준다 (`key in (...)`만 해석).
+
+    python bench/fake_jira.py --port 8765 --issues 2000 --latency 40 --rate 50
+    JIRA_BASE_URL=http://127.0.0.1:8765 JIRA_EMAIL=x JIRA_API_TOKEN=x python jira_cli.py list
+
+--port 0이면 빈 포트를 골라 첫 줄에 기본 URL을 출력한다 (bench/throughput.py가 사용).
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+API = "/rest/api/3"
+PROJECT = "PROJ"
+STATUSES = {"1": "To Do", "3": "In Progress", "5": "Done"}
+CATEGORIES = {"1": "new", "3": "indeterminate", "5": "done"}
+ISSUE_TYPES = [{"id": "10001", "name": "Task"}, {"id": "10004", "name": "Bug"}]
+FIRST_NAMES = ["Minsu", "Jiwon", "Seoyeon", "Hyunwoo", "Alex", "Sam", "Jordan", "Taylor"]
+LAST_NAMES = ["Kim", "Lee", "Park", "Choi", "Smith", "Jones"]
+_KEYS_RE = re.compile(r'"([^"]+)"')
+
+
+class FakeJira:
+    """이슈 저장소와 부하 설정. 핸들러 스레드들이 공유하므로 상태 변경은 lock 안에서."""
+
+    def __init__(self, issues=1000, custom_fields=20, description_chars=200, latency=0.0, jitter=0.0,
+                 rate=0.0, error_rate=0.0, retry_after=1.0, history=0, users=200, seed=1):
+        self.custom_fields = custom_fields
+        self.description_chars = description_chars
+        self.latency = latency
+        self.jitter = jitter
+        self.rate = rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.issues = {}  # 키 → 이슈 (삽입 순서 = 검색 순서)
+        self.by_id = {}
+        self.changelog = {}  # 이슈 id → [변경 이력]
+        self.next_id = 10000
+        self.tasks = {}
+        self.tokens = rate
+        self.refilled = time.monotonic()
+        self.stats = {"requests": 0, "throttled": 0, "by_endpoint": {}}
+        self.users = [_user(n) for n in range(1, users + 1)]
+        self.users.append({"accountId": "bench-app", "accountType": "app", "displayName": "Automation", "active": True})
+        for _ in range(issues):
+            issue = self._add(f"벤치마크 이슈 {self.next_id - 9999}", "Task", None)
+            if history:
+                self._seed_history(issue, history)
+
+    # --- 상태 ---
+
+    def _add(self, summary, issuetype, description):
+        self.next_id += 1
+        n = self.next_id - 10000
+        key = f"{PROJECT}-{n}"
+        text = description or ("설명 " * (self.description_chars // 3 + 1))[: self.description_chars]
+        fields = {
+            "summary": summary,
+            "status": _status("1"),
+            "issuetype": next((t for t in ISSUE_TYPES if t["name"] == issuetype), ISSUE_TYPES[0]),
+            "priority": {"id": "3", "name": "Medium"},
+            "assignee": {"accountId": "bench-user", "displayName": "Bench User"},
+            "reporter": {"accountId": "bench-user", "displayName": "Bench User"},
+            "project": {"id": "100", "key": PROJECT},
+            "labels": ["bench"],
+            "created": "2026-01-01T00:00:00.000+0000",
+            "updated": "2026-01-%02dT00:00:00.000+0000" % (n % 28 + 1),
+            "resolutiondate": None,
+            "description": {"type": "doc", "version": 1, "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": text}]},
+            ]},
+        }
+        for c in range(self.custom_fields):
+            fields[f"customfield_{10100 + c}"] = {"id": str(c), "value": f"옵션 {c} " + "x" * 48}
+        issue = {"id": str(self.next_id), "key": key, "fields": fields}
+        self.issues[key] = issue
+        self.by_id[issue["id"]] = issue
+        return issue
+
+    def find(self, key_or_id):
+        return self.issues.get(key_or_id.upper()) or self.by_id.get(key_or_id)
+
+    @staticmethod
+    def project(issue, fields):
+        if not fields or "*all" in fields or "*navigable" in fields:
+            return issue
+        wanted = set(fields)
+        return {"id": issue["id"], "key": issue["key"], "fields": {k: v for k, v in issue["fields"].items() if k in wanted}}
+
+    @staticmethod
+    def transitions(issue):
+        current = issue["fields"]["status"]["id"]
+        return [
+            {"id": f"{sid}1", "name": f"To {name}", "to": _status(sid)}
+            for sid, name in STATUSES.items() if sid != current
+        ]
+
+    def move(self, issue, transition_id):
+        target = next((t["to"] for t in self.transitions(issue) if t["id"] == str(transition_id)), None)
+        if target is None:
+            return False
+        with self.lock:
+            self._record(issue, target["id"], time.time())
+        return True
+
+    def _record(self, issue, sid, at):
+        fields = issue["fields"]
+        old = fields["status"]
+        history = self.changelog.setdefault(issue["id"], [])
+        history.append({
+            "id": str(len(history) + 1), "created": _jira_time(at),
+            "items": [{
+                "field": "status", "fieldId": "status", "from": old["id"], "fromString": old["name"],
+                "to": sid, "toString": STATUSES[sid],
+            }],
+        })
+        fields["status"] = _status(sid)
+        fields["resolutiondate"] = _jira_time(at) if CATEGORIES[sid] == "done" else None
+
+    def _seed_history(self, issue, steps):
+        """최근 90일 안에 생성되어 최대 steps번 전환된 이력 (분석 벤치마크용)."""
+        now = time.time()
+        at = now - self.random.uniform(1, 90) * 86400
+        issue["fields"]["created"] = _jira_time(at)
+        for _ in range(self.random.randint(0, steps)):
+            at += self.random.expovariate(1 / 86400.0)
+            if at >= now:
+                break
+            current = issue["fields"]["status"]["id"]
+            self._record(issue, self.random.choice([sid for sid in STATUSES if sid != current]), at)
+
+    # --- 부하 주입 ---
+
+    def throttled(self):
+        """429를 돌려줄지: 초당 rate를 넘었거나 error_rate 확률에 걸림."""
+        with self.lock:
+            if self.error_rate and self.random.random() < self.error_rate:
+                return True
+            if not self.rate:
+                return False
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.refilled) * self.rate)
+            self.refilled = now
+            if self.tokens < 1:
+                return True
+            self.tokens -= 1
+            return False
+
+    def delay(self):
+        if self.latency or self.jitter:
+            time.sleep(max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter)))
+
+    def count(self, endpoint, throttled):
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["throttled"] += throttled
+            self.stats["by_endpoint"][endpoint] = self.stats["by_endpoint"].get(endpoint, 0) + 1
+
+
+def _status(sid):
+    return {"id": sid, "name": STATUSES[sid], "statusCategory": {"key": CATEGORIES[sid]}}
+
+
+def _user(n):
+    first, last = FIRST_NAMES[n % len(FIRST_NAMES)], LAST_NAMES[n // len(FIRST_NAMES) % len(LAST_NAMES)]
+    # 같은 이름이 여럿 생기도록 48명마다 이름이 반복되고, 이메일은 번호로 구분
+    return {
+        "accountId": f"user-{n:05d}", "accountType": "atlassian", "active": n % 50 != 0,
+        "displayName": f"{first} {last}", "emailAddress": f"{first.lower()}.{last.lower()}{n}@example.com",
+    }
+
+
+def _jira_time(epoch):
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime(epoch))
+
+
+def _endpoint(method, path):
+    parts = [("{key}" if "-" in p or p.isdigit() else p) for p in path.split("/")]
+    return f"{method} {'/'.join(parts)}"
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeJira/1.0"
+    disable_nagle_algorithm = True  # 헤더·본문을 따로 보내므로 Nagle + 지연 ACK(~40ms)가 지연을 왜곡하지 않도록
+    jira = None  # FakeJira (serve()에서 지정)
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, obj=None, headers=None):
+        body = b"" if obj is None else json.dumps(obj, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, {"errorMessages": [message], "errors": {}})
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if url.path == "/_stats":
+            return self._send(200, self.jira.stats)
+        if url.path == "/_reset":
+            with self.jira.lock:
+                self.jira.stats = {"requests": 0, "throttled": 0, "by_endpoint": {}}
+            return self._send(204)
+        if not url.path.startswith(API):
+            return self._error(404, "Not found")
+        path = url.path[len(API):]
+        throttled = self.jira.throttled()
+        self.jira.count(_endpoint(method, path), throttled)
+        if throttled:
+            return self._send(429, {"errorMessages": ["Rate limit exceeded."]}, {"Retry-After": f"{self.jira.retry_after:g}"})
+        self.jira.delay()
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            return self._error(400, "Invalid JSON")
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        handler = getattr(self, f"_{method.lower()}", None)
+        if handler is None or handler(path, query, body) is False:
+            self._error(404, f"Unsupported: {method} {path}")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    # --- 엔드포인트 ---
+
+    def _get(self, path, query, body):
+        jira = self.jira
+        parts = path.strip("/").split("/")
+        if path == "/myself":
+            return self._send(200, {"accountId": "bench-user", "displayName": "Bench User", "emailAddress": "bench@example.com"})
+        if path == "/status":
+            return self._send(200, [_status(sid) for sid in STATUSES])
+        if path == "/users/search":
+            start, size = int(query.get("startAt") or 0), min(int(query.get("maxResults") or 50), 1000)
+            return self._send(200, jira.users[start:start + size])
+        if path == "/user/search":
+            words = (query.get("query") or "").casefold().split()
+
+            def tokens(u):
+                email = u.get("emailAddress", "").casefold()
+                return re.split(r"[\s.@]+", f"{u['displayName']} {email}".casefold()) + [email]
+
+            found = [u for u in jira.users if words and all(any(t.startswith(w) for t in tokens(u)) for w in words)]
+            return self._send(200, found[: int(query.get("maxResults") or 50)])
+        if parts[:2] == ["issue", "createmeta"]:
+            return self._createmeta(parts[2:], query)
+        if parts[0] == "bulk" and len(parts) == 3 and parts[1] == "queue":
+            task = jira.tasks.get(parts[2])
+            return self._send(200, task) if task else self._error(404, "Task not found")
+        if parts[0] != "issue" or len(parts) not in (2, 3):
+            return False
+        issue = jira.find(parts[1])
+        if issue is None:
+            return self._error(404, "Issue does not exist or you do not have permission to see it.")
+        if len(parts) == 3:
+            if parts[2] != "transitions":
+                return False
+            return self._send(200, {"transitions": jira.transitions(issue)})
+        fields = query.get("fields")
+        out = jira.project(issue, fields.split(",") if fields else None)
+        if "transitions" in (query.get("expand") or ""):
+            out = dict(out, transitions=jira.transitions(issue))
+        return self._send(200, out)
+
+    def _createmeta(self, rest, query):
+        if len(rest) < 2 or rest[0].upper() != PROJECT or rest[1] != "issuetypes":
+            return self._error(404, "Project not found")
+        if len(rest) == 2:
+            return self._send(200, {"startAt": 0, "maxResults": 50, "total": len(ISSUE_TYPES), "issueTypes": ISSUE_TYPES})
+        fields = [
+            {"fieldId": "summary", "name": "Summary", "required": True, "schema": {"type": "string"}},
+            {"fieldId": "project", "name": "Project", "required": True, "schema": {"type": "project"}},
+            {"fieldId": "issuetype", "name": "Issue Type", "required": True, "schema": {"type": "issuetype"}},
+            {"fieldId": "description", "name": "Description", "required": False, "schema": {"type": "string"}},
+            {"fieldId": "assignee", "name": "Assignee", "required": False, "schema": {"type": "user"}},
+        ]
+        start = int(query.get("startAt") or 0)
+        return self._send(200, {"startAt": start, "maxResults": 50, "total": len(fields), "fields": fields[start:start + 50]})
+
+    def _post(self, path, query, body):
+        jira = self.jira
+        if path == "/search/jql":
+            return self._search(body)
+        if path == "/search/approximate-count":
+            with jira.lock:
+                return self._send(200, {"count": len(jira.issues)})
+        if path == "/changelog/bulkfetch":
+            return self._bulkfetch(body)
+        if path == "/issue":
+            return self._send(201, self._create(body.get("fields") or {}))
+        if path == "/issue/bulk":
+            created = [self._create(u.get("fields") or {}) for u in body.get("issueUpdates") or []]
+            return self._send(201, {"issues": created, "errors": []})
+        if path == "/bulk/issues/transition":
+            processed, failed = [], {}
+            for group in body.get("bulkTransitionInputs") or []:
+                for key in group.get("selectedIssueIdsOrKeys") or []:
+                    issue = jira.find(str(key))
+                    if issue and jira.move(issue, group.get("transitionId")):
+                        processed.append(int(issue["id"]))
+                    elif issue:
+                        failed[issue["id"]] = ["전환할 수 없는 상태입니다."]
+            with jira.lock:
+                task_id = str(len(jira.tasks) + 1)
+                jira.tasks[task_id] = {
+                    "taskId": task_id, "status": "COMPLETE",
+                    "processedAccessibleIssues": processed, "failedAccessibleIssues": failed,
+                }
+            return self._send(201, {"taskId": task_id})
+        parts = path.strip("/").split("/")
+        if len(parts) == 3 and parts[0] == "issue" and parts[2] == "transitions":
+            issue = jira.find(parts[1])
+            if issue is None:
+                return self._error(404, "Issue does not exist or you do not have permission to see it.")
+            if not jira.move(issue, (body.get("transition") or {}).get("id")):
+                return self._error(400, "Transition id is not valid for this issue.")
+            return self._send(204)
+        return False
+
+    def _put(self, path, query, body):
+        parts = path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "issue":
+            return False
+        issue = self.jira.find(parts[1])
+        if issue is None:
+            return self._error(404, "Issue does not exist or you do not have permission to see it.")
+        with self.jira.lock:
+            issue["fields"].update(body.get("fields") or {})
+        return self._send(204)
+
+    def _create(self, fields):
+        with self.jira.lock:
+            issue = self.jira._add(
+                fields.get("summary") or "", (fields.get("issuetype") or {}).get("name") or "Task",
+                fields.get("description") if isinstance(fields.get("description"), str) else None,
+            )
+        return {"id": issue["id"], "key": issue["key"], "self": f"{API}/issue/{issue['id']}"}
+
+    def _bulkfetch(self, body):
+        """이슈 순서대로 이력을 이어 붙여 maxResults건씩 (nextPageToken = 건너뛸 이력 수)."""
+        refs = body.get("issueIdsOrKeys") or []
+        if len(refs) > 1000:
+            return self._error(400, "issueIdsOrKeys must contain at most 1000 items.")
+        size = max(1, min(int(body.get("maxResults") or 1000), 10000))
+        skip = int(body.get("nextPageToken") or 0)
+        logs, seen = [], 0
+        with self.jira.lock:
+            for ref in refs:
+                issue = self.jira.find(str(ref))
+                histories = self.jira.changelog.get(issue["id"], []) if issue else []
+                take = histories[max(0, skip - seen):max(0, skip + size - seen)]
+                seen += len(histories)
+                if take:
+                    logs.append({"issueId": issue["id"], "changeHistories": take})
+        out = {"issueChangeLogs": logs}
+        if skip + size < seen:
+            out["nextPageToken"] = str(skip + size)
+        return self._send(200, out)
+
+    def _search(self, body):
+        jira = self.jira
+        jql = (body.get("jql") or "").strip()
+        fields = body.get("fields")
+        size = max(1, min(int(body.get("maxResults") or 50), 5000))
+        if jql.startswith("key in ("):
+            keys = _KEYS_RE.findall(jql) or jql[len("key in ("):-1].replace(" ", "").split(",")
+            missing = [k for k in keys if jira.find(k) is None]
+            if missing:
+                return self._error(400, f"An issue with key '{missing[0]}' does not exist for field 'key'.")
+            return self._send(200, {"issues": [jira.project(jira.find(k), fields) for k in keys], "isLast": True})
+        start = int(body.get("nextPageToken") or 0)
+        with jira.lock:
+            page = list(jira.issues.values())[start:start + size]
+            total = len(jira.issues)
+        out = {"issues": [jira.project(i, fields) for i in page]}
+        if start + size < total:
+            out["nextPageToken"] = str(start + size)
+        else:
+            out["isLast"] = True
+        return self._send(200, out)
+
+
+def serve(jira, host="127.0.0.1", port=0):
+    """서버를 만들어 반환 (serve_forever는 호출 측에서). port=0이면 빈 포트."""
+    handler = type("BoundHandler", (Handler,), {"jira": jira})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 가짜 Jira Cloud 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0이면 빈 포트 (첫 줄에 URL 출력)")
+    parser.add_argument("--issues", type=int, default=1000, help="미리 만들 이슈 수 (기본 1000)")
+    parser.add_argument("--custom-fields", type=int, default=20, help="이슈당 커스텀 필드 수 (응답 크기, 기본 20)")
+    parser.add_argument("--description-chars", type=int, default=200, help="설명 길이 (기본 200자)")
+    parser.add_argument("--latency", type=float, default=0, help="응답마다 더할 지연(ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="지연 흔들림 ±ms")
+    parser.add_argument("--rate", type=float, default=0, help="초당 허용 요청 수. 넘으면 429 (0이면 제한 없음)")
+    parser.add_argument("--error-rate", type=float, default=0, help="무작위로 429를 돌려줄 확률 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument("--history", type=int, default=0, help="초기 이슈마다 최대 N번의 상태 전환 이력 생성 (analytics용)")
+    parser.add_argument("--users", type=int, default=200, help="사용자 디렉터리 크기 (기본 200)")
+    args = parser.parse_args()
+
+    jira = FakeJira(
+        issues=args.issues, custom_fields=args.custom_fields, description_chars=args.description_chars,
+        latency=args.latency / 1000, jitter=args.jitter / 1000, rate=args.rate,
+        error_rate=args.error_rate, retry_after=args.retry_after, history=args.history,
+        users=args.users,
+    )
+    server = serve(jira, args.host, args.port)
+    print(f"http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
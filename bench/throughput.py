@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+처리량·지연 벤치마크 (실제 Jira 없이 bench/fake_jira.py 상대로).
+
+가짜 서버를 띄우고 list·search·show·create·transition을 세 경로로 잰다:
+  cli   `python jira_cli.py ...`를 새 프로세스로 (시작 비용 포함, 메모리는 자식 프로세스 최대 RSS)
+  lib   jira_cli 함수를 이 프로세스에서 (연결 재사용)
+  mcp   mcp_server 도구를 asyncio로 --concurrency개씩 동시에 (mcp 패키지가 있을 때)
+  bulk  transition_bulk·create_issues_bulk (한 번에 --bulk-size건)
+시나리오마다 p50/p99 지연, 초당 작업 수(검색은 초당 이슈 수), 최대 메모리, 작업당 Jira 요청 수를 남긴다.
+
+    python bench/throughput.py                         # 결과: bench/results/<git 버전>.json
+    python bench/throughput.py --latency 40 --rate 100 # 느린 사이트·요청 한도 흉내 (429 재시도 포함)
+    python bench/throughput.py --only lib.search,mcp.show -n 50
+    python bench/throughput.py --compare bench/results/v0.1.0.json   # 느려진 시나리오가 있으면 종료 코드 1
+
+클라이언트 속도 제한(JIRA_RATE_LIMITS)은 기본으로 끈다 (--client-rate-limits로 켬). MCP 응답 캐시도 꺼서 매번 Jira 경로를 잰다.
+"""
+import argparse
+import asyncio
+import importlib.util
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.request import Request, urlopen
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = ROOT / "jira_cli.py"
+FAKE = Path(__file__).resolve().parent / "fake_jira.py"
+RESULTS = Path(__file__).resolve().parent / "results"
+SURFACES = ("cli", "lib", "bulk", "mcp")  # 실행 순서 (mcp_server는 import 때 jira_cli를 계측하므로 마지막)
+STATUS_CYCLE = ("In Progress", "Done", "To Do")
+
+
+# --- 가짜 서버 ---
+
+
+class Server:
+    def __init__(self, args):
+        argv = [
+            sys.executable, str(FAKE), "--port", "0", "--issues", str(args.issues),
+            "--custom-fields", str(args.custom_fields), "--description-chars", str(args.description_chars),
+            "--latency", str(args.latency), "--jitter", str(args.jitter), "--rate", str(args.rate),
+            "--error-rate", str(args.error_rate), "--retry-after", str(args.retry_after),
+        ]
+        self.proc = subprocess.Popen(argv, stdout=subprocess.PIPE, text=True)
+        self.url = self.proc.stdout.readline().strip()
+        if not self.url.startswith("http"):
+            self.close()
+            raise SystemExit("가짜 서버를 시작하지 못했습니다.")
+
+    def stats(self):
+        with urlopen(f"{self.url}/_stats") as r:
+            return json.loads(r.read())
+
+    def reset(self):
+        urlopen(Request(f"{self.url}/_reset", method="POST")).close()
+
+    def close(self):
+        self.proc.terminate()
+        self.proc.wait(timeout=5)
+
+
+class Keys:
+    """작업마다 다른 이슈를 쓰도록 키를 차례로 나눠 줌. 전환 목표는 그 이슈의 사용 횟수로 (To Do → In Progress → Done → To Do)."""
+
+    def __init__(self, total):
+        self.total = total
+        self.next = 0
+        self.uses = {}
+
+    def take(self, n=1):
+        keys = []
+        for _ in range(n):
+            self.next = self.next % self.total + 1
+            keys.append(f"PROJ-{self.next}")
+        return keys
+
+    def target(self, key):
+        n = self.uses.get(key, 0)
+        self.uses[key] = n + 1
+        return STATUS_CYCLE[n % len(STATUS_CYCLE)]
+
+
+# --- 측정 ---
+
+
+def _summary(latencies, wall, items, requests, throttled, peak_kb):
+    ordered = sorted(latencies)
+
+    def pct(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "ops": len(latencies),
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p99_ms": round(pct(0.99), 2),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 2),
+        "ops_per_s": round(len(latencies) / wall, 1) if wall else 0.0,
+        "items_per_s": round(items / wall, 1) if wall and items else None,
+        "requests_per_op": round(requests / len(latencies), 2),
+        "throttled": throttled,
+        "peak_mem_kb": peak_kb,
+    }
+
+
+def _peak_kb(fn):
+    """fn 한 번을 tracemalloc으로 실행해 최대 할당량(KB). 시간 측정과는 따로 (tracemalloc은 느림)."""
+    tracemalloc.start()
+    try:
+        fn()
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return round(peak / 1024)
+
+
+def measure(server, runs, op, items_per_op=0):
+    """op()를 runs번 순서대로 실행. op는 처리한 항목 수를 돌려줄 수 있음 (검색 건수 등)."""
+    op()  # 워밍업 (연결, 메타데이터 캐시)
+    server.reset()
+    latencies, items = [], 0
+    started = time.perf_counter()
+    for _ in range(runs):
+        t = time.perf_counter()
+        n = op()
+        latencies.append(time.perf_counter() - t)
+        items += n if isinstance(n, int) else items_per_op
+    wall = time.perf_counter() - started
+    st = server.stats()
+    return _summary(latencies, wall, items, st["requests"], st["throttled"], _peak_kb(op))
+
+
+def measure_async(server, runs, concurrency, op):
+    """op()(코루틴)를 concurrency개씩 동시에 runs번. 지연은 호출별, 처리량은 전체 벽시계 기준."""
+
+    async def run():
+        await op()
+        server.reset()
+        latencies = []
+
+        async def timed():
+            t = time.perf_counter()
+            await op()
+            latencies.append(time.perf_counter() - t)
+
+        started = time.perf_counter()
+        for start in range(0, runs, concurrency):
+            await asyncio.gather(*(timed() for _ in range(min(concurrency, runs - start))))
+        return latencies, time.perf_counter() - started
+
+    loop = asyncio.new_event_loop()
+    try:
+        latencies, wall = loop.run_until_complete(run())
+        st = server.stats()
+        peak = _peak_kb(lambda: loop.run_until_complete(op()))
+    finally:
+        import jira_async
+
+        loop.run_until_complete(jira_async.aclose())
+        loop.close()
+    return _summary(latencies, wall, 0, st["requests"], st["throttled"], peak)
+
+
+def _child_run(argv, env, cwd):
+    """자식 프로세스 실행. 반환: (초, 최대 RSS KB)."""
+    t = time.perf_counter()
+    proc = subprocess.Popen(argv, env=env, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    elapsed = time.perf_counter() - t
+    if proc.returncode:
+        raise RuntimeError(f"{' '.join(argv[2:])} 실패 (종료 코드 {proc.returncode})")
+    return elapsed, usage.ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+
+
+def measure_cli(server, runs, env, cwd, make_args):
+    _child_run([sys.executable, str(CLI)] + make_args(), env, cwd)
+    server.reset()
+    latencies, peak = [], 0
+    started = time.perf_counter()
+    for _ in range(runs):
+        elapsed, rss = _child_run([sys.executable, str(CLI)] + make_args(), env, cwd)
+        latencies.append(elapsed)
+        peak = max(peak, rss)
+    wall = time.perf_counter() - started
+    st = server.stats()
+    return _summary(latencies, wall, 0, st["requests"], st["throttled"], peak)
+
+
+# --- 시나리오 ---
+
+
+def scenarios(args, server, keys, env, cwd):
+    """(이름, 실행 함수) 목록. 라이브러리·MCP 모듈은 환경 변수를 설정한 뒤에 import한다."""
+    import jira_cli
+
+    n, search_n = args.runs, args.search_size
+    out = []
+
+    def cli(name, make_args, runs=args.cli_runs):
+        out.append((f"cli.{name}", lambda: measure_cli(server, runs, env, cwd, make_args)))
+
+    cli("list", lambda: ["list", "-n", "50"])
+    cli("search", lambda: ["search", "project = PROJ", "-n", str(search_n)])
+    cli("show", lambda: ["show"] + keys.take())
+    cli("create", lambda: ["create", "PROJ", "벤치마크 생성", "--assign-me"])
+
+    def cli_transition():
+        key = keys.take()[0]
+        return ["transition", key, keys.target(key)]
+
+    cli("transition", cli_transition)
+
+    def lib(name, op, runs=n):
+        out.append((f"lib.{name}", lambda: measure(server, runs, op)))
+
+    lib("list", lambda: len(jira_cli.my_issues(max_results=50)))
+    lib("search", lambda: len(jira_cli.search("project = PROJ", max_results=search_n)))
+    lib("show", lambda: jira_cli.get_issue(keys.take()[0], fields="detail") and 1)
+    lib("show-multi", lambda: len(jira_cli.get_issues(keys.take(args.multi_keys))[0]))
+    lib("create", lambda: jira_cli.create_issue("PROJ", "벤치마크 생성", assign_to_self=True) and 1)
+
+    def lib_transition():
+        key = keys.take()[0]
+        return int(jira_cli.transition_to_status(key, keys.target(key))[0])
+
+    lib("transition", lib_transition)
+
+    def bulk_transition():
+        batch = keys.take(args.bulk_size)
+        target = keys.target(batch[0])
+        for k in batch[1:]:
+            keys.target(k)
+        return sum(r["ok"] for r in jira_cli.transition_bulk(batch, target))
+
+    def bulk_create():
+        rows = "".join(
+            json.dumps({"project": "PROJ", "summary": f"일괄 생성 {i}", "issuetype": "Task"}) + "\n"
+            for i in range(args.bulk_size)
+        )
+        return sum(r["ok"] for r in jira_cli.create_issues_bulk(jira_cli.iter_issue_rows(io.StringIO(rows))))
+
+    out.append(("bulk.transition", lambda: measure(server, args.bulk_runs, bulk_transition)))
+    out.append(("bulk.create", lambda: measure(server, args.bulk_runs, bulk_create)))
+
+    if importlib.util.find_spec("mcp") is not None:
+        def mcp(name, make_op):
+            def run():
+                import mcp_server
+                return measure_async(server, n, args.concurrency, make_op(mcp_server))
+            out.append((f"mcp.{name}", run))
+
+        mcp("list", lambda m: lambda: m.jira_list(max_results=50))
+        mcp("search", lambda m: lambda: m.jira_search("project = PROJ", max_results=search_n))
+        mcp("show", lambda m: lambda: m.jira_show(keys.take()[0]))
+        mcp("show-multi", lambda m: lambda: m.jira_show(",".join(keys.take(args.multi_keys))))
+        mcp("create", lambda m: lambda: m.jira_create("PROJ", "벤치마크 생성", assign_to_self=True))
+
+        def mcp_transition(m):
+            def op():
+                key = keys.take()[0]
+                return m.jira_transition(key, keys.target(key))
+            return op
+
+        mcp("transition", mcp_transition)
+    return out
+
+
+# --- 결과 저장·비교 ---
+
+
+def _version():
+    try:
+        out = subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--tags"], cwd=ROOT, capture_output=True, text=True, timeout=10,
+        )
+        return out.stdout.strip() or "local"
+    except (OSError, subprocess.SubprocessError):
+        return "local"
+
+
+def compare(current, baseline_path, tolerance):
+    """이전 결과와 비교해 표로 출력. 반환: 느려진 시나리오 목록 (p50이 tolerance보다 더 늘거나 처리량이 그만큼 줄어듦)."""
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    print(f"\n비교: {baseline.get('version')} ({baseline.get('date', '')[:10]}) → {current['version']}")
+    print(f"  {'시나리오':18} {'p50 이전':>9} {'p50 지금':>9} {'변화':>7} {'처리량 변화':>10}  요청/작업")
+    regressions = []
+    for name, now in current["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if not old:
+            continue
+        dp50 = now["p50_ms"] / old["p50_ms"] - 1 if old["p50_ms"] else 0.0
+        dops = now["ops_per_s"] / old["ops_per_s"] - 1 if old["ops_per_s"] else 0.0
+        worse = dp50 > tolerance or dops < -tolerance
+        reqs = f"{old['requests_per_op']} → {now['requests_per_op']}"
+        print(
+            f"  {name:18} {old['p50_ms']:8.1f}ms {now['p50_ms']:8.1f}ms {dp50:+7.0%} {dops:+10.0%}  {reqs}"
+            f"{'  ✗' if worse else ''}"
+        )
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="jira-helper 처리량·지연 벤치마크 (가짜 Jira 서버)")
+    parser.add_argument("-n", "--runs", type=int, default=30, help="lib·mcp 시나리오 반복 횟수 (기본 30)")
+    parser.add_argument("--cli-runs", type=int, default=8, help="cli 시나리오 반복 횟수 (기본 8)")
+    parser.add_argument("--bulk-runs", type=int, default=3, help="bulk 시나리오 반복 횟수 (기본 3)")
+    parser.add_argument("--bulk-size", type=int, default=200, help="bulk 한 번에 처리할 건수 (기본 200)")
+    parser.add_argument("--search-size", type=int, default=500, help="search 시나리오가 받을 건수 (기본 500)")
+    parser.add_argument("--multi-keys", type=int, default=50, help="show-multi 한 번에 조회할 키 수 (기본 50)")
+    parser.add_argument("--concurrency", type=int, default=8, help="mcp 동시 호출 수 (기본 8)")
+    parser.add_argument("--only", help="실행할 시나리오 (쉼표 구분, 예: lib,mcp.show)")
+    parser.add_argument("--issues", type=int, default=2000, help="가짜 서버 이슈 수 (기본 2000)")
+    parser.add_argument("--custom-fields", type=int, default=20, help="이슈당 커스텀 필드 수 (기본 20)")
+    parser.add_argument("--description-chars", type=int, default=200, help="설명 길이 (기본 200)")
+    parser.add_argument("--latency", type=float, default=20, help="가짜 서버 응답 지연 ms (기본 20)")
+    parser.add_argument("--jitter", type=float, default=5, help="지연 흔들림 ±ms (기본 5)")
+    parser.add_argument("--rate", type=float, default=0, help="가짜 서버 초당 요청 한도, 넘으면 429 (기본 없음)")
+    parser.add_argument("--error-rate", type=float, default=0, help="무작위 429 확률 (기본 0)")
+    parser.add_argument("--retry-after", type=float, default=1, help="429 Retry-After 초 (기본 1)")
+    parser.add_argument("--client-rate-limits", action="store_true", help="클라이언트 속도 제한(JIRA_RATE_LIMITS 기본값)을 켬")
+    parser.add_argument("--label", help="결과 이름 (기본: git describe)")
+    parser.add_argument("--save", help="결과 파일 (기본: bench/results/<label>.json, '-'면 저장 안 함)")
+    parser.add_argument("--compare", help="비교할 이전 결과 파일")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="느려짐으로 볼 비율 (기본 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    only = [s.strip() for s in (args.only or "").split(",") if s.strip()]
+    server = Server(args)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            env_file = tmp / ".env"
+            env_file.write_text(f"JIRA_BASE_URL={server.url}\nJIRA_EMAIL=bench@example.com\nJIRA_API_TOKEN=x\n")
+            env = dict(os.environ)
+            env.update({
+                "JIRA_ENV": str(env_file),
+                "JIRA_META_FILE": str(tmp / "meta.json"),
+                "JIRA_MIRROR_DB": str(tmp / "mirror.db"),
+                "JIRA_TRANSITION_CACHE_FILE": "",
+                "JIRA_NO_DAEMON": "1",
+                "JIRA_RESPONSE_CACHE_BYTES": "0",
+                "JIRA_METRICS_FILE": "",
+            })
+            if not args.client_rate_limits:
+                env["JIRA_RATE_LIMITS"] = "read=0,search=0,write=0,bulk=0"
+            os.environ.update(env)  # lib·mcp 시나리오용 (jira_cli는 import 때 설정을 읽음)
+            sys.path.insert(0, str(ROOT))
+
+            keys = Keys(args.issues)
+            results = {}
+            print(f"가짜 서버 {server.url} (이슈 {args.issues}, 지연 {args.latency:g}±{args.jitter:g}ms, 한도 {args.rate or '없음'})")
+            print(f"\n  {'시나리오':18} {'p50':>8} {'p99':>8} {'작업/초':>8} {'항목/초':>9} {'요청/작업':>8} {'429':>5} {'메모리':>9}")
+            todo = scenarios(args, server, keys, env, tmp)
+            todo.sort(key=lambda s: SURFACES.index(s[0].split(".")[0]))
+            for name, run in todo:
+                if only and not any(name == o or name.startswith(o + ".") for o in only):
+                    continue
+                try:
+                    r = results[name] = run()
+                except Exception as e:  # 한 시나리오 실패가 나머지 측정을 막지 않도록
+                    print(f"  {name:18} 실패: {type(e).__name__}: {e}")
+                    continue
+                items = f"{r['items_per_s']:9.0f}" if r["items_per_s"] else f"{'-':>9}"
+                print(
+                    f"  {name:18} {r['p50_ms']:6.1f}ms {r['p99_ms']:6.1f}ms {r['ops_per_s']:8.1f} {items}"
+                    f" {r['requests_per_op']:8.2f} {r['throttled']:5} {r['peak_mem_kb']:7}KB"
+                )
+    finally:
+        server.close()
+
+    label = args.label or _version()
+    current = {
+        "version": label,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "config": {k: getattr(args, k) for k in (
+            "runs", "cli_runs", "bulk_runs", "bulk_size", "search_size", "multi_keys", "concurrency", "issues",
+            "custom_fields", "description_chars", "latency", "jitter", "rate", "error_rate", "client_rate_limits",
+        )},
+        "scenarios": results,
+    }
+    if args.save != "-":
+        path = Path(args.save) if args.save else RESULTS / f"{label}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(current, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n결과 저장: {path}")
+    if args.compare:
+        regressions = compare(current, args.compare, args.tolerance)
+        if regressions:
+            print(f"\n느려진 시나리오: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n느려진 시나리오 없음.")
+
+
+if __name__ == "__main__":
+    main()
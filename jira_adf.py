@@ -0,0 +1,553 @@
+"""
+ADF(Atlassian Document Format) ↔ 텍스트/Markdown 변환.
+
+- render / to_text: ADF 문서를 플레인 텍스트 또는 Markdown으로. 재귀 대신 명시적 스택으로 순회하므로
+  아주 깊게 중첩된 문서도 RecursionError 없이 처리하고, 문자 예산(budget)에 닿으면 나머지 노드는 방문하지 않는다.
+- from_markdown: Markdown(자주 쓰는 부분집합)을 ADF 문서로. 줄 단위로 한 번 훑는다.
+
+둘 다 입력 크기에 선형 시간.
+"""
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+
+TRUNCATED = "…"
+
+
+# --- ADF → 텍스트/Markdown ---
+
+# Markdown 모드에서 텍스트 마크를 감싸는 기호 (안쪽부터 적용)
+_MD_MARKS = (("code", "`"), ("em", "*"), ("strong", "**"), ("strike", "~~"))
+
+
+class _Writer:
+    """출력 조각과 줄 머리(목록 기호·인용 표시) 상태. 예산을 넘으면 full이 되고 더 쓰지 않음."""
+
+    def __init__(self, budget, markdown):
+        self.parts = []
+        self.size = 0
+        self.budget = budget
+        self.markdown = markdown
+        self.full = False
+        self.prefix = []  # 중첩 목록·인용의 줄 머리 (줄마다 반복)
+        self.marker = None  # (깊이, 기호): 목록 항목 첫 줄에 한 번만 붙일 기호
+        self.line_start = True
+        self.gap = False  # 다음 블록 앞에 줄바꿈 필요
+        self.tight = 0  # 목록·인용·표 안에서는 블록 사이에 빈 줄을 넣지 않음
+        self.cells = 0  # 표 셀 안에서는 줄바꿈 대신 공백
+        self.lists = []  # [순서 목록 여부, 다음 번호]
+        self.rows = []  # 표별 출력한 행 수
+
+    def _emit(self, s):
+        if self.budget is not None and self.size + len(s) > self.budget:
+            s = s[: max(self.budget - self.size, 0)]
+            self.full = True
+        self.parts.append(s)
+        self.size += len(s)
+
+    def _lead(self):
+        if not self.line_start:
+            return
+        self.line_start = False
+        if self.marker is not None:
+            depth, mark = self.marker
+            self.marker = None
+            lead = "".join(self.prefix[:depth]) + mark + "".join(self.prefix[depth + 1:])
+        else:
+            lead = "".join(self.prefix)
+        if lead:
+            self._emit(lead)
+
+    def write(self, text):
+        for n, line in enumerate(text.split("\n")):
+            if self.full:
+                return
+            if n:
+                self.newline()
+            if line:
+                self._lead()
+                self._emit(line)
+
+    def newline(self):
+        if self.cells:
+            if not self.line_start:
+                self._emit(" ")
+            return
+        self._emit("\n")
+        self.line_start = True
+
+    def begin_block(self):
+        if self.gap and self.parts:
+            self.newline()
+            if self.markdown and not self.tight and not self.cells:
+                self.newline()
+        self.gap = False
+
+    def end_block(self):
+        self.gap = True
+
+    def item(self, mark):
+        self.begin_block()
+        self.marker = (len(self.prefix), mark)
+        self.prefix.append(" " * len(mark))
+
+
+def _attrs(node):
+    return node.get("attrs") or {}
+
+
+def _marked_text(node, markdown):
+    text = node.get("text") or ""
+    marks = {m.get("type"): _attrs(m) for m in node.get("marks") or () if isinstance(m, dict)}
+    href = marks.get("link", {}).get("href")
+    if markdown:
+        for mark, sym in _MD_MARKS:
+            if mark in marks and text.strip():
+                text = f"{sym}{text}{sym}"
+    if href and href != text:
+        return f"[{text}]({href})" if markdown else f"{text} ({href})"
+    return text
+
+
+def _date_text(node):
+    ts = _attrs(node).get("timestamp")
+    try:
+        return datetime.fromtimestamp(int(ts) / 1000, timezone.utc).strftime("%Y-%m-%d")
+    except (TypeError, ValueError, OverflowError, OSError):
+        return str(ts or "")
+
+
+def _open(w, node):
+    """노드에 들어갈 때 출력. 반환: 자식(content)을 순회할지 여부."""
+    t = node.get("type")
+    attrs = _attrs(node)
+    if t == "text":
+        w.write(_marked_text(node, w.markdown))
+    elif t == "hardBreak":
+        w.newline()
+    elif t in ("mention", "emoji", "placeholder"):
+        w.write(attrs.get("text") or attrs.get("shortName") or "")
+    elif t == "status":
+        w.write(f"[{attrs.get('text', '')}]")
+    elif t == "date":
+        w.write(_date_text(node))
+    elif t == "inlineCard":
+        w.write(attrs.get("url") or "")
+    elif t in ("paragraph", "mediaSingle", "mediaGroup", "bodiedExtension"):
+        w.begin_block()
+        return True
+    elif t == "heading":
+        w.begin_block()
+        if w.markdown:
+            w.write("#" * min(max(int(attrs.get("level") or 1), 1), 6) + " ")
+        return True
+    elif t in ("bulletList", "orderedList", "taskList", "decisionList"):
+        w.begin_block()
+        w.lists.append([t == "orderedList", int(attrs.get("order") or 1)])
+        w.tight += 1
+        return True
+    elif t == "listItem":
+        kind = w.lists[-1] if w.lists else [False, 1]
+        if kind[0]:
+            w.item(f"{kind[1]}. ")
+            kind[1] += 1
+        else:
+            w.item("- ")
+        return True
+    elif t == "taskItem":
+        w.item("[x] " if attrs.get("state") == "DONE" else "[ ] ")
+        return True
+    elif t == "decisionItem":
+        w.item("- ")
+        return True
+    elif t == "codeBlock":
+        w.begin_block()
+        if w.markdown:
+            w.write("```" + (attrs.get("language") or ""))
+            w.newline()
+        for child in node.get("content") or ():
+            if isinstance(child, dict):
+                w.write(child.get("text") or "")
+        if w.markdown:
+            w.newline()
+            w.write("```")
+        w.end_block()
+    elif t in ("blockquote", "panel"):
+        w.begin_block()
+        w.prefix.append("> ")
+        w.tight += 1
+        return True
+    elif t == "rule":
+        w.begin_block()
+        w.write("---")
+        w.end_block()
+    elif t in ("expand", "nestedExpand"):
+        w.begin_block()
+        if attrs.get("title"):
+            w.write(attrs["title"])
+            w.end_block()
+        return True
+    elif t == "table":
+        w.begin_block()
+        w.rows.append(0)
+        w.tight += 1
+        return True
+    elif t == "tableRow":
+        w.begin_block()
+        w.write("|")
+        return True
+    elif t in ("tableHeader", "tableCell"):
+        w.cells += 1
+        w.gap = False
+        w.write(" ")
+        return True
+    elif t == "media":
+        w.write(f"[첨부: {attrs.get('alt') or attrs.get('id') or '파일'}]")
+    elif t in ("blockCard", "embedCard"):
+        w.begin_block()
+        w.write(attrs.get("url") or "")
+        w.end_block()
+    elif t in ("extension", "inlineExtension"):
+        pass
+    else:
+        return True  # doc, 알 수 없는 컨테이너: 자식만 출력
+    return False
+
+
+def _close(w, node):
+    """자식 순회를 마친 노드를 닫음."""
+    t = node.get("type")
+    if t in ("paragraph", "heading", "mediaSingle", "mediaGroup", "bodiedExtension", "expand", "nestedExpand"):
+        w.end_block()
+    elif t in ("bulletList", "orderedList", "taskList", "decisionList"):
+        w.lists.pop()
+        w.tight -= 1
+        w.end_block()
+    elif t in ("listItem", "taskItem", "decisionItem"):
+        w.prefix.pop()
+        w.end_block()
+    elif t in ("blockquote", "panel"):
+        w.prefix.pop()
+        w.tight -= 1
+        w.end_block()
+    elif t == "table":
+        w.rows.pop()
+        w.tight -= 1
+        w.end_block()
+    elif t == "tableRow":
+        if w.markdown and w.rows and w.rows[-1] == 0:
+            w.newline()
+            w.write("|" + " --- |" * len(node.get("content") or ()))
+        if w.rows:
+            w.rows[-1] += 1
+        w.end_block()
+    elif t in ("tableHeader", "tableCell"):
+        w.write(" |")
+        w.cells -= 1
+
+
+def render(doc, budget=None, markdown=False):
+    """ADF 문서(또는 문자열)를 텍스트로. 반환: (텍스트, 잘렸는지).
+    budget: 최대 문자 수 (None이면 제한 없음). 닿으면 그 뒤 노드는 방문하지 않는다.
+    markdown: True면 제목·목록·코드 블록·표·강조·링크를 Markdown 문법으로.
+    """
+    if isinstance(doc, str):
+        if budget is not None and len(doc) > budget:
+            return doc[:budget].rstrip(), True
+        return doc, False
+    if not isinstance(doc, dict):
+        return "", False
+    w = _Writer(budget, markdown)
+    stack = [(doc, iter(doc.get("content") or ()))]
+    while stack and not w.full:
+        node, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            _close(w, node)
+        elif isinstance(child, dict) and _open(w, child):
+            stack.append((child, iter(child.get("content") or ())))
+    return "".join(w.parts).strip("\n").rstrip(), w.full
+
+
+def to_text(doc, budget=None, markdown=False):
+    """render의 텍스트만 반환. 잘렸으면 끝에 TRUNCATED(…)를 붙임."""
+    text, truncated = render(doc, budget, markdown)
+    return text + TRUNCATED if truncated else text
+
+
+# --- Markdown → ADF ---
+
+_LIST_RE = re.compile(r"( *)([-*+]|\d{1,9}[.)])[ \t]+(.*)$")
+_URL_RE = re.compile(r"https?://[^\s<>()\[\]]+")
+_SPECIAL_RE = re.compile(r"[\\`\[*~]|https?://")  # 인라인 문법이 시작될 수 있는 위치 (그 사이는 한 번에 복사)
+_TABLE_SEP_RE = re.compile(r"\s*:?-+:?\s*")
+_DELIM_MARKS = {"**": "strong", "~~": "strike", "*": "em"}
+_ESCAPABLE = frozenset("\\`*_~[]()#>|-+.!")
+# 목록 항목 안에 둘 수 있는 블록 (ADF listItem 스키마). 나머지는 목록을 닫고 최상위에 둔다.
+_ITEM_BLOCKS = frozenset({"paragraph", "codeBlock"})
+
+
+class _Closers:
+    """닫는 구분자 위치 조회. 한 번 찾은 위치·실패를 기억해 같은 구간을 다시 훑지 않음 (줄 길이에 선형)."""
+
+    def __init__(self, text):
+        self.text = text
+        self.found = {}
+
+    def find(self, delim, start):
+        pos = self.found.get(delim)
+        if pos is None or (pos != -1 and pos < start):
+            pos = self.found[delim] = self.text.find(delim, start)
+        return pos
+
+
+def _text_node(text, marks, href=None):
+    node = {"type": "text", "text": text}
+    marks = [{"type": m} for m in marks]
+    if href:
+        marks.append({"type": "link", "attrs": {"href": href}})
+    if marks:
+        node["marks"] = marks
+    return node
+
+
+def _inline(text):
+    """한 줄의 인라인 Markdown(**굵게**, *기울임*, ~~취소선~~, `코드`, [링크](url), URL)을 ADF 텍스트 노드로."""
+    nodes = []
+    active = []  # 열린 마크 (열린 순서)
+    buf = []
+    closers = _Closers(text)
+
+    def flush():
+        if buf:
+            nodes.append(_text_node("".join(buf), active))
+            buf.clear()
+
+    i, n = 0, len(text)
+    while i < n:
+        m = _SPECIAL_RE.search(text, i)
+        if m is None:
+            buf.append(text[i:])
+            break
+        if m.start() > i:
+            buf.append(text[i:m.start()])
+            i = m.start()
+        c = text[i]
+        if c == "\\" and i + 1 < n and text[i + 1] in _ESCAPABLE:
+            buf.append(text[i + 1])
+            i += 2
+            continue
+        if c == "`":
+            end = closers.find("`", i + 1)
+            if end > i + 1:
+                flush()
+                nodes.append(_text_node(text[i + 1:end], ["code"]))
+                i = end + 1
+                continue
+        elif c == "[":
+            mid = closers.find("](", i + 1)
+            end = closers.find(")", mid + 2) if mid > i + 1 else -1
+            if end != -1:
+                flush()
+                nodes.append(_text_node(text[i + 1:mid], active, href=text[mid + 2:end].strip()))
+                i = end + 1
+                continue
+        elif c == "h":
+            m = _URL_RE.match(text, i)
+            url = m.group(0).rstrip(".,;:!?") if m else ""
+            if "://" in url[:-1]:
+                flush()
+                nodes.append(_text_node(url, active, href=url))
+                i += len(url)
+                continue
+        elif c in "*~":
+            delim = text[i:i + 2] if text.startswith(("**", "~~"), i) else c
+            mark = _DELIM_MARKS.get(delim)
+            if mark in active:
+                flush()
+                active.remove(mark)
+                i += len(delim)
+                continue
+            after = i + len(delim)
+            if mark and after < n and not text[after].isspace() and closers.find(delim, after + 1) != -1:
+                flush()
+                active.append(mark)
+                i = after
+                continue
+        buf.append(c)
+        i += 1
+    flush()
+    return nodes
+
+
+def _paragraph(line):
+    return {"type": "paragraph", "content": _inline(line)}
+
+
+def _add_line(para, line):
+    """문단에 줄을 이어 붙임 (줄바꿈은 hardBreak로 유지)."""
+    if para["content"]:
+        para["content"].append({"type": "hardBreak"})
+    para["content"].extend(_inline(line))
+
+
+def _table_cells(line):
+    cells = line.strip()
+    if cells.startswith("|"):
+        cells = cells[1:]
+    if cells.endswith("|"):
+        cells = cells[:-1]
+    return [c.strip() for c in cells.split("|")]
+
+
+def _table(header, rows):
+    def row(cells, kind):
+        return {
+            "type": "tableRow",
+            "content": [{"type": kind, "attrs": {}, "content": [_paragraph(c)]} for c in cells],
+        }
+
+    width = len(header)
+    return {
+        "type": "table",
+        "attrs": {"isNumberColumnEnabled": False, "layout": "default"},
+        "content": [row(header, "tableHeader")] + [row((r + [""] * width)[:width], "tableCell") for r in rows],
+    }
+
+
+def _is_rule(body):
+    s = body.replace(" ", "")
+    return len(s) >= 3 and len(set(s)) == 1 and s[0] in "-*_"
+
+
+class _Blocks:
+    """블록 조립 상태: 최상위 블록, 열린 목록 스택, 이어 쓰는 문단·인용."""
+
+    def __init__(self):
+        self.blocks = []
+        self.lists = []  # (들여쓰기, 순서 목록 여부, 목록 노드)
+        self.para = None
+        self.quote = None
+
+    def container(self, indent):
+        """들여쓰기에 맞는 블록 부모. 마지막 목록 항목보다 들여 썼으면 그 항목, 아니면 목록을 닫고 최상위."""
+        while self.lists and indent <= self.lists[-1][0]:
+            self.lists.pop()
+        if self.lists:
+            return self.lists[-1][2]["content"][-1]["content"]
+        return self.blocks
+
+    def add(self, node, indent):
+        self.para = self.quote = None
+        self.container(indent if node["type"] in _ITEM_BLOCKS else -1).append(node)
+        return node
+
+    def list_item(self, indent, ordered, start, text):
+        self.quote = None
+        while self.lists and self.lists[-1][0] > indent:
+            self.lists.pop()
+        if self.lists and self.lists[-1][0] == indent and self.lists[-1][1] != ordered:
+            self.lists.pop()
+        if self.lists and self.lists[-1][0] == indent:
+            lst = self.lists[-1][2]
+        else:
+            lst = {"type": "orderedList" if ordered else "bulletList", "content": []}
+            if ordered and start != 1:
+                lst["attrs"] = {"order": start}
+            parent = self.lists[-1][2]["content"][-1]["content"] if self.lists else self.blocks
+            parent.append(lst)
+            self.lists.append((indent, ordered, lst))
+        self.para = _paragraph(text)
+        lst["content"].append({"type": "listItem", "content": [self.para]})
+
+
+def from_markdown(text):
+    """Markdown 텍스트를 ADF 문서로. 빈 텍스트면 None.
+    지원: 문단(줄바꿈 유지), # 제목, -/*/+ 및 1. 목록(들여쓰기로 중첩), ``` 코드 블록, > 인용, --- 구분선,
+    | 표 |, **굵게**, *기울임*, ~~취소선~~, `코드`, [링크](url), URL 자동 링크.
+    """
+    if not (text or "").strip():
+        return None
+    lines = text.replace("\r\n", "\n").replace("\t", "    ").split("\n")
+    b = _Blocks()
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        body = line.lstrip(" ")
+        indent = len(line) - len(body)
+        body = body.rstrip()
+        i += 1
+        if not body:
+            b.para = b.quote = None
+            continue
+        if body.startswith(("```", "~~~")):
+            fence, lang = body[:3], body[3:].strip()
+            code = []
+            while i < n and not lines[i].lstrip().startswith(fence):
+                code.append(lines[i][min(indent, len(lines[i]) - len(lines[i].lstrip(" "))):])
+                i += 1
+            i += 1  # 닫는 펜스
+            node = {"type": "codeBlock"}
+            if lang:
+                node["attrs"] = {"language": lang}
+            if code:
+                node["content"] = [{"type": "text", "text": "\n".join(code)}]
+            b.add(node, indent)
+            continue
+        if _is_rule(body):
+            b.add({"type": "rule"}, indent)
+            continue
+        m = _LIST_RE.match(line.rstrip())
+        if m:
+            marker = m.group(2)
+            ordered = marker[0].isdigit()
+            b.list_item(indent, ordered, int(marker[:-1]) if ordered else 1, m.group(3))
+            continue
+        if body.startswith("#"):
+            level = len(body) - len(body.lstrip("#"))
+            rest = body[level:]
+            if level <= 6 and (not rest or rest[0] == " "):
+                title = rest.strip().rstrip("#").rstrip()
+                b.add({"type": "heading", "attrs": {"level": level}, "content": _inline(title)}, indent)
+                continue
+        if body.startswith(">"):
+            quoted = body[1:][1:] if body[1:2] == " " else body[1:]
+            if b.quote is None:
+                b.quote = b.add({"type": "blockquote", "content": []}, indent)
+                b.para = None
+            if not quoted.strip():
+                b.para = None
+            elif b.para is None:
+                b.para = _paragraph(quoted.strip())
+                b.quote["content"].append(b.para)
+            else:
+                _add_line(b.para, quoted.strip())
+            continue
+        if body.startswith("|") and i < n and lines[i].strip().startswith("|") and all(
+            _TABLE_SEP_RE.fullmatch(c) for c in _table_cells(lines[i])
+        ):
+            header = _table_cells(body)
+            rows = []
+            i += 1
+            while i < n and lines[i].strip().startswith("|"):
+                rows.append(_table_cells(lines[i]))
+                i += 1
+            b.add(_table(header, rows), indent)
+            continue
+        if b.para is not None and b.quote is None:
+            _add_line(b.para, body)
+        else:
+            b.para = b.add(_paragraph(body), indent)
+    return {"type": "doc", "version": 1, "content": b.blocks} if b.blocks else None
+
+
+def from_plain_text(text):
+    """플레인 텍스트를 줄마다 문단 하나인 ADF 문서로 (Markdown 해석 없음). 빈 텍스트면 None."""
+    blocks = [
+        {"type": "paragraph", "content": [{"type": "text", "text": line.strip()}]}
+        for line in (text or "").strip().split("\n")
+        if line.strip()
+    ]
+    return {"type": "doc", "version": 1, "content": blocks} if blocks else None
@@ -0,0 +1,272 @@
+"""
+흐름 분석 (jira analytics): 리드 타임, 사이클 타임, 상태별 체류 시간.
+
+검색으로는 이슈 id·생성일·해결일·현재 상태만 받고, 상태 이력은 /changelog/bulkfetch로 최대 1000건씩 묶어 받는다
+(이슈마다 /issue/{key}?expand=changelog를 요청하지 않음). 묶음 요청은 검색 페이지를 받는 동안 스레드 풀에서 함께 보낸다.
+집계는 이슈별 행을 모으지 않고 지표(리드 타임, 사이클 타임, 상태)마다 기간(초)만 array('d') 열에 쌓은 뒤,
+끝에 열마다 한 번 정렬해 백분위를 구한다. 2만 건이어도 메모리는 전환 수 × 8바이트 수준.
+"""
+from __future__ import annotations
+
+import contextvars
+import csv
+import io
+import os
+from array import array
+from collections import deque
+from datetime import datetime
+
+import jira_cli
+
+# /changelog/bulkfetch 한 번에 보낼 이슈 수 (Jira 상한 1000)
+CHANGELOG_BATCH = min(int(os.getenv("JIRA_CHANGELOG_BATCH", "1000")), 1000)
+# 동시에 진행할 bulkfetch 묶음 수
+ANALYTICS_WORKERS = int(os.getenv("JIRA_ANALYTICS_WORKERS", "4"))
+# 검색 페이지 크기: 필드가 적으면 Jira가 페이지당 더 많이 돌려준다 (상한 5000)
+ANALYTICS_PAGE_SIZE = 1000
+ANALYTICS_FIELDS = ["created", "resolutiondate", "status"]
+PERCENTILES = (50, 85, 95)
+DAY = 86400.0
+
+
+class AnalyticsError(ValueError):
+    """분석을 시작할 수 없음 (changelog bulkfetch 미지원 등)."""
+
+
+def parse_time(value):
+    """Jira 시각 문자열 → epoch 초. 없거나 형식이 다르면 None."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def percentile(sorted_values, p):
+    """정렬된 열의 p백분위 (선형 보간). 비어 있으면 None."""
+    n = len(sorted_values)
+    if not n:
+        return None
+    pos = (n - 1) * p / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, n - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+# --- 상태 이력 ---
+
+
+def _fetch_changelogs(issue_ids):
+    """issue_ids의 상태 변경 이력. 반환: {이슈 id: [(시각, 이전 상태, 다음 상태), ...] (시간순)}"""
+    out = {i: [] for i in issue_ids}
+    body = {"issueIdsOrKeys": list(issue_ids), "fieldIds": ["status"], "maxResults": 10000}
+    while True:
+        data = jira_cli.api_post("/changelog/bulkfetch", json_data=body, idempotent=True)
+        for log in data.get("issueChangeLogs") or []:
+            changes = out.setdefault(str(log.get("issueId")), [])
+            for history in log.get("changeHistories") or []:
+                at = parse_time(history.get("created"))
+                if at is None:
+                    continue
+                for item in history.get("items") or []:
+                    if (item.get("fieldId") or item.get("field")) == "status":
+                        changes.append((at, item.get("fromString"), item.get("toString")))
+        token = data.get("nextPageToken")
+        if not token:
+            break
+        body["nextPageToken"] = token
+    for changes in out.values():
+        changes.sort(key=lambda c: c[0])
+    return out
+
+
+def status_categories():
+    """상태 이름 → 분류(new, indeterminate, done). 메타데이터 저장소 사용 (있으면 요청 없음)."""
+    return {s["name"]: s.get("category") for s in jira_cli.get_metadata("statuses") if s.get("name")}
+
+
+# --- 집계 ---
+
+
+class FlowStats:
+    """지표별 기간(초) 열. add_issue()로 이슈 하나씩 반영하고 summary()로 백분위를 계산한다.
+    categories: 상태 이름 → 분류. start_statuses/done_statuses를 주면 분류 대신 그 상태들로 착수·완료를 판단.
+    """
+
+    def __init__(self, categories=None, start_statuses=None, done_statuses=None):
+        self.categories = dict(categories or {})
+        self.start_statuses = set(start_statuses or ())
+        self.done_statuses = set(done_statuses or ())
+        self.lead = array("d")
+        self.cycle = array("d")
+        self.in_status = {}  # 상태 이름 → array('d')
+        self.wip = {}  # 상태 이름 → 현재 그 상태인 이슈 수
+        self.issues = 0
+        self.done = 0
+
+    def _is_start(self, status):
+        if self.start_statuses:
+            return status in self.start_statuses
+        return self.categories.get(status) == "indeterminate"
+
+    def _is_done(self, status):
+        if self.done_statuses:
+            return status in self.done_statuses
+        return self.categories.get(status) == "done"
+
+    def add_issue(self, issue, changes):
+        """issue: 검색 결과 이슈 (ANALYTICS_FIELDS), changes: [(시각, 이전 상태, 다음 상태)] 시간순."""
+        f = issue.get("fields") or {}
+        created = parse_time(f.get("created"))
+        status = (f.get("status") or {}).get("name")
+        category = ((f.get("status") or {}).get("statusCategory") or {}).get("key")
+        if status and category:
+            self.categories.setdefault(status, category)
+        self.issues += 1
+        self.wip[status] = self.wip.get(status, 0) + 1
+        if created is None:
+            return
+        # 상태별 체류 시간: 상태를 떠난 구간만 (현재 상태에 머무는 시간은 아직 끝나지 않았으므로 제외)
+        current = changes[0][1] if changes else status
+        entered = created
+        started = done_at = None
+        for at, _, to in changes:
+            self.in_status.setdefault(current, array("d")).append(max(0.0, at - entered))
+            current, entered = to, at
+            if started is None and self._is_start(to):
+                started = at
+            if not self._is_done(to):
+                done_at = None  # 다시 열리면 완료 시각을 새로 잡음
+            elif done_at is None:
+                done_at = at
+        if not self._is_done(status):
+            return
+        resolved = parse_time(f.get("resolutiondate"))
+        finished = resolved if resolved is not None and not self.done_statuses else (done_at or resolved)
+        if finished is None:
+            return
+        self.done += 1
+        self.lead.append(max(0.0, finished - created))
+        if started is not None and started <= finished:
+            self.cycle.append(finished - started)
+
+    def summary(self, percentiles=PERCENTILES):
+        """행 목록: {"metric", "count", "wip", "p<N>"..., "mean", "total"} (기간은 초). 리드·사이클 타임, 그 다음 상태별."""
+        rows = []
+
+        def row(metric, values, wip=None):
+            ordered = sorted(values)
+            out = {"metric": metric, "count": len(ordered), "wip": wip}
+            for p in percentiles:
+                out[f"p{p}"] = percentile(ordered, p)
+            out["mean"] = sum(ordered) / len(ordered) if ordered else None
+            out["total"] = sum(ordered)
+            rows.append(out)
+
+        row("lead", self.lead)
+        row("cycle", self.cycle)
+        for status in sorted(set(self.in_status) | set(self.wip), key=lambda s: (self._order(s), s or "")):
+            if status:
+                row(f"status:{status}", self.in_status.get(status, ()), self.wip.get(status, 0))
+        return rows
+
+    def _order(self, status):
+        return {"new": 0, "indeterminate": 1, "done": 2}.get(self.categories.get(status), 1)
+
+
+def analyze(jql, limit=None, page_size=None, start_statuses=None, done_statuses=None, workers=None, on_progress=None):
+    """JQL 결과의 흐름 지표를 계산. 반환: FlowStats
+    start_statuses/done_statuses: 착수·완료로 볼 상태 이름 목록 (기본: 상태 분류 indeterminate/done)
+    on_progress(searched, analyzed): 묶음을 반영할 때마다 호출
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    stats = FlowStats(status_categories(), start_statuses, done_statuses)
+    workers = max(1, workers or ANALYTICS_WORKERS)
+    pending = deque()  # (이슈 묶음, future) — 제출 순서대로 반영
+    batch = []
+    searched = 0
+
+    def drain(keep):
+        while len(pending) > keep:
+            issues, future = pending.popleft()
+            changelogs = future.result()
+            for issue in issues:
+                stats.add_issue(issue, changelogs.get(str(issue.get("id")), []))
+            if on_progress:
+                on_progress(searched, stats.issues)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def submit(issues):
+            # --profile 단계 트리에서 이 분석 아래에 보이도록 현재 컨텍스트에서 실행
+            ids = [str(i.get("id")) for i in issues]
+            pending.append((issues, executor.submit(contextvars.copy_context().run, _fetch_changelogs, ids)))
+            drain(workers * 2)  # 받아 둔 묶음이 쌓이지 않도록 (메모리: 최대 workers × 2 묶음)
+
+        try:
+            pages = jira_cli.iter_search_pages(
+                jql, fields=ANALYTICS_FIELDS, page_size=page_size or ANALYTICS_PAGE_SIZE, limit=limit,
+            )
+            for issues, _ in pages:
+                searched += len(issues)
+                batch.extend(issues)
+                while len(batch) >= CHANGELOG_BATCH:
+                    submit(batch[:CHANGELOG_BATCH])
+                    batch = batch[CHANGELOG_BATCH:]
+            if batch:
+                submit(batch)
+            drain(0)
+        except jira_cli.requests.HTTPError as e:
+            for _, future in pending:
+                future.cancel()
+            if e.response is not None and e.response.status_code == 404 and "bulkfetch" in (e.request.url or ""):
+                raise AnalyticsError("이 Jira는 /changelog/bulkfetch를 지원하지 않습니다 (Jira Cloud 전용).") from e
+            raise
+    return stats
+
+
+# --- 출력 ---
+
+
+def _days(seconds):
+    return "-" if seconds is None else f"{seconds / DAY:.1f}"
+
+
+def _label(metric):
+    if metric == "lead":
+        return "리드 타임"
+    if metric == "cycle":
+        return "사이클 타임"
+    return "  " + metric.split(":", 1)[1]
+
+
+def format_summary(rows, percentiles=PERCENTILES):
+    """요약 표 (기간은 일 단위)."""
+    cols = [f"p{p}" for p in percentiles]
+    header = f"{'지표':<24} {'건수':>7} {'현재':>7} " + " ".join(f"{c:>8}" for c in cols) + f" {'평균':>8}"
+    lines = [header, "-" * len(header)]
+    for i, r in enumerate(rows):
+        if i == 2:
+            lines.append("상태별 체류 시간")
+        wip = "" if r["wip"] is None else f"{r['wip']:,}"
+        lines.append(
+            f"{_label(r['metric']):<24} {r['count']:>7,} {wip:>7} "
+            + " ".join(f"{_days(r[c]):>8}" for c in cols) + f" {_days(r['mean']):>8}"
+        )
+    lines.append("(단위: 일. 상태별 체류 시간은 그 상태를 떠난 구간만, 현재는 지금 그 상태인 이슈 수)")
+    return "\n".join(lines)
+
+
+def summary_csv(rows, percentiles=PERCENTILES):
+    """요약을 CSV 문자열로 (기간은 일 단위, 소수 셋째 자리)."""
+    cols = [f"p{p}" for p in percentiles] + ["mean", "total"]
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(["metric", "count", "wip"] + [f"{c}_days" for c in cols])
+    for r in rows:
+        w.writerow(
+            [r["metric"], r["count"], "" if r["wip"] is None else r["wip"]]
+            + ["" if r[c] is None else round(r[c] / DAY, 3) for c in cols]
+        )
+    return buf.getvalue()
+
@@ -0,0 +1,457 @@
+"""
+jira_cli의 비동기 버전 - httpx.AsyncClient 기반.
+MCP 서버처럼 이벤트 루프 위에서 여러 도구 호출이 동시에 들어올 때, 블로킹 없이 병렬로 처리하기 위해 사용.
+설정·요청 본문 구성·포맷은 jira_cli의 것을 그대로 재사용한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+import jira_cli
+
+# 호스트당 동시에 진행할 수 있는 최대 요청 수 (기본: JIRA_POOL_SIZE)
+MAX_CONCURRENCY = int(os.getenv("JIRA_MAX_CONCURRENCY", str(jira_cli.HTTP_POOL_SIZE)))
+
+_RETRY_EXCEPTIONS = (httpx.TransportError,)
+# 요청이 서버에 전달되기 전에 실패한 경우 (메서드와 무관하게 재시도 가능)
+_NOT_SENT_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+class _LoopState:
+    """(이벤트 루프, 사이트)별 AsyncClient와 호스트별 세마포어 (httpx 클라이언트·세마포어는 루프에 묶임).
+    사이트마다 인증이 다르므로 클라이언트(연결 풀)도 사이트별로 따로 둔다.
+    """
+
+    def __init__(self, site):
+        self.client = httpx.AsyncClient(
+            auth=site.auth(),
+            headers={"Accept": "application/json"},
+            timeout=jira_cli.HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=jira_cli.HTTP_POOL_SIZE,
+                max_keepalive_connections=jira_cli.HTTP_POOL_SIZE,
+            ),
+        )
+        self.semaphores = {}
+
+    def semaphore(self, url):
+        host = urlsplit(url).netloc
+        sem = self.semaphores.get(host)
+        if sem is None:
+            sem = self.semaphores[host] = asyncio.Semaphore(MAX_CONCURRENCY)
+        return sem
+
+
+_states = {}
+
+
+def _state(site):
+    key = (asyncio.get_running_loop(), site.name)
+    st = _states.get(key)
+    if st is None:
+        st = _states[key] = _LoopState(site)
+    return st
+
+
+async def aclose():
+    """현재 루프의 AsyncClient들을 닫음 (서버 종료 시)."""
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _states if k[0] is loop]:
+        await _states.pop(key).client.aclose()
+
+
+async def _throttle(method, path):
+    """jira_cli._throttle의 비동기 버전. 속도 제한 상태는 동기 요청과 공유."""
+    while True:
+        delay, reserved = jira_cli._limiter.reserve(method, path)
+        if delay > 0:
+            jira_cli._count("throttle_wait", delay)
+            await asyncio.sleep(delay)
+        if reserved:
+            return
+
+
+async def _request(method, path, params=None, json_data=None, idempotent=None):
+    """jira_cli._request의 비동기 버전. 재시도 규칙·속도 제한·통계 카운터는 동기 버전과 공유."""
+    site = jira_cli.current_site()
+    url = f"{site.base_url}/rest/api/3{path}"
+    if idempotent is None:
+        idempotent = method in jira_cli._IDEMPOTENT_METHODS
+    st = _state(site)
+    attempt = throttled = 0
+    started = time.perf_counter()
+    while True:
+        await _throttle(method, path)
+        jira_cli._count("async_requests")
+        try:
+            async with st.semaphore(url):
+                r = await st.client.request(method, url, params=params, json=json_data)
+        except _RETRY_EXCEPTIONS as e:
+            retryable = idempotent or isinstance(e, _NOT_SENT_EXCEPTIONS)
+            if not retryable or attempt >= jira_cli.HTTP_MAX_RETRIES:
+                jira_cli._observe_request(method, path, "error", time.perf_counter() - started, 0, 0, attempt + throttled)
+                raise
+            delay = jira_cli._backoff(attempt)
+        else:
+            wait = jira_cli._limiter.observe(method, path, r.status_code, r.headers)
+            if wait is not None and throttled < jira_cli.RATE_MAX_RETRIES:
+                throttled += 1
+                jira_cli._count("throttled")
+                continue
+            if not (idempotent and r.status_code in jira_cli._RETRY_STATUS and attempt < jira_cli.HTTP_MAX_RETRIES):
+                jira_cli._record_payload(method, path, r.status_code, len(r.content))
+                jira_cli._observe_request(
+                    method, path, r.status_code, time.perf_counter() - started,
+                    len(r.content), len(r.request.content), attempt + throttled,
+                )
+                r.raise_for_status()
+                jira_cli._responses.written(method, path)
+                return r
+            delay = jira_cli._parse_http_time(r.headers.get("Retry-After")) or jira_cli._backoff(attempt)
+        jira_cli._count("retries")
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _json_or_empty(r):
+    if r.status_code == 204 or not r.text.strip():
+        return {}
+    return r.json()
+
+
+async def _cached_json(method, path, params=None, json_data=None, idempotent=None):
+    """응답 캐시(jira_cli._responses)를 거치는 조회. 캐시 대상이 아니면 그대로 요청."""
+    cache = jira_cli._responses
+    kind = cache.kind(method, path)
+    if kind is None:
+        return _json_or_empty(await _request(method, path, params=params, json_data=json_data, idempotent=idempotent))
+    key = cache.key(method, path, params, json_data)
+    body = cache.get(key)
+    if body is not None:
+        return json.loads(body)
+    generation = cache.generation()
+    r = await _request(method, path, params=params, json_data=json_data, idempotent=idempotent)
+    data = _json_or_empty(r)
+    cache.put(key, kind, r.content, data, generation)
+    return data
+
+
+async def api_get(path, params=None, cached=False):
+    """cached=True: 응답 캐시 사용 (이슈 상세 등 잠깐 낡아도 되는 조회만)."""
+    if cached:
+        return await _cached_json("GET", path, params=params)
+    return (await _request("GET", path, params=params)).json()
+
+
+async def api_post(path, json_data=None, idempotent=False, cached=False):
+    if cached:
+        return await _cached_json("POST", path, json_data=json_data, idempotent=idempotent)
+    return _json_or_empty(await _request("POST", path, json_data=json_data, idempotent=idempotent))
+
+
+async def api_put(path, json_data=None):
+    return _json_or_empty(await _request("PUT", path, json_data=json_data))
+
+
+async def _search_page(jql, fields, max_results, next_page_token=None, expand=None):
+    body = {"jql": jql, "maxResults": max_results, "fields": fields}
+    if next_page_token:
+        body["nextPageToken"] = next_page_token
+    if expand:
+        body["expand"] = expand
+    # 대화형 크기의 페이지만 응답 캐시에 둔다 (group_counts 등의 1000건 페이지는 캐시하지 않음)
+    cached = max_results <= jira_cli.RESPONSE_CACHE_MAX_RESULTS
+    return await api_post("/search/jql", json_data=body, idempotent=True, cached=cached)
+
+
+async def iter_search(jql, fields=None, page_size=None, limit=None, prefetch=True, expand=None):
+    """jira_cli.iter_search의 비동기 제너레이터 버전. 다음 페이지는 태스크로 미리 요청."""
+    fields = jira_cli.resolve_fields(fields, jira_cli.LIST_FIELDS)
+    page_size = page_size or jira_cli.SEARCH_PAGE_SIZE
+    remaining = limit
+    if remaining is not None and remaining <= 0:
+        return
+
+    def page_len():
+        return page_size if remaining is None else min(page_size, remaining)
+
+    pending = None
+    try:
+        data = await _search_page(jql, fields, page_len(), expand=expand)
+        while True:
+            issues = data.get("issues", [])
+            token = data.get("nextPageToken")
+            if remaining is not None:
+                issues = issues[:remaining]
+                remaining -= len(issues)
+            more = bool(token) and not data.get("isLast") and bool(issues) and (remaining is None or remaining > 0)
+            for issue in issues:
+                jira_cli._transitions.remember(issue)
+            if more and prefetch:
+                pending = asyncio.ensure_future(_search_page(jql, fields, page_len(), token, expand))
+            for issue in issues:
+                yield issue
+            if not more:
+                return
+            if pending:
+                data, pending = await pending, None
+            else:
+                data = await _search_page(jql, fields, page_len(), token, expand)
+    finally:
+        if pending:
+            pending.cancel()
+
+
+async def _produce_site(site, jql, fields, page_size, position, out):
+    """한 사이트의 검색 페이지를 position부터 받아 out 큐로. 항목: [(이슈, 이 이슈 다음 위치)] 페이지 단위.
+    위치 {"token": 페이지 nextPageToken(첫 페이지는 None), "skip": 그 페이지에서 건너뛸 건수}, 끝이면 None.
+    """
+    jira_cli._site.set(site)  # 태스크마다 컨텍스트가 복사되므로 이 태스크에만 적용
+    token, skip = position.get("token"), position.get("skip", 0)
+    try:
+        while True:
+            data = await _search_page(jql, fields, page_size, token)
+            issues = data.get("issues", [])
+            more = data.get("nextPageToken") if not data.get("isLast") and issues else None
+            items = []
+            for i in range(skip, len(issues)):
+                issues[i]["site"] = site.name
+                if i + 1 < len(issues):
+                    nxt = {"token": token, "skip": i + 1}
+                else:
+                    nxt = {"token": more, "skip": 0} if more else None
+                items.append((issues[i], nxt))
+            await out.put(items)  # 큐가 차 있으면(두 페이지) 소비될 때까지 대기
+            if not more:
+                break
+            token, skip = more, 0
+    except Exception as e:
+        await out.put(jira_cli.SiteError(site.name, e))
+    await out.put(None)
+
+
+async def iter_search_sites(jql, sites, fields=None, page_size=None, positions=None):
+    """jira_cli.iter_search_sites의 비동기 버전. 사이트마다 태스크·연결 풀로 동시에 검색하고 ORDER BY 첫 필드로 병합.
+    positions: 사이트 이름 → 시작 위치 (이어 받기용, 값이 None이면 이미 끝난 사이트)
+    (이슈, 그 사이트의 다음 위치)를 내보낸다. 이슈에는 "site"가 붙는다.
+    """
+    import heapq
+
+    sites = [s if isinstance(s, jira_cli.Site) else jira_cli.get_site(s) for s in sites]
+    positions = positions or {}
+    fields = jira_cli.site_fields(jql, fields)
+    page_size = page_size or jira_cli.SEARCH_PAGE_SIZE
+    key = jira_cli.merge_key(*jira_cli.order_by(jql))
+    queues, tasks = [], []
+    for site in sites:
+        if site.name in positions and positions[site.name] is None:
+            continue
+        q = asyncio.Queue(maxsize=2)
+        queues.append(q)
+        tasks.append(asyncio.ensure_future(_produce_site(site, jql, fields, page_size, positions.get(site.name) or {}, q)))
+    buffers = [[] for _ in queues]
+
+    async def head(i):
+        """i번째 사이트의 다음 항목 (없으면 None)."""
+        while not buffers[i]:
+            page = await queues[i].get()
+            if page is None:
+                return None
+            if isinstance(page, jira_cli.SiteError):
+                raise page
+            buffers[i] = page[::-1]
+        return buffers[i].pop()
+
+    try:
+        heap = []
+        for i, item in enumerate(await asyncio.gather(*(head(i) for i in range(len(queues))))):
+            if item is not None:
+                heap.append((key(item[0]), i, item))
+        heapq.heapify(heap)
+        while heap:
+            _, i, item = heapq.heappop(heap)
+            yield item
+            nxt = await head(i)
+            if nxt is not None:
+                heapq.heappush(heap, (key(nxt[0]), i, nxt))
+    finally:
+        for t in tasks:
+            t.cancel()
+
+
+async def search(jql, max_results=20, fields=None, expand=None):
+    return [i async for i in iter_search(jql, limit=max_results, fields=fields, expand=expand)]
+
+
+async def my_issues(status=None, max_results=20, fields=None):
+    return await search(jira_cli._my_issues_jql(status), max_results=max_results, fields=fields)
+
+
+async def count_issues(jql):
+    """jira_cli.count_issues의 비동기 버전 (근사치, 이슈 본문 없음)."""
+    data = await api_post("/search/approximate-count", json_data={"jql": jql}, idempotent=True)
+    return data.get("count", 0)
+
+
+async def group_counts(jql, group_by="status", limit=None):
+    """jira_cli.group_counts의 비동기 버전. 반환: [(값, 건수)] 건수 내림차순"""
+    jira_cli._check_group_by(group_by)
+    counts = {}
+    async for issue in iter_search(jql, fields=[group_by], page_size=jira_cli.GROUP_PAGE_SIZE, limit=limit):
+        label = jira_cli.group_label(issue, group_by)
+        counts[label] = counts.get(label, 0) + 1
+    return jira_cli._sorted_counts(counts)
+
+
+async def get_issue(issue_key, fields=None, expand=None):
+    data = await api_get(f"/issue/{issue_key}", params=jira_cli._issue_params(fields, expand), cached=True)
+    jira_cli._transitions.remember(data)
+    return data
+
+
+async def _fetch_key_chunk(keys, fields, expand):
+    """jira_cli._fetch_key_chunk의 비동기 버전."""
+    missing = set()
+    while keys:
+        try:
+            data = await _search_page(jira_cli._keys_jql(keys), fields, len(keys), expand=expand)
+        except httpx.HTTPStatusError as e:
+            bad = jira_cli._missing_keys(e.response, keys)
+            if not bad:
+                raise
+            missing |= bad
+            keys = [k for k in keys if k not in bad]
+            continue
+        return data.get("issues", []), missing
+    return [], missing
+
+
+async def get_issues(issue_keys, fields=None, expand=None):
+    """jira_cli.get_issues의 비동기 버전. 묶음들은 동시에 요청.
+    반환: (요청 키 → 이슈 dict, 요청 순서), 없거나 볼 권한이 없는 키 목록)
+    """
+    keys = jira_cli.parse_issue_keys(" ".join(issue_keys))
+    fields = jira_cli.resolve_fields(fields, jira_cli.FIELD_PRESETS["detail"])
+    results = await asyncio.gather(*(_fetch_key_chunk(c, fields, expand) for c in jira_cli._key_chunks(keys)))
+    by_key, missing, unmatched = jira_cli._match_requested(keys, results)
+    for key in unmatched:
+        try:
+            by_key[key] = await get_issue(key, fields=fields, expand=expand)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            missing.add(key)
+    return {k: by_key[k] for k in keys if k in by_key}, [k for k in keys if k in missing]
+
+
+async def get_transitions(issue_key):
+    data = await api_get(f"/issue/{issue_key}/transitions")
+    return data.get("transitions", [])
+
+
+async def transition_issue(issue_key, transition_id):
+    await api_post(f"/issue/{issue_key}/transitions", json_data={"transition": {"id": transition_id}})
+
+
+async def _lookup_transitions(issue_key, refresh=False):
+    """jira_cli._lookup_transitions의 비동기 버전 (전환 캐시는 동기 버전과 공유)."""
+    cache = jira_cli._transitions
+    if not refresh:
+        entry = cache.context(issue_key)
+        transitions = cache.get(entry["wf"]) if entry else None
+        if transitions is not None:
+            return entry["wf"], transitions, True, {"id": entry.get("id"), "status": entry.get("status")}
+    data = await api_get(f"/issue/{issue_key}", params={"fields": "issuetype,status", "expand": "transitions"})
+    cache.remember(data)
+    wf = jira_cli.TransitionCache.workflow_key(data)
+    transitions = data.get("transitions", [])
+    if wf:
+        cache.put(wf, transitions)
+    status = ((data.get("fields") or {}).get("status") or {}).get("name")
+    return wf, transitions, False, {"id": data.get("id"), "status": status}
+
+
+async def transition_to_status(issue_key, target_status):
+    """jira_cli.transition_to_status의 비동기 버전. 반환: (성공여부, 메시지)"""
+    cache = jira_cli._transitions
+    if not (target_status or "").strip():
+        _, transitions, _, _ = await _lookup_transitions(issue_key)
+        return False, f"target_status를 지정해주세요. 가능한 전환: {jira_cli._transition_choices(transitions)}"
+    pick = jira_cli._pick_target(target_status)
+    refresh = False
+    while True:
+        wf, transitions, cached, _ = await _lookup_transitions(issue_key, refresh=refresh)
+        t, to_status = pick(wf, transitions)
+        if not t:
+            if cached:
+                refresh = True
+                continue
+            return False, f"'{target_status}'로 전환할 수 없습니다. 가능한 전환: {jira_cli._transition_choices(transitions)}"
+        try:
+            await transition_issue(issue_key, t["id"])
+        except httpx.HTTPStatusError as e:
+            if cached and e.response.status_code in (400, 404, 409):
+                cache.invalidate(wf, issue_key)
+                refresh = True
+                continue
+            raise
+        cache.moved(issue_key, t["id"])
+        await asyncio.to_thread(cache.save)
+        return True, f"{issue_key} → {to_status} 로 변경되었습니다."
+
+
+async def get_account_id():
+    """현재 사용자 accountId. 메타데이터 저장소에 있으면 요청 없이 반환.
+    저장소는 파일 잠금을 잡고 디스크를 읽고 쓰므로 이벤트 루프를 막지 않도록 스레드에서.
+    """
+    me = await asyncio.to_thread(jira_cli._meta.peek, "myself")
+    if me is None:
+        summary = jira_cli._myself_summary(await api_get("/myself"))
+        me = await asyncio.to_thread(jira_cli._meta.put, "myself", summary)
+    return me.get("accountId")
+
+
+async def _assignee_account_id(assign_to_self=False, assignee=None):
+    """jira_cli._assignee_account_id의 비동기 버전. 이름은 사용자 디렉터리 색인에서 찾음 (스레드에서, 대부분 요청 없음)."""
+    if assignee and assign_to_self:
+        raise ValueError("assign_to_self와 assignee는 함께 지정할 수 없습니다.")
+    if assignee:
+        return await asyncio.to_thread(jira_cli.resolve_user, assignee)
+    return await get_account_id() if assign_to_self else None
+
+
+async def create_issue(
+    project_key,
+    summary,
+    issuetype="Task",
+    description=None,
+    assign_to_self=False,
+    custom_fields=None,
+    assignee=None,
+):
+    """jira_cli.create_issue의 비동기 버전. 반환: (issue_key, browse_url)
+    생성 전 검증은 동기 버전을 스레드에서 실행 (createmeta는 대부분 저장소 캐시에서 읽음).
+    """
+    account_id = await _assignee_account_id(assign_to_self, assignee)
+    fields = jira_cli._build_create_fields(project_key, summary, issuetype, description, custom_fields, account_id)
+    await asyncio.to_thread(jira_cli.preflight_create, fields)
+    data = await api_post("/issue", json_data={"fields": fields})
+    key = data.get("key")
+    url = f"{jira_cli.JIRA_BASE_URL}/browse/{key}" if key else ""
+    return key, url
+
+
+async def update_issue(issue_key, summary=None, description=None, assign_to_self=False, assignee=None):
+    """jira_cli.update_issue의 비동기 버전. 반환: (성공여부, 메시지)"""
+    account_id = await _assignee_account_id(assign_to_self, assignee)
+    fields = jira_cli._build_update_fields(summary, description, account_id)
+    if not fields:
+        return False, jira_cli._UPDATE_NO_FIELDS_MSG
+    await api_put(f"/issue/{issue_key}", json_data={"fields": fields})
+    return True, f"{issue_key} 수정되었습니다."
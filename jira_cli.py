@@ -2,31 +2,75 @@
 """
 Jira 티켓 관리 CLI - 내 이슈 조회, 검색, 상세 보기, 티켓 생성·수정
 """
+import csv
+import importlib.util
 import json
+import logging
 import os
+import random
+import re
 import sys
 import argparse
+import bisect
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import quote
 
-import requests
-from dotenv import load_dotenv
+import jira_adf
+
+try:
+    import fcntl
+except ImportError:  # Windows: 메타데이터 파일 잠금 없이 동작
+    fcntl = None
+
+
+def _lazy_import(name):
+    """첫 속성 접근 때 실제로 로드되는 모듈 (importlib.util.LazyLoader).
+    requests처럼 무거운 의존성을 네트워크를 쓰지 않는 경로(--help, 미러·메타데이터 조회)에서 불러오지 않기 위함.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+requests = _lazy_import("requests")
+
+
+def _load_dotenv(path):
+    from dotenv import load_dotenv  # 설정 파일이 있을 때만 import
+
+    return load_dotenv(path)
 
 
 def _load_config():
     """설정 로드 순서: JIRA_ENV 경로 → 현재 디렉터리 .env → ~/.config/jira-helper/.env"""
     env_path = os.getenv("JIRA_ENV")
     if env_path and os.path.isfile(env_path):
-        load_dotenv(env_path)
+        _load_dotenv(env_path)
         return
-    if load_dotenv(".env"):
+    if os.path.isfile(".env") and _load_dotenv(".env"):
         return
     default = os.path.expanduser("~/.config/jira-helper/.env")
     if os.path.isfile(default):
-        load_dotenv(default)
+        _load_dotenv(default)
 
 
+_config_started = time.perf_counter()
 _load_config()
+_CONFIG_LOAD_SECONDS = time.perf_counter() - _config_started  # --profile의 load_config 단계
+
+log = logging.getLogger("jira_cli")
 
 JIRA_BASE_URL = os.getenv("JIRA_BASE_URL", "").rstrip("/")
 JIRA_EMAIL = os.getenv("JIRA_EMAIL")
@@ -43,33 +87,1172 @@ def get_auth():
     return (JIRA_EMAIL, JIRA_API_TOKEN)
 
 
-def api_get(path, params=None):
-    url = f"{JIRA_BASE_URL}/rest/api/3{path}"
-    r = requests.get(url, auth=get_auth(), params=params, timeout=30)
-    r.raise_for_status()
-    return r.json()
+# 백그라운드 데몬 소켓 (jira daemon). 소켓이 있으면 main()이 명령을 데몬에 전달한다. JIRA_NO_DAEMON=1이면 항상 직접 실행.
+DAEMON_SOCKET = os.path.expanduser(os.getenv("JIRA_DAEMON_SOCKET", "~/.config/jira-helper/daemon.sock"))
+
+# --- HTTP 전송 계층 ---
+# 프로세스당 requests.Session 하나를 공유해 TCP/TLS 연결을 재사용한다 (MCP 서버처럼 오래 사는 프로세스에서 특히 효과적).
+# 튜닝: JIRA_POOL_SIZE(호스트당 연결 수), JIRA_TIMEOUT(초), JIRA_MAX_RETRIES, JIRA_RETRY_BACKOFF(초)
+HTTP_POOL_SIZE = int(os.getenv("JIRA_POOL_SIZE", "10"))
+HTTP_TIMEOUT = float(os.getenv("JIRA_TIMEOUT", "30"))
+HTTP_MAX_RETRIES = int(os.getenv("JIRA_MAX_RETRIES", "3"))
+HTTP_RETRY_BACKOFF = float(os.getenv("JIRA_RETRY_BACKOFF", "0.5"))
+
+# 재시도해도 부작용이 없는 메서드. POST는 호출 측에서 idempotent=True로 명시한 경우에만 재시도.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRY_STATUS = frozenset({502, 503, 504})
+
+_session = None
+_session_lock = threading.Lock()
+_http_counters = {"requests": 0, "retries": 0, "async_requests": 0, "bytes_in": 0, "throttled": 0, "throttle_wait": 0.0}
+_counter_lock = threading.Lock()
+
+
+def _count(name, n=1):
+    with _counter_lock:
+        _http_counters[name] += n
+
+
+def _new_session(auth):
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.auth = auth
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """프로세스 공용 requests.Session (keep-alive, gzip, 연결 풀). 처음 호출 시 생성."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _new_session(get_auth())
+    return _session
+
+
+def connection_stats():
+    """공유 세션의 연결 재사용 통계.
+    반환: {"requests": 보낸 요청 수, "connections": 새로 연 연결 수, "reused": 재사용된 요청 수, "retries": 재시도 수,
+           "async_requests": jira_async로 보낸 요청 수 (별도 연결 풀이므로 재사용 계산에서 제외),
+           "bytes_in": 받은 응답 본문 크기 합계(압축 해제 후),
+           "throttled": 429 응답 수, "throttle_wait": 속도 제한으로 기다린 시간 합계(초)}
+    """
+    connections = 0
+    if _session is not None:
+        for adapter in {id(a): a for a in _session.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+    sent = _http_counters["requests"]
+    return {
+        "requests": sent,
+        "connections": connections,
+        "reused": max(sent - connections, 0),
+        "retries": _http_counters["retries"],
+        "async_requests": _http_counters["async_requests"],
+        "bytes_in": _http_counters["bytes_in"],
+        "throttled": _http_counters["throttled"],
+        "throttle_wait": round(_http_counters["throttle_wait"], 2),
+    }
+
+
+# --- 여러 사이트 (프로필) ---
+# 기본 사이트는 JIRA_BASE_URL·JIRA_EMAIL·JIRA_API_TOKEN. 이름 붙은 사이트는 JIRA_<이름>_BASE_URL(필수)과
+# JIRA_<이름>_EMAIL·JIRA_<이름>_API_TOKEN(없으면 기본 값)으로 정의한다 (예: JIRA_OSS_BASE_URL → --site oss).
+# 요청이 어느 사이트로 갈지는 컨텍스트 변수 _site로 정해지므로, 사이트별 스레드·태스크 안에서는 기존 함수를 그대로 쓴다.
+DEFAULT_SITE = "default"
+_site = contextvars.ContextVar("jira_site", default=None)
+
+
+class Site:
+    """사이트 프로필 하나와 그 사이트 전용 세션(연결 풀)."""
+
+    def __init__(self, name, base_url, email, token):
+        self.name = name
+        self.base_url = (base_url or "").rstrip("/")
+        self.email = email
+        self.token = token
+        self._session = None
+
+    def auth(self):
+        if self.name == DEFAULT_SITE:
+            return get_auth()
+        return (self.email, self.token)
+
+    def session(self):
+        if self.name == DEFAULT_SITE:
+            return get_session()
+        if self._session is None:
+            with _session_lock:
+                if self._session is None:
+                    self._session = _new_session(self.auth())
+        return self._session
+
+
+_default_site = Site(DEFAULT_SITE, JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN)
+_sites = {}
+_sites_lock = threading.Lock()
+
+
+def site_names():
+    """설정된 사이트 이름 (기본 사이트 포함)."""
+    names = [k[len("JIRA_"):-len("_BASE_URL")].lower() for k in os.environ if k.startswith("JIRA_") and k.endswith("_BASE_URL")]
+    return [DEFAULT_SITE] + sorted(n for n in names if n)
+
+
+def get_site(name):
+    """이름으로 사이트 프로필. 설정이 없으면 ValueError."""
+    name = (name or DEFAULT_SITE).strip().lower()
+    if name == DEFAULT_SITE:
+        return _default_site
+    with _sites_lock:
+        site = _sites.get(name)
+        if site is None:
+            prefix = f"JIRA_{name.upper()}_"
+            base_url = os.getenv(prefix + "BASE_URL")
+            if not base_url:
+                raise ValueError(f"사이트 '{name}' 설정이 없습니다: {prefix}BASE_URL (설정된 사이트: {', '.join(site_names())})")
+            site = _sites[name] = Site(
+                name, base_url, os.getenv(prefix + "EMAIL") or JIRA_EMAIL, os.getenv(prefix + "API_TOKEN") or JIRA_API_TOKEN,
+            )
+            if not (site.email and site.token):
+                del _sites[name]
+                raise ValueError(f"사이트 '{name}'의 이메일·API 토큰이 없습니다: {prefix}EMAIL, {prefix}API_TOKEN")
+    return site
+
+
+def parse_sites(spec):
+    """'a,b,c' → 사이트 목록 (중복 제거, 순서 유지)."""
+    names = [n.strip().lower() for n in (spec or "").replace(" ", ",").split(",") if n.strip()]
+    return [get_site(n) for n in dict.fromkeys(names)]
+
+
+def current_site():
+    """지금 요청이 갈 사이트 (_site가 없으면 기본 사이트)."""
+    return _site.get() or _default_site
+
+
+class SiteError(RuntimeError):
+    """여러 사이트 검색 중 한 사이트에서 난 오류 (메시지에 사이트 이름)."""
+
+    def __init__(self, site, error):
+        super().__init__(f"{site}: {error}")
+        self.site = site
+        self.error = error
+
+
+# --- 계측 (--profile, MCP jira_stats, JIRA_METRICS_FILE) ---
+# 모든 요청(_request)은 엔드포인트별 지연 분포·송수신 바이트·상태 코드·재시도를 _metrics에 남긴다.
+# instrument()로 공개 함수를 감싸면 함수 단계(phase)별 시간도 남아, "create → get_account_id → GET /myself"처럼
+# 어느 단계에서 시간이 걸렸는지 나눠 볼 수 있다 (--profile과 MCP 서버에서만 켜므로 평소 CLI에는 비용 없음).
+# JIRA_METRICS_FILE: 지표를 쓸 파일 (.prom이면 Prometheus 텍스트, 아니면 JSON). CLI·데몬은 명령이 끝날 때마다, MCP 서버는 주기적으로.
+METRICS_FILE = os.path.expanduser(os.getenv("JIRA_METRICS_FILE", ""))
+METRICS_INTERVAL = float(os.getenv("JIRA_METRICS_INTERVAL", "60"))  # MCP 서버가 METRICS_FILE을 다시 쓰는 간격(초)
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_phase_stack = contextvars.ContextVar("jira_phase", default=())
+
+
+class Histogram:
+    """지연 시간 분포 (Prometheus 히스토그램과 같은 버킷). 분위수는 버킷 안에서 선형 보간한 추정값."""
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(_LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(_LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lo = _LATENCY_BUCKETS[i - 1] if i else 0.0
+                hi = _LATENCY_BUCKETS[i] if i < len(_LATENCY_BUCKETS) else self.max
+                return min(max(lo + (hi - lo) * (rank - seen) / n, self.min), self.max)
+            seen += n
+        return self.max
+
+
+class Metrics:
+    """요청·단계·캐시 지표 모음.
+    endpoints: "GET /issue/{key}" → {"latency": Histogram, "status": {코드: 수}, "bytes_in", "bytes_out", "retries"}
+    phases: (바깥 단계, ..., 안쪽 단계) → [호출 수, 합계(초)] — 맨 안쪽은 함수 이름 또는 엔드포인트
+    caches: 캐시 이름 → [적중, 실패]
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.endpoints = {}
+            self.phases = {}
+            self.caches = {}
+
+    def request(self, endpoint, status, seconds, bytes_in, bytes_out, retries):
+        with self._lock:
+            ep = self.endpoints.get(endpoint)
+            if ep is None:
+                ep = self.endpoints[endpoint] = {"latency": Histogram(), "status": {}, "bytes_in": 0, "bytes_out": 0, "retries": 0}
+            ep["latency"].observe(seconds)
+            ep["status"][status] = ep["status"].get(status, 0) + 1
+            ep["bytes_in"] += bytes_in
+            ep["bytes_out"] += bytes_out
+            ep["retries"] += retries
+
+    def phase(self, path, seconds):
+        with self._lock:
+            entry = self.phases.get(path)
+            if entry is None:
+                self.phases[path] = [1, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+
+    def cache(self, name, hit):
+        with self._lock:
+            entry = self.caches.setdefault(name, [0, 0])
+            entry[0 if hit else 1] += 1
+
+    def snapshot(self):
+        """JSON으로 쓸 수 있는 dict (jira_stats, JIRA_METRICS_FILE)."""
+        with self._lock:
+            endpoints = {
+                name: {
+                    "count": ep["latency"].count,
+                    "seconds": round(ep["latency"].sum, 4),
+                    "p50": round(ep["latency"].quantile(0.5), 4),
+                    "p90": round(ep["latency"].quantile(0.9), 4),
+                    "p99": round(ep["latency"].quantile(0.99), 4),
+                    "max": round(ep["latency"].max, 4),
+                    "buckets": list(ep["latency"].counts),
+                    "status": {str(k): v for k, v in ep["status"].items()},
+                    "bytes_in": ep["bytes_in"],
+                    "bytes_out": ep["bytes_out"],
+                    "retries": ep["retries"],
+                }
+                for name, ep in self.endpoints.items()
+            }
+            phases = [{"path": list(path), "count": n, "seconds": round(s, 4)} for path, (n, s) in self.phases.items()]
+            caches = {name: {"hits": h, "misses": m} for name, (h, m) in self.caches.items()}
+            started = self.started
+        return {
+            "started": started,
+            "uptime": round(time.time() - started, 1),
+            "buckets": list(_LATENCY_BUCKETS),
+            "endpoints": endpoints,
+            "phases": phases,
+            "caches": caches,
+            "http": connection_stats(),
+            "response_cache": _responses.stats(),
+        }
+
+
+_metrics = Metrics()  # 프로세스 누적
+_profile = None  # --profile로 실행 중인 명령 하나의 지표 (데몬에서도 명령 단위로 보이도록 따로 모음)
+
+
+def endpoint_template(path):
+    """지표용 경로: 이슈 키·숫자 id를 자리표시자로 (/issue/PROJ-1/transitions → /issue/{key}/transitions)."""
+    parts = path.split("/")
+    for i, seg in enumerate(parts):
+        if seg.isdigit():
+            parts[i] = "{id}"
+        elif "-" in seg and seg.rsplit("-", 1)[1].isdigit():
+            parts[i] = "{key}"
+    return "/".join(parts)
+
+
+def _record_phase(path, seconds):
+    _metrics.phase(path, seconds)
+    if _profile is not None:
+        _profile.phase(path, seconds)
+
+
+def _observe_request(method, path, status, seconds, bytes_in, bytes_out, retries):
+    """_request(동기·비동기) 한 건을 지표에 반영. 재시도·429 대기를 포함한 전체 시간."""
+    endpoint = f"{method} {endpoint_template(path)}"
+    for m in (_metrics, _profile):
+        if m is not None:
+            m.request(endpoint, status, seconds, bytes_in, bytes_out, retries)
+    _record_phase(_phase_stack.get() + (endpoint,), seconds)
+
+
+def _cache_event(name, hit):
+    _metrics.cache(name, hit)
+    if _profile is not None:
+        _profile.cache(name, hit)
+
+
+# instrument()가 감싸지 않는 공개 함수 (진입점·지표 자체, 요청·행마다 불리는 작은 보조 함수).
+# 감싼 함수는 호출마다 지표 잠금을 잡고 단계를 기록하므로, 1000건 페이지의 행마다 불리는 함수는 여기에 둔다.
+_INSTRUMENT_SKIP = frozenset({
+    "main", "instrument", "endpoint_template", "connection_stats", "format_profile",
+    "metrics_prometheus", "write_metrics", "start_metrics_writer",
+    "endpoint_class", "get_auth", "get_session", "resolve_fields",
+    # 요청·캐시 키마다
+    "current_site", "get_site", "site_names", "parse_sites", "site_fields",
+    "extra_fields", "field_projection", "order_by", "merge_key", "parse_issue_keys",
+    # 행마다 (format_field_value·adf_to_text는 재귀)
+    "format_issue_row", "format_field_value", "adf_to_text", "format_user",
+    "group_label", "format_bulk_result", "format_create_result",
+})
+
+
+def instrument(module=None):
+    """module(기본: jira_cli)의 공개 함수를 단계 시간을 재는 래퍼로 바꿈. 같은 모듈은 한 번만.
+    모듈 전역을 바꾸므로 모듈 안에서 서로 부르는 호출도 잡힌다. 제너레이터는 실제로 값을 만드는 동안만 잰다.
+    """
+    import functools
+    import inspect
+
+    module = module or sys.modules[__name__]
+    if getattr(module, "_instrumented", False):
+        return
+    prefix = "" if module is sys.modules[__name__] else module.__name__ + "."
+    for name, fn in list(vars(module).items()):
+        if name.startswith("_") or name in _INSTRUMENT_SKIP or not inspect.isfunction(fn) or fn.__module__ != module.__name__:
+            continue
+        setattr(module, name, functools.wraps(fn)(_timed(fn, prefix + name)))
+    module._instrumented = True
+
+
+def _timed(fn, name):
+    import inspect
+
+    if inspect.isasyncgenfunction(fn):
+        async def agen_wrapper(*args, **kwargs):
+            agen = fn(*args, **kwargs)
+            total = 0.0
+            path = _phase_stack.get() + (name,)
+            try:
+                while True:
+                    token = _phase_stack.set(path)
+                    started = time.perf_counter()
+                    try:
+                        item = await agen.__anext__()
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        total += time.perf_counter() - started
+                        _phase_stack.reset(token)
+                    yield item
+            finally:
+                await agen.aclose()
+                _record_phase(path, total)
+        return agen_wrapper
+    if inspect.iscoroutinefunction(fn):
+        async def async_wrapper(*args, **kwargs):
+            path = _phase_stack.get() + (name,)
+            token = _phase_stack.set(path)
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                _phase_stack.reset(token)
+                _record_phase(path, time.perf_counter() - started)
+        return async_wrapper
+    if inspect.isgeneratorfunction(fn):
+        def gen_wrapper(*args, **kwargs):
+            gen = fn(*args, **kwargs)
+            total = 0.0
+            path = _phase_stack.get() + (name,)
+            try:
+                while True:
+                    token = _phase_stack.set(path)
+                    started = time.perf_counter()
+                    try:
+                        item = next(gen)
+                    except StopIteration:
+                        return
+                    finally:
+                        total += time.perf_counter() - started
+                        _phase_stack.reset(token)
+                    yield item
+            finally:
+                gen.close()
+                _record_phase(path, total)
+        return gen_wrapper
+
+    def wrapper(*args, **kwargs):
+        path = _phase_stack.get() + (name,)
+        token = _phase_stack.set(path)
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _phase_stack.reset(token)
+            _record_phase(path, time.perf_counter() - started)
+    return wrapper
+
+
+def _fmt_bytes(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024 or unit == "MB":
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024
+
+
+def format_profile(metrics, wall=None):
+    """지표를 사람이 읽는 표로: 단계 트리(호출 수, 합계, 비율) + 엔드포인트별 지연·바이트·상태 코드 + 캐시 적중."""
+    snap = metrics.snapshot()
+    lines = []
+    roots = sum(p["seconds"] for p in snap["phases"] if len(p["path"]) == 1)
+    total = wall or roots or 0.0
+    lines.append(f"[profile] 단계별 시간 (전체 {total * 1000:.1f}ms)")
+    tree = {}
+    for p in snap["phases"]:  # 처음 나타난 순서대로 트리 구성 (자식이 부모보다 먼저 기록됨)
+        children = tree
+        for part in p["path"]:
+            node = children.setdefault(part, {"stats": None, "children": {}})
+            children = node["children"]
+        node["stats"] = p
+    stack = [(name, node, 0) for name, node in reversed(list(tree.items()))]
+    while stack:
+        name, node, depth = stack.pop()
+        p = node["stats"]
+        label = "  " * depth + name
+        if p is not None and p["seconds"] < 0.0001 and not node["children"]:
+            continue  # 0.1ms 미만 잎 단계는 생략 (JSON·Prometheus에는 모두 있음)
+        if p is None:
+            lines.append(f"  {label}")
+        else:
+            share = f"{p['seconds'] / total:6.1%}" if total else ""
+            lines.append(f"  {label:<48} {p['count']:>5}회 {p['seconds'] * 1000:>10.1f}ms {share}")
+        stack.extend((k, v, depth + 1) for k, v in reversed(list(node["children"].items())))
+    if snap["endpoints"]:
+        lines.append("[profile] HTTP 엔드포인트")
+        for name, ep in snap["endpoints"].items():
+            status = " ".join(f"{k}×{v}" for k, v in ep["status"].items())
+            lines.append(
+                f"  {name:<40} {ep['count']:>5}회  p50 {ep['p50'] * 1000:.0f}ms  p99 {ep['p99'] * 1000:.0f}ms"
+                f"  max {ep['max'] * 1000:.0f}ms  수신 {_fmt_bytes(ep['bytes_in'])}  송신 {_fmt_bytes(ep['bytes_out'])}"
+                f"  [{status}]  재시도 {ep['retries']}"
+            )
+    if snap["caches"]:
+        lines.append("[profile] 캐시 적중/실패: " + ", ".join(f"{k} {v['hits']}/{v['misses']}" for k, v in snap["caches"].items()))
+    return "\n".join(lines)
+
+
+def _prom_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def metrics_prometheus(metrics=None):
+    """지표를 Prometheus 텍스트 형식으로 (node_exporter textfile collector 등)."""
+    snap = (metrics or _metrics).snapshot()
+    out = [
+        "# HELP jira_request_duration_seconds Jira REST 요청 시간 (재시도·대기 포함)",
+        "# TYPE jira_request_duration_seconds histogram",
+    ]
+    for name, ep in snap["endpoints"].items():
+        label = f'endpoint="{_prom_label(name)}"'
+        cumulative = 0
+        for le, n in zip(list(snap["buckets"]) + ["+Inf"], ep["buckets"]):
+            cumulative += n
+            out.append(f'jira_request_duration_seconds_bucket{{{label},le="{le}"}} {cumulative}')
+        out.append(f"jira_request_duration_seconds_sum{{{label}}} {ep['seconds']}")
+        out.append(f"jira_request_duration_seconds_count{{{label}}} {ep['count']}")
+    for metric, key, help_text in (
+        ("jira_request_bytes_in_total", "bytes_in", "받은 응답 본문 바이트"),
+        ("jira_request_bytes_out_total", "bytes_out", "보낸 요청 본문 바이트"),
+        ("jira_request_retries_total", "retries", "재시도·429 재요청 수"),
+    ):
+        out += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        out += [f'{metric}{{endpoint="{_prom_label(n)}"}} {ep[key]}' for n, ep in snap["endpoints"].items()]
+    out += ["# HELP jira_responses_total 상태 코드별 응답 수", "# TYPE jira_responses_total counter"]
+    for name, ep in snap["endpoints"].items():
+        for status, n in ep["status"].items():
+            out.append(f'jira_responses_total{{endpoint="{_prom_label(name)}",status="{status}"}} {n}')
+    out += ["# HELP jira_phase_seconds_total 함수 단계별 누적 시간", "# TYPE jira_phase_seconds_total counter"]
+    out += [f'jira_phase_seconds_total{{phase="{_prom_label(" > ".join(p["path"]))}"}} {p["seconds"]}' for p in snap["phases"]]
+    out += ["# HELP jira_phase_calls_total 함수 단계별 호출 수", "# TYPE jira_phase_calls_total counter"]
+    out += [f'jira_phase_calls_total{{phase="{_prom_label(" > ".join(p["path"]))}"}} {p["count"]}' for p in snap["phases"]]
+    out += ["# HELP jira_cache_lookups_total 캐시 조회 수", "# TYPE jira_cache_lookups_total counter"]
+    for name, c in snap["caches"].items():
+        out.append(f'jira_cache_lookups_total{{cache="{_prom_label(name)}",result="hit"}} {c["hits"]}')
+        out.append(f'jira_cache_lookups_total{{cache="{_prom_label(name)}",result="miss"}} {c["misses"]}')
+    rc = snap["response_cache"]
+    out += [
+        "# HELP jira_response_cache_bytes 응답 캐시 크기", "# TYPE jira_response_cache_bytes gauge",
+        f"jira_response_cache_bytes {rc['bytes']}",
+        "# HELP jira_response_cache_evictions_total 응답 캐시 LRU 제거 수", "# TYPE jira_response_cache_evictions_total counter",
+        f"jira_response_cache_evictions_total {rc['evictions']}",
+    ]
+    return "\n".join(out) + "\n"
 
 
-def api_post(path, json_data=None):
-    url = f"{JIRA_BASE_URL}/rest/api/3{path}"
-    r = requests.post(url, auth=get_auth(), json=json_data, timeout=30)
-    r.raise_for_status()
+def write_metrics(path=None, metrics=None):
+    """지표를 파일로 (기본 JIRA_METRICS_FILE). 확장자가 .prom이면 Prometheus 텍스트, 아니면 JSON. 경로가 없으면 아무것도 안 함."""
+    path = path or METRICS_FILE
+    if not path:
+        return
+    if str(path).endswith(".prom"):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(metrics_prometheus(metrics), encoding="utf-8")
+        os.replace(tmp, path)
+    else:
+        _atomic_write_json(path, (metrics or _metrics).snapshot())
+
+
+def start_metrics_writer(interval=METRICS_INTERVAL):
+    """JIRA_METRICS_FILE이 있으면 interval초마다(와 종료 시) 누적 지표를 씀 (MCP 서버용)."""
+    if not METRICS_FILE:
+        return
+    import atexit
+
+    def loop():
+        while True:
+            time.sleep(max(interval, 1.0))
+            try:
+                write_metrics()
+            except OSError as e:
+                log.debug("지표 파일 쓰기 실패: %s", e)
+
+    threading.Thread(target=loop, name="jira-metrics", daemon=True).start()
+    atexit.register(write_metrics)
+
+
+# --- 요청 속도 제한 ---
+# Jira Cloud는 사용자별 요청 비용 한도를 넘으면 429를 돌려준다. 엔드포인트 종류별 토큰 버킷으로 미리 속도를 맞추고,
+# 429·Retry-After·X-RateLimit-* 헤더를 받으면 모든 스레드·비동기 태스크가 함께 멈췄다가 낮춘 속도로 재개한다.
+# JIRA_RATE_LIMITS: 종류별 초당 요청 수 (예: "read=20,search=10,write=10,bulk=2", 0이면 제한 없음)
+RATE_LIMITS = {"read": 20.0, "search": 10.0, "write": 10.0, "bulk": 2.0}
+for _item in os.getenv("JIRA_RATE_LIMITS", "").split(","):
+    if "=" in _item:
+        _name, _value = _item.split("=", 1)
+        RATE_LIMITS[_name.strip()] = float(_value)
+RATE_MAX_RETRIES = int(os.getenv("JIRA_RATE_MAX_RETRIES", "5"))  # 429 재시도 횟수 (멱등 여부와 무관: 처리되지 않은 요청)
+RATE_MAX_BACKOFF = float(os.getenv("JIRA_RATE_MAX_BACKOFF", "60"))  # Retry-After가 없을 때 백오프 상한(초)
+
+
+def endpoint_class(method, path):
+    """요청을 속도 제한 버킷 종류로 분류: bulk, search, write, read."""
+    if path.startswith("/bulk") or path.endswith("/bulk") or "bulkfetch" in path:
+        return "bulk"
+    if path.startswith("/search"):
+        return "search"
+    if method not in ("GET", "HEAD", "OPTIONS"):
+        return "write"
+    return "read"
+
+
+def _backoff(attempt, base=None):
+    """지터를 넣은 지수 백오프: base * 2^attempt(RATE_MAX_BACKOFF 상한)의 절반 + 나머지 절반 안의 임의 값.
+    여러 스레드·프로세스가 같은 순간에 다시 몰리지 않게 한다.
+    """
+    base = HTTP_RETRY_BACKOFF if base is None else base
+    delay = min(RATE_MAX_BACKOFF, base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _parse_http_time(value):
+    """Retry-After(초 또는 HTTP 날짜)·X-RateLimit-Reset(ISO 8601) 값 → 남은 초. 해석 불가면 None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = datetime.fromisoformat(value)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class _Bucket:
+    """토큰 버킷. 토큰이 음수가 되도록 예약을 허용해 대기 순서를 보장한다."""
+
+    def __init__(self, rate):
+        self.base = rate
+        self.rate = rate
+        self.tokens = max(rate, 1.0)
+        self.stamp = time.monotonic()
+
+    def refill(self, now):
+        if now > self.stamp:
+            self.tokens = min(max(self.base, 1.0), self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+
+
+class RateLimiter:
+    """엔드포인트 종류별 토큰 버킷 + 전역 일시 정지. 스레드와 비동기 태스크가 함께 쓴다 (잠금은 계산에만 사용).
+    대기 자체는 호출 측이 한다: 동기는 time.sleep, 비동기는 asyncio.sleep.
+    """
+
+    def __init__(self, limits):
+        self._lock = threading.Lock()
+        self._buckets = {name: _Bucket(rate) for name, rate in limits.items() if rate > 0}
+        self._paused_until = 0.0
+
+    def reserve(self, method, path):
+        """다음 요청을 보내기까지 기다릴 시간(초)과 예약 여부.
+        전역 정지 중이면 토큰을 쓰지 않고 (남은 시간, False)를 돌려주므로, 기다린 뒤 다시 호출해야 한다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now < self._paused_until:
+                return self._paused_until - now + random.uniform(0, 0.1), False
+            bucket = self._buckets.get(endpoint_class(method, path))
+            if bucket is None:
+                return 0.0, True
+            bucket.refill(now)
+            bucket.tokens -= 1
+            return (0.0 if bucket.tokens >= 0 else -bucket.tokens / bucket.rate), True
+
+    def pause(self, seconds, kind=None, factor=0.5):
+        """모든 요청을 seconds 동안 멈추고, kind 버킷 속도를 factor배로 낮춤 (정지 중에는 토큰이 차지 않음)."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._paused_until = max(self._paused_until, until)
+            bucket = self._buckets.get(kind)
+            if bucket is not None:
+                bucket.rate = max(bucket.rate * factor, bucket.base * 0.05)
+                bucket.tokens = min(bucket.tokens, 0.0)
+                bucket.stamp = max(bucket.stamp, self._paused_until)
+
+    def observe(self, method, path, status, headers):
+        """응답 상태·헤더를 반영. 429면 다시 보낼 수 있을 때까지 기다릴 시간(초), 아니면 None."""
+        kind = endpoint_class(method, path)
+        if status == 429:
+            wait = _parse_http_time(headers.get("Retry-After"))
+            if wait is None:
+                wait = _parse_http_time(headers.get("X-RateLimit-Reset"))
+            if wait is None:
+                with self._lock:
+                    bucket = self._buckets.get(kind)
+                    strikes = 0 if bucket is None else round(bucket.base / bucket.rate).bit_length()
+                wait = _backoff(strikes, base=1.0)
+            self.pause(wait, kind)
+            return wait
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset = _parse_http_time(headers.get("X-RateLimit-Reset"))
+            if reset:
+                self.pause(reset, kind)
+        elif (headers.get("X-RateLimit-NearLimit") or "").lower() == "true":
+            self.pause(0, kind, factor=0.8)
+        else:
+            with self._lock:
+                bucket = self._buckets.get(kind)
+                if bucket is not None and bucket.rate < bucket.base:
+                    bucket.rate = min(bucket.base, bucket.rate + bucket.base * 0.05)
+        return None
+
+    def stats(self):
+        """종류별 현재 속도(초당 요청 수)와 설정값."""
+        with self._lock:
+            return {name: {"rate": round(b.rate, 2), "limit": b.base} for name, b in self._buckets.items()}
+
+
+_limiter = RateLimiter(RATE_LIMITS)
+
+
+def _throttle(method, path):
+    """속도 제한이 허락할 때까지 현재 스레드를 재움."""
+    while True:
+        delay, reserved = _limiter.reserve(method, path)
+        if delay > 0:
+            _count("throttle_wait", delay)
+            time.sleep(delay)
+        if reserved:
+            return
+
+
+def _request(method, path, params=None, json_data=None, idempotent=None):
+    """공유 세션으로 요청. 속도 제한(_limiter)을 거쳐 보내고, 429는 Retry-After만큼 전체를 멈춘 뒤 재시도.
+    연결 오류·502/503/504는 지터를 넣은 지수 백오프로 재시도 (멱등 요청만).
+    연결 자체가 맺어지지 않은 경우(ConnectTimeout)는 요청이 전달되지 않았으므로 메서드와 무관하게 재시도.
+    """
+    site = current_site()
+    url = f"{site.base_url}/rest/api/3{path}"
+    if idempotent is None:
+        idempotent = method in _IDEMPOTENT_METHODS
+    session = site.session()
+    attempt = throttled = 0
+    started = time.perf_counter()
+    while True:
+        _throttle(method, path)
+        _count("requests")
+        try:
+            r = session.request(method, url, params=params, json=json_data, timeout=HTTP_TIMEOUT)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+            if not retryable or attempt >= HTTP_MAX_RETRIES:
+                _observe_request(method, path, "error", time.perf_counter() - started, 0, 0, attempt + throttled)
+                raise
+            delay = _backoff(attempt)
+        else:
+            wait = _limiter.observe(method, path, r.status_code, r.headers)
+            if wait is not None and throttled < RATE_MAX_RETRIES:
+                throttled += 1
+                _count("throttled")
+                log.debug("%s %s → 429, %.1fs 대기", method, path, wait)
+                continue  # 대기는 다음 _throttle에서 (다른 스레드와 같이 멈춤)
+            if not (idempotent and r.status_code in _RETRY_STATUS and attempt < HTTP_MAX_RETRIES):
+                _record_payload(method, path, r.status_code, len(r.content))
+                _observe_request(
+                    method, path, r.status_code, time.perf_counter() - started,
+                    len(r.content), len(r.request.body or b""), attempt + throttled,
+                )
+                r.raise_for_status()
+                _responses.written(method, path)
+                return r
+            delay = _parse_http_time(r.headers.get("Retry-After")) or _backoff(attempt)
+        _count("retries")
+        time.sleep(delay)
+        attempt += 1
+
+
+def _record_payload(method, path, status, size):
+    """응답 본문 크기를 누적하고 디버그 로그로 남김 (-v 또는 로깅 설정 시 출력)."""
+    _count("bytes_in", size)
+    log.debug("%s %s → %s, %d bytes", method, path, status, size)
+
+
+def _json_or_empty(r):
     if r.status_code == 204 or not r.text.strip():
         return {}
     return r.json()
 
 
+def api_get(path, params=None):
+    return _request("GET", path, params=params).json()
+
+
+def api_post(path, json_data=None, idempotent=False):
+    """idempotent=True: 조회용 POST(/search/jql 등)처럼 재시도해도 안전한 경우."""
+    return _json_or_empty(_request("POST", path, json_data=json_data, idempotent=idempotent))
+
+
 def api_put(path, json_data=None):
-    url = f"{JIRA_BASE_URL}/rest/api/3{path}"
-    r = requests.put(url, auth=get_auth(), json=json_data, timeout=30)
-    r.raise_for_status()
-    if r.status_code == 204 or not r.text.strip():
-        return {}
-    return r.json()
+    return _json_or_empty(_request("PUT", path, json_data=json_data))
+
+
+# --- 응답 캐시 ---
+# MCP 서버처럼 오래 사는 프로세스에서 같은 조회(이슈 상세·검색 페이지)를 짧은 시간에 반복하지 않도록 응답 본문을 메모리에 둔다.
+# 크기(바이트) 한도를 넘으면 가장 오래 안 쓴 항목부터 버리고(LRU), 종류별 TTL이 지나면 다시 요청한다.
+# 쓰기 요청이 성공하면 _request가 written()을 불러 해당 이슈와 그 이슈가 들어 있던 검색 결과를 비운다.
+# JIRA_RESPONSE_CACHE_BYTES: 최대 크기 (0이면 사용 안 함), JIRA_RESPONSE_CACHE_TTL: 종류별 초 (예: "issue=60,search=30")
+# JIRA_RESPONSE_CACHE_MAX_RESULTS: 이 건수 이하로 요청한 검색 페이지만 캐시 (집계용 큰 페이지가 작은 항목을 밀어내지 않도록)
+RESPONSE_CACHE_BYTES = int(os.getenv("JIRA_RESPONSE_CACHE_BYTES", str(16 * 1024 * 1024)))
+RESPONSE_CACHE_MAX_RESULTS = int(os.getenv("JIRA_RESPONSE_CACHE_MAX_RESULTS", "100"))
+RESPONSE_CACHE_TTL = {"issue": 60.0, "search": 30.0}
+for _item in os.getenv("JIRA_RESPONSE_CACHE_TTL", "").split(","):
+    if "=" in _item:
+        _name, _value = _item.split("=", 1)
+        RESPONSE_CACHE_TTL[_name.strip()] = float(_value)
+
+
+class ResponseCache:
+    """조회 응답 본문(bytes)의 LRU 캐시. 꺼낼 때마다 새로 파싱하므로 호출 측이 결과를 고쳐도 캐시는 그대로.
+    항목: 캐시 키 → (종류, 만료 시각, 본문, 응답에 들어 있던 이슈 키·id)
+    """
+
+    def __init__(self, max_bytes=RESPONSE_CACHE_BYTES, ttls=None):
+        self.max_bytes = max_bytes
+        self.ttls = dict(RESPONSE_CACHE_TTL if ttls is None else ttls)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._by_issue = {}  # 이슈 키·id → 그 이슈가 들어 있는 캐시 키들
+        self._size = 0
+        self._generation = 0  # 무효화할 때마다 증가: 그 전에 보낸 요청의 응답은 저장하지 않음
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "invalidated": 0}
+
+    def kind(self, method, path):
+        """캐시할 요청의 종류: GET /issue/{키} → issue, POST /search/jql → search. 그 밖(또는 TTL 0)은 None."""
+        if method == "GET" and path.startswith("/issue/") and path.count("/") == 2:
+            kind = "issue"
+        elif method == "POST" and path == "/search/jql":
+            kind = "search"
+        else:
+            return None
+        return kind if self.max_bytes > 0 and self.ttls.get(kind, 0) > 0 else None
+
+    @staticmethod
+    def key(method, path, params=None, json_data=None):
+        site = current_site().base_url
+        return f"{method} {path} " + json.dumps([site, params, json_data], sort_keys=True, separators=(",", ":"))
+
+    def generation(self):
+        return self._generation
+
+    def get(self, key):
+        """캐시된 본문(bytes). 없거나 만료됐으면 None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                self._drop(key)
+                self._counters["expired"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+            self._counters["hits" if entry is not None else "misses"] += 1
+        _cache_event("response", entry is not None)
+        return entry[2] if entry is not None else None
+
+    def put(self, key, kind, body, data, generation):
+        """응답 저장. generation(요청 전에 받은 generation()) 이후 무효화가 있었으면 낡았을 수 있으므로 버림."""
+        if len(body) > self.max_bytes:
+            return
+        if kind == "issue":
+            issues = [data] if isinstance(data, dict) else []
+        else:
+            issues = (data.get("issues") if isinstance(data, dict) else None) or []
+        refs = {str(i[k]) for i in issues if isinstance(i, dict) for k in ("key", "id") if i.get(k)}
+        if kind == "issue":
+            refs.add(key.split(" ", 2)[1].rsplit("/", 1)[1].upper())  # 요청한 키 (이동된 이슈면 응답 키와 다름)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._drop(key)
+            self._entries[key] = (kind, time.monotonic() + self.ttls[kind], body, refs)
+            self._size += len(body)
+            for ref in refs:
+                self._by_issue.setdefault(ref, set()).add(key)
+            while self._size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._counters["evictions"] += 1
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= len(entry[2])
+        for ref in entry[3]:
+            keys = self._by_issue.get(ref)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_issue[ref]
+
+    def invalidate(self, issue_key=None, searches=False):
+        """issue_key(키 또는 id)가 들어 있는 항목을 비움. searches=True면 검색 결과 전부, 둘 다 없으면 전체."""
+        with self._lock:
+            self._generation += 1
+            if issue_key is None and not searches:
+                targets = list(self._entries)
+            else:
+                targets = set(self._by_issue.get(str(issue_key).upper(), ())) if issue_key else set()
+                if searches:
+                    targets.update(k for k, e in self._entries.items() if e[0] == "search")
+            for key in targets:
+                self._drop(key)
+            self._counters["invalidated"] += len(targets)
+
+    def written(self, method, path):
+        """성공한 쓰기 요청에 맞춰 무효화 (_request에서 호출).
+        /issue/{키}/... → 그 이슈, /issue·/issue/bulk(생성) → 검색 결과 전부(새 이슈가 어느 검색에 들지 모름), 그 밖 → 전체.
+        """
+        if method in ("GET", "HEAD", "OPTIONS") or endpoint_class(method, path) == "search" or "bulkfetch" in path:
+            return
+        parts = path.split("/")
+        if len(parts) > 2 and parts[1] == "issue" and parts[2] not in ("bulk", "createmeta"):
+            self.invalidate(parts[2])
+        elif path in ("/issue", "/issue/bulk"):
+            self.invalidate(searches=True)
+        else:
+            self.invalidate()
+
+    def clear(self):
+        self.invalidate()
+
+    def stats(self):
+        """{"entries", "bytes", "max_bytes", "hits", "misses", "hit_rate", "evictions", "expired", "invalidated", "ttl"}"""
+        with self._lock:
+            st = dict(self._counters, entries=len(self._entries), bytes=self._size, max_bytes=self.max_bytes)
+        looked = st["hits"] + st["misses"]
+        st["hit_rate"] = round(st["hits"] / looked, 3) if looked else 0.0
+        st["ttl"] = dict(self.ttls)
+        return st
+
+
+_responses = ResponseCache()
+
+
+# --- 검색 (nextPageToken 페이지네이션) ---
+# /search/jql은 페이지당 최대 maxResults건을 주고 다음 페이지는 nextPageToken으로 이어받는다.
+SEARCH_PAGE_SIZE = int(os.getenv("JIRA_PAGE_SIZE", "100"))
+LIST_FIELDS = ["summary", "status", "priority", "updated", "issuetype"]
+
+# --- 필드 프로젝션 ---
+# Jira는 fields를 지정하지 않으면 모든 커스텀 필드를 돌려주므로, 포맷터가 실제로 쓰는 필드만 요청한다.
+FIELD_PRESETS = {
+    "minimal": ["summary", "status", "issuetype"],  # format_issue_row
+    "detail": ["summary", "status", "issuetype", "priority", "assignee", "updated", "description"],  # format_issue_detail
+    "full": ["*all"],
+}
+
+
+def resolve_fields(spec, default=None):
+    """필드 지정(프리셋 이름, 쉼표 구분 문자열, 목록)을 필드 목록으로. 비어 있으면 default."""
+    if not spec:
+        return list(default) if default else None
+    if isinstance(spec, str):
+        if spec.strip() in FIELD_PRESETS:
+            return list(FIELD_PRESETS[spec.strip()])
+        spec = spec.split(",")
+    return [f.strip() for f in spec if f.strip()]
 
 
-def my_issues(status=None, max_results=20):
-    """내게 할당된 이슈 목록 (기본: 미완료)"""
+def extra_fields(fields, preset):
+    """fields 중 preset 포맷터가 표시하지 않는 필드 (추가로 출력할 대상)."""
+    shown = set(FIELD_PRESETS[preset])
+    return [f for f in fields or [] if f not in shown and not f.startswith("*") and f not in ("key", "id")]
+
+
+def field_projection(spec, base, preset):
+    """출력용 필드 지정 → (요청할 필드, 추가로 출력할 필드).
+    프리셋 이름이면 그대로, 필드 목록이면 base(포맷터가 쓰는 필드)에 덧붙인다.
+    """
+    if isinstance(spec, str) and spec.strip() in FIELD_PRESETS:
+        return resolve_fields(spec), []
+    requested = resolve_fields(spec) or []
+    wanted = list(base) + [f for f in requested if f not in base]
+    return wanted, extra_fields(requested, preset)
+
+
+def _search_page(jql, fields, max_results, next_page_token=None, expand=None):
+    body = {"jql": jql, "maxResults": max_results, "fields": fields}
+    if next_page_token:
+        body["nextPageToken"] = next_page_token
+    if expand:
+        body["expand"] = expand
+    return api_post("/search/jql", json_data=body, idempotent=True)
+
+
+def iter_search(jql, fields=None, page_size=None, limit=None, prefetch=True, expand=None):
+    """JQL 검색 결과를 페이지 단위로 지연 로딩하는 제너레이터.
+    fields: 조회할 필드 (목록, 쉼표 구분 문자열 또는 프리셋 이름. 기본: 목록 출력용 필드)
+    expand: Jira expand 값 (예: "changelog,renderedFields")
+    page_size: 페이지당 요청 건수 (기본: JIRA_PAGE_SIZE 또는 100)
+    limit: 전체 최대 건수 (None이면 끝까지)
+    prefetch: True면 현재 페이지를 소비하는 동안 다음 페이지를 백그라운드로 미리 요청.
+    메모리에는 최대 두 페이지만 유지된다.
+    """
+    for issues, _ in iter_search_pages(jql, fields, page_size, limit, prefetch, expand):
+        yield from issues
+
+
+def iter_search_pages(jql, fields=None, page_size=None, limit=None, prefetch=True, expand=None, start_token=None):
+    """iter_search의 페이지 단위 버전. (이슈 목록, 다음 페이지 nextPageToken)을 차례로 내보낸다.
+    마지막 페이지의 토큰은 None. start_token을 주면 그 페이지부터 (중단된 내보내기 재개 등).
+    """
+    fields = resolve_fields(fields, LIST_FIELDS)
+    page_size = page_size or SEARCH_PAGE_SIZE
+    remaining = limit
+    if remaining is not None and remaining <= 0:
+        return
+
+    def page_len():
+        return page_size if remaining is None else min(page_size, remaining)
+
+    if prefetch:
+        from concurrent.futures import ThreadPoolExecutor
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        data = _search_page(jql, fields, page_len(), start_token, expand)
+        while True:
+            issues = data.get("issues", [])
+            token = data.get("nextPageToken")
+            if remaining is not None:
+                issues = issues[:remaining]
+                remaining -= len(issues)
+            more = bool(token) and not data.get("isLast") and bool(issues) and (remaining is None or remaining > 0)
+            for issue in issues:
+                _transitions.remember(issue)
+            pending = None
+            if more and executor:
+                # 미리 받는 요청도 --profile 단계 트리에서 이 검색 아래에 보이도록 현재 컨텍스트에서 실행
+                pending = executor.submit(contextvars.copy_context().run, _search_page, jql, fields, page_len(), token, expand)
+            yield issues, token if more else None
+            if not more:
+                return
+            data = pending.result() if pending else _search_page(jql, fields, page_len(), token, expand)
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# --- 여러 사이트 검색 (--site a,b,c) ---
+# 사이트마다 자기 세션·스레드에서 페이지를 받고, 여기서는 각 사이트의 정렬된 스트림을 JQL의 첫 ORDER BY 필드로 k-way 병합한다.
+# 첫 결과는 가장 느린 사이트의 첫 페이지가 도착하면 나온다 (사이트별 시간의 합이 아님).
+_ORDER_BY_RE = re.compile(r"\border\s+by\s+(.+)$", re.IGNORECASE | re.DOTALL)
+_ORDER_FIELD_ALIASES = {"resolved": "resolutiondate", "due": "duedate", "type": "issuetype", "issuekey": "key"}
+
+
+def order_by(jql):
+    """JQL의 첫 ORDER BY 필드와 내림차순 여부. 없으면 (None, False)."""
+    m = _ORDER_BY_RE.search(jql)
+    if not m:
+        return None, False
+    first = m.group(1).split(",")[0].split()
+    if not first:
+        return None, False
+    field = first[0].strip('"').lower()
+    return _ORDER_FIELD_ALIASES.get(field, field), len(first) > 1 and first[1].lower() == "desc"
+
+
+class _Desc:
+    """내림차순 병합용 정렬 키 (비교를 뒤집음)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _order_value(issue, field):
+    """정렬 필드 값을 사이트와 무관하게 비교할 수 있는 튜플로: (순위, 수, 문자열). 빈 값은 오름차순 끝."""
+    if field == "key":
+        project, _, n = (issue.get("key") or "").rpartition("-")
+        return (1, float(n) if n.isdigit() else 0.0, project)
+    value = (issue.get("fields") or {}).get(field)
+    if field == "priority" and isinstance(value, dict) and str(value.get("id", "")).isdigit():
+        return (1, -float(value["id"]), "")  # 기본 우선순위 체계는 id가 작을수록 높음
+    if isinstance(value, dict):
+        value = value.get("displayName") or value.get("name") or value.get("value") or value.get("key")
+    if value is None or value == "":
+        return (3, 0.0, "")
+    if isinstance(value, (int, float)):
+        return (1, float(value), "")
+    text = str(value)
+    if len(text) >= 19 and text[4:5] == "-" and text[10:11] == "T":
+        try:
+            return (1, datetime.strptime(text, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp(), "")
+        except ValueError:
+            pass
+    return (2, 0.0, text.casefold())
+
+
+def merge_key(field, desc):
+    """ORDER BY 필드로 병합할 때 쓸 key 함수. 필드가 없으면 모든 이슈가 같은 값 (병합이 안정적이므로 사이트 순서대로 이어 붙임)."""
+    if not field:
+        return lambda issue: 0
+    if desc:
+        return lambda issue: _Desc(_order_value(issue, field))
+    return lambda issue: _order_value(issue, field)
+
+
+def site_fields(jql, fields):
+    """병합에 필요한 ORDER BY 필드를 요청 필드에 덧붙임."""
+    field, _ = order_by(jql)
+    fields = resolve_fields(fields, LIST_FIELDS)
+    if field and field != "key" and field not in fields and "*all" not in fields:
+        fields = fields + [field]
+    return fields
+
+
+def iter_search_sites(jql, sites, fields=None, limit=None, page_size=None, expand=None):
+    """여러 사이트에서 같은 JQL을 동시에 검색해 ORDER BY 첫 필드 순으로 합친 제너레이터.
+    sites: 사이트 이름 목록 또는 'a,b,c'. 이슈마다 "site"(사이트 이름)를 붙인다.
+    사이트별 페이지는 큐(사이트당 최대 두 페이지)로 넘어오므로 메모리는 사이트 수 × 두 페이지.
+    ORDER BY가 없으면 사이트 순서대로 이어 붙인다.
+    """
+    import heapq
+    import queue
+    from concurrent.futures import ThreadPoolExecutor
+
+    sites = parse_sites(sites) if isinstance(sites, str) else [s if isinstance(s, Site) else get_site(s) for s in sites]
+    fields = site_fields(jql, fields)
+    field, desc = order_by(jql)
+    stop = threading.Event()
+    done = object()
+    queues = [queue.Queue(maxsize=2) for _ in sites]
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce(site, q):
+        _site.set(site)  # 복사한 컨텍스트 안이므로 이 스레드(와 그 안의 미리 받기)에만 적용
+        try:
+            for issues, _ in iter_search_pages(jql, fields=fields, page_size=page_size, limit=limit, expand=expand):
+                for issue in issues:
+                    issue["site"] = site.name
+                if not put(q, issues):
+                    return
+        except Exception as e:
+            put(q, SiteError(site.name, e))
+        finally:
+            put(q, done)
+
+    def drain(q):
+        while True:
+            item = q.get()
+            if item is done:
+                return
+            if isinstance(item, SiteError):
+                raise item
+            yield from item
+
+    executor = ThreadPoolExecutor(max_workers=len(sites)) if sites else None
+    try:
+        for site, q in zip(sites, queues):
+            executor.submit(contextvars.copy_context().run, produce, site, q)
+        merged = heapq.merge(*(drain(q) for q in queues), key=merge_key(field, desc))
+        for n, issue in enumerate(merged, 1):
+            yield issue
+            if limit is not None and n >= limit:
+                return
+    finally:
+        stop.set()
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _my_issues_jql(status=None):
     jql = "assignee = currentUser()"
     if status and status.lower() != "all":
         if status.lower() == "done":
@@ -78,19 +1261,26 @@ def my_issues(status=None, max_results=20):
             jql += " AND status != Done"
     else:
         jql += " AND status != Done"
-    jql += " ORDER BY updated DESC"
-    data = api_post("/search/jql", json_data={
-        "jql": jql,
-        "maxResults": max_results,
-        "fields": ["summary", "status", "priority", "updated", "issuetype"],
-    })
-    return data.get("issues", [])
+    return jql + " ORDER BY updated DESC"
+
 
+def iter_my_issues(status=None, limit=None, fields=None):
+    """내게 할당된 이슈를 페이지 단위로 스트리밍 (my_issues의 제너레이터 버전)."""
+    return iter_search(_my_issues_jql(status), limit=limit, fields=fields)
 
-def show_issue(issue_key):
-    """티켓 한 건 상세 조회"""
-    data = get_issue(issue_key)
-    print("\n" + format_issue_detail(data) + "\n")
+
+def my_issues(status=None, max_results=20, fields=None):
+    """내게 할당된 이슈 목록 (기본: 미완료). fields: 필드 목록 또는 프리셋 이름."""
+    return list(iter_my_issues(status, limit=max_results, fields=fields))
+
+
+def show_issue(issue_key, fields="detail", expand=None, max_chars=None):
+    """티켓 한 건 상세 조회. 기본적으로 상세 출력에 쓰는 필드만 요청하고, fields로 준 필드는 아래에 덧붙여 출력.
+    max_chars: 설명 최대 문자 수 (기본 JIRA_DESCRIPTION_MAX_CHARS, 0이면 제한 없음)
+    """
+    wanted, extra = field_projection(fields, FIELD_PRESETS["detail"], "detail")
+    data = get_issue(issue_key, fields=wanted, expand=expand)
+    print("\n" + format_issue_detail(data, extra=extra, max_chars=max_chars) + "\n")
     return data
 
 
@@ -105,15 +1295,289 @@ def transition_issue(issue_key, transition_id):
     api_post(f"/issue/{issue_key}/transitions", json_data={"transition": {"id": transition_id}})
 
 
-def start_issue(issue_key):
-    """티켓을 착수(In Progress) 상태로 전환. In Progress로 가는 전환만 적용."""
-    transitions = get_transitions(issue_key)
+def _find_progress_transition(transitions):
+    """전환 목록에서 In Progress로 가는 전환을 찾음. 반환: (transition, 목표 상태명) 또는 (None, None)"""
     for t in transitions:
         to_status = (t.get("to") or {}).get("name", "")
         if to_status and "progress" in to_status.lower():
+            return t, to_status
+    return None, None
+
+
+def _find_transition(transitions, target_status):
+    """전환 목록에서 목표 상태명에 맞는 전환을 찾음. 정확히 일치하는 상태명을 우선하고, 없으면 부분 일치.
+    반환: (transition, 목표 상태명) 또는 (None, None)
+    """
+    target_lower = (target_status or "").strip().lower()
+    partial = (None, None)
+    for t in transitions:
+        to_status = (t.get("to") or {}).get("name", "")
+        if not to_status:
+            continue
+        if to_status.lower() == target_lower:
+            return t, to_status
+        if partial[0] is None and target_lower in to_status.lower():
+            partial = (t, to_status)
+    return partial
+
+
+def _transition_choices(transitions):
+    return [((t.get("to") or {}).get("name", "?"), t.get("name", "")) for t in transitions]
+
+
+# --- 전환(transition) 캐시 ---
+# 가능한 전환은 (프로젝트, 이슈 타입, 현재 상태)에만 의존하므로 이 조합을 키로 캐시한다.
+# 이슈별로는 마지막으로 본 (프로젝트, 타입, 상태)만 기억해, 알려진 이슈는 전환 POST 한 번으로 끝난다.
+# 캐시된 전환 id를 Jira가 거부하면 해당 항목을 비우고 한 번 다시 조회한다.
+TRANSITION_CACHE_TTL = float(os.getenv("JIRA_TRANSITION_CACHE_TTL", "3600"))
+TRANSITION_CACHE_FILE = os.path.expanduser(os.getenv("JIRA_TRANSITION_CACHE_FILE", ""))
+
+
+def _atomic_write_json(path, data):
+    """임시 파일에 쓴 뒤 교체해, 동시에 읽는 프로세스가 반쯤 쓰인 파일을 보지 않도록 함."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+class TransitionCache:
+    """워크플로 전환 캐시 (메모리, 선택적으로 JSON 파일).
+    workflows: "PROJ|이슈타입|상태" → {"expires", "transitions", 목표 상태명(소문자) → 전환 인덱스}
+    issues: 이슈 키 → {"wf", "id", "status", "expires"} — 최근 MAX_ISSUES건만 유지
+    """
+
+    MAX_ISSUES = 5000
+
+    def __init__(self, ttl=TRANSITION_CACHE_TTL, path=None):
+        self.ttl = ttl
+        self.path = path or None
+        self._lock = threading.Lock()
+        self._workflows = {}
+        self._issues = OrderedDict()
+        self._loaded = not self.path
+        self._dirty = False
+
+    @staticmethod
+    def workflow_key(issue):
+        """이슈 데이터({"key", "fields": {issuetype, status}})에서 워크플로 키 생성. 필드가 없으면 None."""
+        fields = issue.get("fields") or {}
+        issuetype = fields.get("issuetype") or {}
+        status = fields.get("status") or {}
+        typ = issuetype.get("id") or issuetype.get("name")
+        st = status.get("id") or status.get("name")
+        if not (issue.get("key") and typ and st):
+            return None
+        return f"{issue['key'].rsplit('-', 1)[0]}|{typ}|{st}"
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for wf, entry in (data.get("workflows") or {}).items():
+            if entry.get("expires", 0) > now:
+                self._store(wf, entry.get("transitions") or [], entry["expires"])
+        for key, entry in (data.get("issues") or {}).items():
+            if entry.get("expires", 0) > now:
+                self._issues[key] = entry
+
+    def _store(self, wf, transitions, expires):
+        by_name = {}
+        for t in transitions:
+            name = ((t.get("to") or {}).get("name") or "").lower()
+            if name and name not in by_name:
+                by_name[name] = t
+        self._workflows[wf] = {"expires": expires, "transitions": transitions, "by_name": by_name}
+
+    def remember(self, issue):
+        """검색·조회 결과로 이슈의 현재 워크플로 위치를 기록."""
+        if current_site() is not _default_site:
+            return  # 다른 사이트(--site) 이슈는 키가 겹칠 수 있으므로 기본 사이트 것만 기록
+        wf = self.workflow_key(issue)
+        if not wf:
+            return
+        status = ((issue.get("fields") or {}).get("status") or {}).get("name")
+        with self._lock:
+            self._load()
+            self._set_issue(issue["key"], wf, issue.get("id"), status)
+
+    def _set_issue(self, issue_key, wf, issue_id, status):
+        self._issues[issue_key] = {"wf": wf, "id": issue_id, "status": status, "expires": time.time() + self.ttl}
+        self._issues.move_to_end(issue_key)
+        while len(self._issues) > self.MAX_ISSUES:
+            self._issues.popitem(last=False)
+        self._dirty = True
+
+    def context(self, issue_key):
+        """마지막으로 본 이슈 위치 {"wf", "id", "status", "expires"} 또는 None"""
+        with self._lock:
+            self._load()
+            entry = self._issues.get(issue_key)
+            if not entry or entry["expires"] <= time.time():
+                return None
+            return entry
+
+    def get(self, wf):
+        """캐시된 전환 목록 (없거나 만료되면 None)"""
+        with self._lock:
+            self._load()
+            entry = self._workflows.get(wf)
+            if entry and entry["expires"] <= time.time():
+                entry = None
+        _cache_event("transitions", entry is not None)
+        return entry["transitions"] if entry else None
+
+    def put(self, wf, transitions):
+        with self._lock:
+            self._load()
+            self._store(wf, transitions, time.time() + self.ttl)
+            self._dirty = True
+
+    def find(self, wf, target_status):
+        """목표 상태명으로 전환 찾기: 정확히 일치하는 이름은 인덱스로, 없으면 부분 일치. 반환: (transition, 목표 상태명)"""
+        with self._lock:
+            entry = self._workflows.get(wf)
+        if not entry:
+            return None, None
+        t = entry["by_name"].get((target_status or "").strip().lower())
+        if t:
+            return t, t["to"]["name"]
+        return _find_transition(entry["transitions"], target_status)
+
+    def moved(self, issue_key, transition_id):
+        """전환 성공 후 이슈의 워크플로 위치를 전환의 목표 상태로 갱신 (알 수 없으면 이슈 항목 삭제)."""
+        entry = self.context(issue_key)
+        if not entry:
+            return
+        with self._lock:
+            wf_entry = self._workflows.get(entry["wf"]) or {}
+            t = next((t for t in wf_entry.get("transitions", []) if t.get("id") == transition_id), None)
+            to = (t or {}).get("to") or {}
+            st = to.get("id") or to.get("name")
+            if st:
+                project, typ, _ = entry["wf"].split("|", 2)
+                self._set_issue(issue_key, f"{project}|{typ}|{st}", entry["id"], to.get("name"))
+            else:
+                self._issues.pop(issue_key, None)
+                self._dirty = True
+
+    def invalidate(self, wf=None, issue_key=None):
+        with self._lock:
+            if wf:
+                self._workflows.pop(wf, None)
+            if issue_key:
+                self._issues.pop(issue_key, None)
+            self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._workflows.clear()
+            self._issues.clear()
+            self._dirty = True
+
+    def save(self):
+        """변경 사항이 있으면 파일에 기록 (path가 없으면 아무것도 하지 않음)."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "workflows": {
+                    wf: {"expires": e["expires"], "transitions": e["transitions"]}
+                    for wf, e in self._workflows.items()
+                },
+                "issues": dict(self._issues),
+            }
+            self._dirty = False
+        try:
+            _atomic_write_json(self.path, data)
+        except OSError:
+            pass
+
+
+_transitions = TransitionCache(path=TRANSITION_CACHE_FILE)
+
+
+def _lookup_transitions(issue_key, refresh=False):
+    """이슈의 가능한 전환을 캐시에서 찾고, 없으면 한 번의 요청으로 현재 상태와 전환을 함께 조회.
+    반환: (워크플로 키, 전환 목록, 캐시 사용 여부, {"id": 이슈 id, "status": 현재 상태명})
+    """
+    if not refresh:
+        entry = _transitions.context(issue_key)
+        transitions = _transitions.get(entry["wf"]) if entry else None
+        if transitions is not None:
+            return entry["wf"], transitions, True, {"id": entry.get("id"), "status": entry.get("status")}
+    data = api_get(f"/issue/{issue_key}", params={"fields": "issuetype,status", "expand": "transitions"})
+    _transitions.remember(data)
+    wf = TransitionCache.workflow_key(data)
+    transitions = data.get("transitions", [])
+    if wf:
+        _transitions.put(wf, transitions)
+    status = ((data.get("fields") or {}).get("status") or {}).get("name")
+    return wf, transitions, False, {"id": data.get("id"), "status": status}
+
+
+def _is_rejected_transition(e):
+    return e.response is not None and e.response.status_code in (400, 404, 409)
+
+
+def _transition_with_cache(issue_key, pick):
+    """pick(전환 목록) → (transition, 목표 상태명)으로 고른 전환을 실행.
+    캐시된 정보로 고를 수 없거나 Jira가 거부하면 캐시를 비우고 새로 조회해 한 번 더 시도.
+    반환: (목표 상태명 또는 None, 마지막으로 본 전환 목록)
+    """
+    refresh = False
+    while True:
+        wf, transitions, cached, _ = _lookup_transitions(issue_key, refresh=refresh)
+        t, to_status = pick(wf, transitions)
+        if not t:
+            if cached:
+                refresh = True
+                continue
+            return None, transitions
+        try:
             transition_issue(issue_key, t["id"])
-            return to_status
-    return None
+        except requests.HTTPError as e:
+            if cached and _is_rejected_transition(e):
+                _transitions.invalidate(wf, issue_key)
+                refresh = True
+                continue
+            raise
+        _transitions.moved(issue_key, t["id"])
+        return to_status, transitions
+
+
+def _pick_target(target_status):
+    """_transition_with_cache용 선택 함수: 목표 상태명을 워크플로 캐시 인덱스에서 먼저 찾음."""
+    def pick(wf, transitions):
+        t, to_status = _transitions.find(wf, target_status) if wf else (None, None)
+        if t is None:
+            t, to_status = _find_transition(transitions, target_status)
+        return t, to_status
+    return pick
+
+
+def cached_transitions(issue_key):
+    """이슈의 가능한 전환 목록 (캐시에 있으면 요청 없이 반환)."""
+    return _lookup_transitions(issue_key)[1]
+
+
+def start_issue(issue_key):
+    """티켓을 착수(In Progress) 상태로 전환. In Progress로 가는 전환만 적용."""
+    to_status, _ = _transition_with_cache(
+        issue_key, lambda wf, transitions: _find_progress_transition(transitions)
+    )
+    _transitions.save()
+    return to_status
 
 
 def transition_to_status(issue_key, target_status):
@@ -121,51 +1585,712 @@ def transition_to_status(issue_key, target_status):
     target_status: 목표 상태명 (예: In Progress, Resolved, Closed). 부분 일치 지원.
     반환: (성공여부, 메시지)
     """
-    transitions = get_transitions(issue_key)
-    target_lower = (target_status or "").strip().lower()
-    if not target_lower:
-        available = [((t.get("to") or {}).get("name", "?"), t.get("name", "")) for t in transitions]
-        return False, f"target_status를 지정해주세요. 가능한 전환: {available}"
-    for t in transitions:
-        to_status = (t.get("to") or {}).get("name", "")
-        if to_status and (target_lower in to_status.lower() or to_status.lower() == target_lower):
-            transition_issue(issue_key, t["id"])
-            return True, f"{issue_key} → {to_status} 로 변경되었습니다."
-    available = [((t.get("to") or {}).get("name", "?"), t.get("name", "")) for t in transitions]
-    return False, f"'{target_status}'로 전환할 수 없습니다. 가능한 전환: {available}"
+    if not (target_status or "").strip():
+        return False, f"target_status를 지정해주세요. 가능한 전환: {_transition_choices(cached_transitions(issue_key))}"
+    to_status, transitions = _transition_with_cache(issue_key, _pick_target(target_status))
+    _transitions.save()
+    if to_status:
+        return True, f"{issue_key} → {to_status} 로 변경되었습니다."
+    return False, f"'{target_status}'로 전환할 수 없습니다. 가능한 전환: {_transition_choices(transitions)}"
+
+
+# --- 메타데이터 저장소 ---
+# 자주 바뀌지 않는 사이트 메타데이터(/myself, 프로젝트, 이슈 타입, 우선순위, 상태)를 로컬 파일에 보관해
+# 매 명령마다 조회 요청을 보내지 않는다. CLI와 MCP 서버가 동시에 써도 되도록 파일 잠금 아래에서 갱신한다.
+META_FILE = os.path.expanduser(os.getenv("JIRA_META_FILE", "~/.config/jira-helper/meta.json"))
+META_TTLS = {
+    "myself": 7 * 86400,
+    "projects": 86400,
+    "issuetypes": 86400,
+    "priorities": 86400,
+    "statuses": 86400,
+}
+
+
+@contextmanager
+def _file_lock(path, exclusive):
+    """프로세스 간 파일 잠금 (path + '.lock'). fcntl이 없는 플랫폼에서는 잠금 없이 진행."""
+    if fcntl is None:
+        yield
+        return
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class MetadataStore:
+    """사이트별 메타데이터 저장소. 파일 구조: {"<base_url>|<email>": {이름: {"value", "expires"}}}
+    항목마다 TTL(META_TTLS)이 있고, 만료되면 다음 조회 때 다시 가져온다.
+    """
 
+    def __init__(self, path=META_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mem = {}
 
-def search(jql, max_results=20):
-    """JQL로 검색"""
-    data = api_post("/search/jql", json_data={
-        "jql": jql,
-        "maxResults": max_results,
-        "fields": ["summary", "status", "priority", "updated", "issuetype"],
+    @staticmethod
+    def site_key():
+        site = current_site()
+        return f"{site.base_url}|{site.email or ''}"
+
+    def _read_file(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def entry(self, name):
+        """유효한 항목 {"value", "expires"} 또는 None (메모리 → 파일 순)."""
+        now = time.time()
+        site = self.site_key()
+        with self._lock:
+            entry = self._mem.get((site, name))
+            if entry is None or entry["expires"] <= now:
+                try:
+                    with _file_lock(self.path, exclusive=False):
+                        entry = self._read_file().get(site, {}).get(name)
+                except OSError:
+                    entry = None
+                if entry:
+                    self._mem[(site, name)] = entry
+        if entry and entry.get("expires", 0) > now:
+            return entry
+        return None
+
+    def peek(self, name):
+        entry = self.entry(name)
+        _cache_event("meta", entry is not None)
+        return entry["value"] if entry else None
+
+    def put(self, name, value, ttl=None):
+        entry = {"value": value, "expires": time.time() + (ttl or META_TTLS.get(name, 86400))}
+        site = self.site_key()
+        with self._lock:
+            self._mem[(site, name)] = entry
+            try:
+                with _file_lock(self.path, exclusive=True):
+                    data = self._read_file()
+                    data.setdefault(site, {})[name] = entry
+                    _atomic_write_json(self.path, data)
+            except OSError:
+                pass  # 저장에 실패해도 이 프로세스에서는 메모리 값으로 계속 동작
+        return value
+
+    def get(self, name):
+        """캐시된 값을 반환하고, 없거나 만료됐으면 Jira에서 가져와 저장."""
+        value = self.peek(name)
+        if value is None:
+            value = self.put(name, _META_FETCHERS[name]())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._mem.clear()
+            try:
+                with _file_lock(self.path, exclusive=True):
+                    data = self._read_file()
+                    if data.pop(self.site_key(), None) is not None:
+                        _atomic_write_json(self.path, data)
+            except OSError:
+                pass
+
+
+def _myself_summary(me):
+    return {k: me.get(k) for k in ("accountId", "displayName", "emailAddress", "timeZone")}
+
+
+def _fetch_projects():
+    projects = []
+    start = 0
+    while True:
+        data = api_get("/project/search", params={"startAt": start, "maxResults": 50})
+        values = data.get("values", [])
+        projects.extend({"id": p.get("id"), "key": p.get("key"), "name": p.get("name")} for p in values)
+        start += len(values)
+        if data.get("isLast", True) or not values:
+            return projects
+
+
+_META_FETCHERS = {
+    "myself": lambda: _myself_summary(api_get("/myself")),
+    "projects": _fetch_projects,
+    "issuetypes": lambda: [
+        {"id": t.get("id"), "name": t.get("name"), "subtask": t.get("subtask", False)}
+        for t in api_get("/issuetype")
+    ],
+    "priorities": lambda: [{"id": p.get("id"), "name": p.get("name")} for p in api_get("/priority")],
+    "statuses": lambda: [
+        {"id": s.get("id"), "name": s.get("name"), "category": (s.get("statusCategory") or {}).get("key")}
+        for s in api_get("/status")
+    ],
+}
+
+_meta = MetadataStore()
+
+
+def get_metadata(name):
+    """메타데이터 조회 (myself, projects, issuetypes, priorities, statuses). 저장소에 있으면 요청 없음."""
+    return _meta.get(name)
+
+
+def get_account_id():
+    """현재 사용자 accountId (저장소 캐시 사용)."""
+    return get_metadata("myself").get("accountId")
+
+
+def refresh_metadata(names=None):
+    """메타데이터를 Jira에서 다시 가져와 저장. 반환: {이름: 항목 수}"""
+    out = {}
+    for name in names or META_TTLS:
+        value = _meta.put(name, _META_FETCHERS[name]())
+        out[name] = len(value) if isinstance(value, list) else 1
+    return out
+
+
+# --- 사용자 디렉터리 ---
+# 담당자를 이름·이메일로 지정할 수 있도록 사이트 사용자 목록(/users/search)을 로컬 파일에 두고, 메모리에
+# 정확 일치 dict와 접두어 색인(정렬된 토큰 목록 + bisect)을 만들어 이름 → accountId를 요청 없이 찾는다.
+# 목록은 USERS_TTL마다 다시 받고(실패하면 저장된 목록 사용), 목록에 없는 이름만 /user/search로 조회한다.
+USERS_FILE = os.path.expanduser(os.getenv("JIRA_USERS_FILE", "~/.config/jira-helper/users.json"))
+USERS_TTL = int(os.getenv("JIRA_USERS_TTL", "86400"))
+_USERS_PAGE = 1000
+_USERS_RETRY = 60  # 목록 갱신에 실패하면 다시 시도하기까지의 간격(초)
+_SELF_NAMES = frozenset({"me", "@me", "나"})
+_NAME_SPLIT = re.compile(r"[\s._\-+()@,]+")
+
+
+class UserLookupError(ValueError):
+    """담당자를 한 명으로 정할 수 없음 (없음 또는 후보 여럿). candidates: 후보 사용자 목록."""
+
+    def __init__(self, message, candidates=None):
+        super().__init__(message)
+        self.candidates = candidates or []
+
+
+def _user_summary(user):
+    return {
+        "accountId": user.get("accountId"),
+        "displayName": user.get("displayName") or "",
+        "emailAddress": user.get("emailAddress") or "",
+    }
+
+
+def _is_person(user):
+    """담당자로 지정할 수 있는 사용자 (앱·비활성 계정 제외)."""
+    return user.get("accountType", "atlassian") == "atlassian" and user.get("active", True) and user.get("accountId")
+
+
+def format_user(user):
+    email = user.get("emailAddress")
+    return f"{user.get('displayName')} <{email}>" if email else f"{user.get('displayName')} ({user.get('accountId')})"
+
+
+class UserIndex:
+    """사용자 목록의 메모리 색인.
+    exact: 표시 이름·이메일(소문자)·accountId → 사용자 번호, tokens: 정렬된 (토큰, 사용자 번호) — 접두어는 bisect로 찾음.
+    """
+
+    def __init__(self, users):
+        self.users = users
+        self.exact = {}
+        pairs = []
+        for i, u in enumerate(users):
+            name, email = u["displayName"].casefold(), u["emailAddress"].casefold()
+            for key in (u["accountId"], name, email):
+                if key:
+                    self.exact.setdefault(key, []).append(i)
+            words = set(_NAME_SPLIT.split(name)) | {name}
+            if email:
+                words |= set(_NAME_SPLIT.split(email.split("@", 1)[0])) | {email}
+            pairs.extend((w, i) for w in words if w)
+        pairs.sort()
+        self.tokens = [w for w, _ in pairs]
+        self.owners = [i for _, i in pairs]
+
+    def prefix(self, word):
+        """word로 시작하는 토큰(이름 단어, 이메일)이 있는 사용자 번호 집합."""
+        out = set()
+        pos = bisect.bisect_left(self.tokens, word)
+        while pos < len(self.tokens) and self.tokens[pos].startswith(word):
+            out.add(self.owners[pos])
+            pos += 1
+        return out
+
+    def match(self, query):
+        """query에 맞는 사용자 목록. 정확 일치 → 모든 단어가 접두어로 일치 → 이름에 포함·유사한 이름 순으로,
+        처음 결과가 나온 단계의 사용자만 반환.
+        """
+        q = query.strip().casefold()
+        if not q:
+            return []
+        hit = self.exact.get(query.strip()) or self.exact.get(q)
+        if hit:
+            return [self.users[i] for i in hit]
+        words = [w for w in _NAME_SPLIT.split(q) if w]
+        if words:
+            found = self.prefix(words[0])
+            for w in words[1:]:
+                if not found:
+                    break
+                found &= self.prefix(w)
+            if found:
+                return [self.users[i] for i in sorted(found)]
+        # 한글 이름 일부("민수"), 오타("Jiwno Park"): 표시 이름 전체와 비교
+        found = [u for u in self.users if q in u["displayName"].casefold()]
+        if found:
+            return found
+        import difflib
+
+        names = {}
+        for u in self.users:
+            names.setdefault(u["displayName"].casefold(), []).append(u)
+        return [u for name in difflib.get_close_matches(q, list(names), n=5, cutoff=0.8) for u in names[name]]
+
+
+class UserDirectory:
+    """사이트별 사용자 목록 파일 + 메모리 색인. 파일 구조: {"<base_url>|<email>": {"fetched", "users": [...]}}
+    fetched가 USERS_TTL보다 오래됐으면 다음 조회 때 다시 받고, 받지 못하면(오프라인 등) 저장된 목록으로 계속 찾는다.
+    """
+
+    def __init__(self, path=USERS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._index = {}  # 사이트 → (fetched, UserIndex)
+
+    def _read_file(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _load(self, site):
+        try:
+            with _file_lock(self.path, exclusive=False):
+                entry = self._read_file().get(site) or {}
+        except OSError:
+            entry = {}
+        return entry.get("fetched", 0), UserIndex(entry.get("users") or [])
+
+    def _store(self, site, fetched, users):
+        index = UserIndex(users)
+        with self._lock:
+            self._index[site] = (fetched, index)
+            try:
+                with _file_lock(self.path, exclusive=True):
+                    data = self._read_file()
+                    data[site] = {"fetched": fetched, "users": users}
+                    _atomic_write_json(self.path, data)
+            except OSError:
+                pass  # 저장에 실패해도 이 프로세스에서는 메모리 색인으로 계속 동작
+        return index
+
+    def cached(self):
+        """저장된 (받은 시각, 색인). 요청 없음."""
+        site = MetadataStore.site_key()
+        with self._lock:
+            if site not in self._index:
+                self._index[site] = self._load(site)
+            return self._index[site]
+
+    def index(self):
+        """조회용 색인. 목록이 없거나 USERS_TTL이 지났으면 다시 받음 (실패하면 저장된 목록, 그것도 없으면 예외)."""
+        fetched, index = self.cached()
+        _cache_event("users", time.time() - fetched <= USERS_TTL)
+        if time.time() - fetched > USERS_TTL:
+            try:
+                index = self.refresh()
+            except requests.RequestException:
+                if not index.users:
+                    raise
+                log.debug("사용자 목록 갱신 실패, 저장된 목록(%d명) 사용", len(index.users))
+                with self._lock:  # 조회마다 다시 시도하지 않도록 잠시 미룸
+                    self._index[MetadataStore.site_key()] = (time.time() - USERS_TTL + _USERS_RETRY, index)
+        return index
+
+    def refresh(self):
+        """사이트 사용자 전체를 /users/search로 다시 받아 저장. 반환: 새 색인"""
+        users = []
+        start = 0
+        while True:
+            page = api_get("/users/search", params={"startAt": start, "maxResults": _USERS_PAGE})
+            users.extend(_user_summary(u) for u in page if _is_person(u))
+            start += len(page)
+            if len(page) < _USERS_PAGE:
+                break
+        return self._store(MetadataStore.site_key(), time.time(), users)
+
+    def remember(self, found):
+        """실시간 조회로 찾은 사용자를 목록에 추가 (다음부터는 요청 없이 찾음)."""
+        fetched, index = self.cached()
+        known = {u["accountId"] for u in index.users}
+        new = [u for u in found if u["accountId"] not in known]
+        if new:
+            self._store(MetadataStore.site_key(), fetched, index.users + new)
+
+    def clear(self):
+        with self._lock:
+            self._index.clear()
+            try:
+                with _file_lock(self.path, exclusive=True):
+                    data = self._read_file()
+                    if data.pop(MetadataStore.site_key(), None) is not None:
+                        _atomic_write_json(self.path, data)
+            except OSError:
+                pass
+
+
+_users = UserDirectory()
+
+
+def find_users(query):
+    """로컬 사용자 디렉터리에서 query(이름·이메일·accountId)에 맞는 사용자 목록. 요청 없음."""
+    return _users.cached()[1].match(query)
+
+
+def refresh_users():
+    """사용자 디렉터리를 다시 받아 저장. 반환: 사용자 수"""
+    return len(_users.refresh().users)
+
+
+def _search_users_live(query):
+    try:
+        found = api_get("/user/search", params={"query": query, "maxResults": 50})
+    except requests.RequestException as e:
+        raise UserLookupError(f"'{query}' 사용자를 로컬 디렉터리에서 찾지 못했고 Jira 조회도 실패했습니다: {e}") from e
+    return [_user_summary(u) for u in found if _is_person(u)]
+
+
+def _pick_user(query, matches):
+    if len(matches) == 1:
+        return matches[0]["accountId"]
+    if not matches:
+        raise UserLookupError(f"'{query}'에 해당하는 사용자가 없습니다.")
+    names = ", ".join(format_user(u) for u in matches[:5])
+    more = f" 외 {len(matches) - 5}명" if len(matches) > 5 else ""
+    raise UserLookupError(f"'{query}'에 해당하는 사용자가 {len(matches)}명입니다: {names}{more}. 이메일로 지정해주세요.", matches)
+
+
+def resolve_user(name):
+    """담당자 이름·이메일·accountId → accountId. 'me'는 현재 사용자.
+    로컬 사용자 디렉터리에서 찾고, 없을 때만 Jira /user/search로 조회해 디렉터리에 추가한다.
+    없거나 후보가 여럿이면 UserLookupError.
+    """
+    query = (name or "").strip()
+    if not query:
+        raise UserLookupError("담당자를 지정해주세요.")
+    if query.casefold() in _SELF_NAMES:
+        return get_account_id()
+    try:
+        matches = _users.index().match(query)
+    except requests.RequestException:
+        matches = []  # 목록을 받지 못했고 저장된 것도 없음 → 실시간 조회로
+    if not matches:
+        found = _search_users_live(query)
+        _users.remember(found)
+        matches = UserIndex(found).match(query) or found
+    return _pick_user(query, matches)
+
+
+def _assignee_account_id(assign_to_self=False, assignee=None):
+    """create/update의 담당자 인자 → accountId 또는 None."""
+    if assignee and assign_to_self:
+        raise ValueError("assign_to_self와 assignee는 함께 지정할 수 없습니다.")
+    if assignee:
+        return resolve_user(assignee)
+    return get_account_id() if assign_to_self else None
+
+
+# --- 일괄 전환 ---
+BULK_WORKERS = int(os.getenv("JIRA_BULK_WORKERS", "8"))
+BULK_TRANSITION_CHUNK = 1000  # /bulk/issues/transition 요청당 최대 이슈 수
+BULK_POLL_INTERVAL = 1.0
+BULK_POLL_TIMEOUT = 600
+_BULK_TASK_DONE = frozenset({"COMPLETE", "FAILED", "CANCELLED", "DEAD"})
+
+
+def parse_issue_keys(text):
+    """공백·쉼표·줄바꿈으로 구분된 이슈 키 목록을 파싱 (대문자화, 중복 제거, 순서 유지)."""
+    keys = []
+    seen = set()
+    for tok in text.replace(",", " ").split():
+        key = tok.strip().upper()
+        if key and key not in seen:
+            seen.add(key)
+            keys.append(key)
+    return keys
+
+
+def _resolve_bulk_transition(issue_key, target_status):
+    """이슈 한 건의 현재 상태와 목표 상태로 가는 전환을 확인 (전환 캐시에 있으면 요청 없음).
+    반환: 결과 dict (ok=False면 error에 사유)
+    """
+    result = {"key": issue_key, "ok": False}
+    try:
+        wf, transitions, _, info = _lookup_transitions(issue_key)
+    except requests.HTTPError as e:
+        result["error"] = str(e)
+        return result
+    # 전환 캐시는 기본 사이트·워크플로 키가 있는 이슈만 기록하므로 id는 조회 결과에서 받는다
+    result["id"] = info["id"]
+    result["from"] = info["status"]
+    t, to_status = _pick_target(target_status)(wf, transitions)
+    if not t:
+        result["error"] = f"'{target_status}'로 전환할 수 없습니다. 가능한 전환: {_transition_choices(transitions)}"
+        return result
+    result.update(ok=True, to=to_status, transition_id=t["id"])
+    return result
+
+
+def _apply_single_transition(resolved, target_status):
+    """건별 전환. 캐시된 전환이 거부되면 다시 조회해 재시도."""
+    key = resolved["key"]
+    try:
+        to_status, transitions = _transition_with_cache(key, _pick_target(target_status))
+    except requests.HTTPError as e:
+        return dict(resolved, ok=False, error=str(e))
+    if not to_status:
+        return dict(resolved, ok=False, error=f"'{target_status}'로 전환할 수 없습니다. 가능한 전환: {_transition_choices(transitions)}")
+    return dict(resolved, ok=True, to=to_status)
+
+
+def _submit_bulk_transitions(resolved):
+    """/bulk/issues/transition으로 전환을 제출하고 작업이 끝날 때까지 폴링. 반환: 이슈별 결과 목록.
+    Jira가 실패로 알려 준 이슈(failedAccessibleIssues)만 retry=True (건별 재시도 대상). 폴링 시간이 지나도
+    작업이 진행 중이면 남은 이슈는 서버에서 아직 전환될 수 있으므로 재시도하지 않고 작업 id와 함께 실패로 돌려준다.
+    처리 결과는 이슈 id와 키 둘 다로 맞춰 보고, id를 모르는 이슈가 결과에 없으면 실패로 단정하지 않는다.
+    """
+    groups = {}
+    for r in resolved:
+        groups.setdefault(r["transition_id"], []).append(r["key"])
+    data = api_post("/bulk/issues/transition", json_data={
+        "bulkTransitionInputs": [
+            {"selectedIssueIdsOrKeys": keys, "transitionId": tid} for tid, keys in groups.items()
+        ],
+        "sendBulkNotification": False,
     })
-    return data.get("issues", [])
+    task_id = data.get("taskId")
+    if not task_id:
+        raise RuntimeError(f"일괄 전환 응답에 작업 id(taskId)가 없습니다: {data}")
+    deadline = time.monotonic() + BULK_POLL_TIMEOUT
+    task = {}
+    while time.monotonic() < deadline:
+        task = api_get(f"/bulk/queue/{task_id}")
+        if task.get("status") in _BULK_TASK_DONE:
+            break
+        time.sleep(BULK_POLL_INTERVAL)
+    processed = {str(i) for i in task.get("processedAccessibleIssues") or []}
+    failed = {str(k): v for k, v in (task.get("failedAccessibleIssues") or {}).items()}
+    out = []
+    for r in resolved:
+        ids = [str(i) for i in (r.get("id"), r["key"]) if i is not None]
+        failed_as = next((i for i in ids if i in failed), None)
+        if any(i in processed for i in ids):
+            out.append(r)
+        elif failed_as is not None:
+            out.append(dict(r, ok=False, retry=True, error="; ".join(map(str, failed[failed_as]))))
+        elif task.get("status") not in _BULK_TASK_DONE:
+            out.append(dict(r, ok=False, error=(
+                f"일괄 작업 {task_id}이 {BULK_POLL_TIMEOUT}초 안에 끝나지 않았습니다 (상태: {task.get('status', '?')}, 아직 진행 중일 수 있음). "
+                f"확인: GET /rest/api/3/bulk/queue/{task_id}"
+            )))
+        elif r.get("id") is None:
+            out.append(dict(r, ok=False, error=(
+                f"이슈 id를 알 수 없어 일괄 작업 {task_id}의 처리 결과와 맞춰 볼 수 없습니다 (전환됐을 수 있음). "
+                f"확인: GET /rest/api/3/bulk/queue/{task_id}"
+            )))
+        else:
+            out.append(dict(r, ok=False, error=f"일괄 작업 {task_id} 상태: {task.get('status')}, 처리 결과에 없음"))
+    for r in resolved:  # 제출 뒤 폴링하는 동안 캐시된 응답은 전환 전 상태일 수 있음
+        _responses.invalidate(r["key"])
+    return out
 
 
-def _load_required_fields_config():
-    """필수 커스텀 필드 기본값 설정 로드. env → cwd/config → 패키지 내 config 순."""
+def transition_bulk(issue_keys, target_status, workers=None, dry_run=False, use_bulk_api=True):
+    """여러 이슈를 같은 목표 상태로 전환. 결과를 이슈별 dict로 완료되는 대로 yield.
+    결과: {"key", "ok", "from", "to", "transition_id", "error", ...}
+    workers: 동시 작업 수 (기본 JIRA_BULK_WORKERS 또는 8)
+    dry_run: True면 전환 가능 여부만 확인하고 실제로 변경하지 않음
+    use_bulk_api: True면 Jira 일괄 전환 API를 사용하고, 지원하지 않는 사이트(404/405)면 건별 전환으로 대체
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    workers = max(1, workers or BULK_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_resolve_bulk_transition, k, target_status) for k in issue_keys]
+        if dry_run or not use_bulk_api:
+            # 건별 모드: 조회가 끝난 이슈부터 바로 전환 작업을 이어서 제출
+            applied = []
+            for fut in as_completed(futures):
+                r = fut.result()
+                if not r["ok"]:
+                    yield r
+                elif dry_run:
+                    yield dict(r, dry_run=True)
+                else:
+                    applied.append(executor.submit(_apply_single_transition, r, target_status))
+            for fut in as_completed(applied):
+                yield fut.result()
+            _transitions.save()
+            return
+
+        ready = []
+        for fut in as_completed(futures):
+            r = fut.result()
+            if r["ok"]:
+                ready.append(r)
+            else:
+                yield r
+        try:
+            for start in range(0, len(ready), BULK_TRANSITION_CHUNK):
+                chunk = ready[start:start + BULK_TRANSITION_CHUNK]
+                try:
+                    results = _submit_bulk_transitions(chunk)
+                except requests.HTTPError as e:
+                    if e.response is None or e.response.status_code not in (404, 405):
+                        raise
+                    # 일괄 전환 API 미지원: 나머지 전부 건별로 전환
+                    for fut in as_completed([executor.submit(_apply_single_transition, r, target_status) for r in ready[start:]]):
+                        yield fut.result()
+                    return
+                retry = []
+                for r in results:
+                    if r["ok"]:
+                        _transitions.moved(r["key"], r["transition_id"])
+                        yield r
+                    elif r.pop("retry", False):
+                        # Jira가 실패로 알려 준 이슈: 캐시된 상태가 낡았을 수 있으므로 캐시를 비우고 건별로 한 번 더 시도
+                        _transitions.invalidate(issue_key=r["key"])
+                        r.pop("error", None)
+                        retry.append(executor.submit(_apply_single_transition, r, target_status))
+                    else:
+                        yield r  # 시간 초과 등: 서버 작업이 아직 전환할 수 있으므로 재시도하지 않음
+                for fut in as_completed(retry):
+                    yield fut.result()
+        finally:
+            _transitions.save()
+
+
+def format_bulk_result(result):
+    """transition_bulk 결과 한 건을 한 줄로 포맷."""
+    key = result["key"]
+    if not result["ok"]:
+        return f"  {key:12} 실패  {result.get('error', '')}"
+    label = "예정" if result.get("dry_run") else "완료"
+    return f"  {key:12} {label}  {result.get('from') or '?'} → {result.get('to')}"
+
+
+def search(jql, max_results=20, fields=None, expand=None):
+    """JQL로 검색. max_results가 한 페이지보다 크면 다음 페이지까지 이어서 가져온다.
+    fields: 필드 목록 또는 프리셋 이름 (minimal, detail, full). 기본: 목록 출력용 필드.
+    """
+    return list(iter_search(jql, limit=max_results, fields=fields, expand=expand))
+
+
+# --- 집계 (count, stats) ---
+# 건수만 필요하면 /search/approximate-count (이슈 본문 없음). 그룹별 건수는 그룹 필드 하나만 요청해
+# 페이지를 받는 대로 세고 버리므로 메모리는 그룹 수에 비례한다.
+GROUP_BY_FIELDS = ("status", "assignee", "priority", "issuetype")
+# 필드가 하나뿐이면 Jira가 페이지당 더 많이 돌려준다 (상한 5000)
+GROUP_PAGE_SIZE = 1000
+
+
+def count_issues(jql):
+    """JQL 결과 건수 (근사치, /search/approximate-count). 최근 변경은 반영이 늦을 수 있다."""
+    return api_post("/search/approximate-count", json_data={"jql": jql}, idempotent=True).get("count", 0)
+
+
+def group_label(issue, group_by):
+    """이슈의 group_by 필드 값을 표시용 이름으로. 비어 있으면 (미할당)/(없음)."""
+    value = (issue.get("fields") or {}).get(group_by)
+    if not value:
+        return "(미할당)" if group_by == "assignee" else "(없음)"
+    if isinstance(value, dict):
+        return value.get("displayName") or value.get("name") or value.get("value") or value.get("id") or "?"
+    return str(value)
+
+
+def _check_group_by(group_by):
+    if group_by not in GROUP_BY_FIELDS:
+        raise ValueError(f"group_by는 {', '.join(GROUP_BY_FIELDS)} 중 하나여야 합니다: {group_by}")
+
+
+def _sorted_counts(counts):
+    return sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+def group_counts(jql, group_by="status", limit=None):
+    """JQL 결과를 group_by(status, assignee, priority, issuetype) 값별로 센다.
+    반환: [(값, 건수)] 건수 내림차순
+    """
+    _check_group_by(group_by)
+    counts = {}
+    for issues, _ in iter_search_pages(jql, fields=[group_by], page_size=GROUP_PAGE_SIZE, limit=limit):
+        for issue in issues:
+            label = group_label(issue, group_by)
+            counts[label] = counts.get(label, 0) + 1
+    return _sorted_counts(counts)
+
+
+def format_group_counts(rows, group_by):
+    """group_counts 결과를 표로 (값, 건수, 비율)."""
+    total = sum(n for _, n in rows)
+    width = max([len(group_by)] + [len(label) for label, _ in rows])
+    lines = [f"{group_by:<{width}}  {'건수':>7}  {'비율':>6}"]
+    for label, n in rows:
+        lines.append(f"{label:<{width}}  {n:>7,}  {n * 100 / total:>5.1f}%")
+    lines.append(f"{'합계':<{width}}  {total:>7,}")
+    return "\n".join(lines)
+
+
+_required_fields_cache = {}  # 경로 → (mtime_ns, 설정)
+
+
+def _required_fields_path():
+    """필수 커스텀 필드 설정 파일 경로. env → cwd/config → 패키지 내 config 순. 없으면 None."""
     env_path = os.getenv("JIRA_REQUIRED_FIELDS")
     if env_path and os.path.isfile(env_path):
-        with open(env_path, encoding="utf-8") as f:
-            return json.load(f)
+        return env_path
     for base in (Path.cwd(), Path(__file__).resolve().parent):
         path = base / "config" / "required_fields.json"
         if path.is_file():
-            with open(path, encoding="utf-8") as f:
-                return json.load(f)
-    return {}
+            return str(path)
+    return None
+
 
+def _load_required_fields_config():
+    """필수 커스텀 필드 기본값 설정 로드. 파일 수정 시각이 그대로면 이전에 읽은 값을 재사용 (수정하지 말 것)."""
+    path = _required_fields_path()
+    if path is None:
+        return {}
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _required_fields_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    _required_fields_cache[path] = (mtime, config)
+    return config
 
-def _get_default_custom_fields(project_key, issuetype, description=None):
+
+def _get_default_custom_fields(project_key, issuetype, description=None, config=None):
     """
     프로젝트/이슈타입에 대한 필수 커스텀 필드 기본값을 반환.
     __from_description__: 플레인 텍스트로 치환.
     __from_description_adf__: ADF(Atlassian Document Format)로 치환 (textarea 커스텀 필드용).
+    config: 이미 읽어 둔 설정 (일괄 생성 시 파일을 한 번만 읽도록). 없으면 파일에서 로드.
     """
-    config = _load_required_fields_config()
+    if config is None:
+        config = _load_required_fields_config()
     proj = config.get((project_key or "").strip().upper(), {})
     defaults = proj.get((issuetype or "").strip(), {})
     if not defaults:
@@ -183,24 +2308,17 @@ def _get_default_custom_fields(project_key, issuetype, description=None):
     return out
 
 
-def _description_to_adf(plain_text):
-    """플레인 텍스트를 Jira Cloud ADF(Atlassian Document Format)로 변환."""
-    if not (plain_text or plain_text.strip()):
-        return None
-    text = plain_text.strip()
-    # 한 줄이면 paragraph 하나, 여러 줄이면 줄마다 paragraph
-    blocks = []
-    for line in text.split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        blocks.append({
-            "type": "paragraph",
-            "content": [{"type": "text", "text": line}],
-        })
-    if not blocks:
-        return None
-    return {"type": "doc", "version": 1, "content": blocks}
+# 생성·수정 시 설명 해석 방식: markdown(목록·제목·코드 블록·표·강조를 ADF로) 또는 plain(줄마다 문단)
+DESCRIPTION_FORMAT = os.getenv("JIRA_DESCRIPTION_FORMAT", "markdown").strip().lower()
+
+
+def _description_to_adf(text):
+    """설명 텍스트를 Jira Cloud ADF(Atlassian Document Format)로 변환. 빈 텍스트면 None.
+    JIRA_DESCRIPTION_FORMAT=plain이면 Markdown을 해석하지 않고 줄마다 문단 하나.
+    """
+    if DESCRIPTION_FORMAT == "plain":
+        return jira_adf.from_plain_text(text)
+    return jira_adf.from_markdown(text)
 
 
 def create_issue(
@@ -210,16 +2328,30 @@ def create_issue(
     description=None,
     assign_to_self=False,
     custom_fields=None,
+    assignee=None,
 ):
     """티켓을 생성하고 생성된 이슈 키를 반환.
     project_key: 프로젝트 키 (예: PROJ)
     summary: 제목
     issuetype: 이슈 타입 이름 (예: Task, Bug, Story). 기본 Task.
-    description: 본문 플레인 텍스트 (선택)
+    description: 본문 텍스트, Markdown 해석 (선택)
     assign_to_self: True면 현재 사용자에게 담당자 지정
     custom_fields: 프로젝트별 필수 커스텀 필드 { "customfield_12345": value } (선택)
+    assignee: 담당자 이름·이메일·accountId (사용자 디렉터리에서 찾음, 선택)
     반환: (issue_key, browse_url) 또는 실패 시 예외.
+    보내기 전에 캐시된 createmeta로 필드를 검증하고, 문제가 있으면 CreateValidationError (요청 없음).
     """
+    account_id = _assignee_account_id(assign_to_self, assignee)
+    fields = _build_create_fields(project_key, summary, issuetype, description, custom_fields, account_id)
+    preflight_create(fields)
+    data = api_post("/issue", json_data={"fields": fields})
+    key = data.get("key")
+    url = f"{JIRA_BASE_URL}/browse/{key}" if key else ""
+    return key, url
+
+
+def _build_create_fields(project_key, summary, issuetype, description, custom_fields, account_id=None, config=None):
+    """create_issue 요청 본문의 fields 구성 (동기/비동기 공용)."""
     fields = {
         "project": {"key": project_key.strip().upper()},
         "summary": summary.strip(),
@@ -229,27 +2361,389 @@ def create_issue(
         adf = _description_to_adf(description)
         if adf:
             fields["description"] = adf
-    if assign_to_self:
-        me = api_get("/myself")
-        fields["assignee"] = {"accountId": me.get("accountId")}
+    if account_id:
+        fields["assignee"] = {"accountId": account_id}
     # 프로젝트/이슈타입별 필수 커스텀 필드 기본값 적용 (config/required_fields.json)
-    default_custom = _get_default_custom_fields(project_key, issuetype, description)
+    default_custom = _get_default_custom_fields(project_key, issuetype, description, config=config)
     if default_custom:
         fields.update(default_custom)
     if custom_fields:
         fields.update(custom_fields)
-    data = api_post("/issue", json_data={"fields": fields})
-    key = data.get("key")
-    url = f"{JIRA_BASE_URL}/browse/{key}" if key else ""
-    return key, url
+    return fields
+
+
+# --- 생성 전 검증 (createmeta) ---
+# 프로젝트·이슈 타입별 생성 화면 필드(필수 여부, 허용 옵션)를 메타데이터 저장소에 캐시해 두고,
+# 생성 요청을 보내기 전에 로컬에서 검사한다. 400 응답을 받고 나서야 고치는 왕복을 줄이기 위함.
+CREATEMETA_TTL = int(os.getenv("JIRA_CREATEMETA_TTL", "86400"))
+CREATE_PREFLIGHT = os.getenv("JIRA_CREATE_PREFLIGHT", "1").strip().lower() not in ("0", "false", "no")
+_CREATEMETA_PAGE = 50
+_ALWAYS_SETTABLE = frozenset({"project", "issuetype"})
+_CREATEMETA_RECHECK = 60  # 검증 실패 시 createmeta를 다시 받는 최소 간격(초)
+_createmeta_checked = {}  # (프로젝트, 이슈 타입 id) → 마지막으로 새로 받은 시각
+
+
+class CreateValidationError(ValueError):
+    """생성 전 로컬 검증 실패 (Jira에 요청을 보내지 않음). problems: 필드별 문제 목록."""
+
+    def __init__(self, message, problems=None):
+        super().__init__(message)
+        self.problems = problems or [message]
+
+
+def _createmeta_name(project_key, issuetype_id=None):
+    name = f"createmeta:{project_key.strip().upper()}"
+    return f"{name}:{issuetype_id}" if issuetype_id else name
+
+
+def _createmeta_values(data):
+    """createmeta 페이지 응답의 항목 목록 (버전에 따라 issueTypes/fields/values/results)."""
+    for key in ("issueTypes", "fields", "values", "results"):
+        if isinstance(data.get(key), list):
+            return data[key]
+    return []
+
+
+def _compact_createmeta_field(f):
+    """createmeta 필드 → 검증·출력에 필요한 부분만."""
+    schema = f.get("schema") or {}
+    allowed = f.get("allowedValues")
+    return {
+        "id": f.get("fieldId") or f.get("key"),
+        "name": f.get("name"),
+        "required": bool(f.get("required")),
+        "default": bool(f.get("hasDefaultValue")),
+        "type": schema.get("type"),
+        "items": schema.get("items"),
+        "allowed": None if allowed is None else [
+            {"id": str(v.get("id")), "name": v.get("value") or v.get("name")} for v in allowed
+        ],
+    }
+
+
+def _fetch_createmeta_pages(path):
+    items = []
+    start = 0
+    while True:
+        data = api_get(path, params={"startAt": start, "maxResults": _CREATEMETA_PAGE})
+        values = _createmeta_values(data)
+        items.extend(values)
+        start += len(values)
+        if not values or start >= data.get("total", 0):
+            return items
+
+
+def _pick_createmeta_type(project_key, issuetype, types):
+    """프로젝트 이슈 타입 목록에서 이름(대소문자 무시) 또는 id로 찾음. 없으면 CreateValidationError."""
+    wanted = (issuetype or "").strip().lower()
+    for t in types:
+        if wanted in (str(t["id"]), (t["name"] or "").lower()):
+            return t
+    names = ", ".join(t["name"] for t in types) or "(없음)"
+    raise CreateValidationError(f"{project_key.upper()} 프로젝트에 '{issuetype}' 이슈 타입이 없습니다. 가능한 타입: {names}")
+
+
+def get_createmeta_types(project_key, refresh=False):
+    """프로젝트에서 생성 가능한 이슈 타입 [{"id", "name"}] (저장소 캐시). 반환: (목록, 캐시 여부)"""
+    name = _createmeta_name(project_key)
+    types = None if refresh else _meta.peek(name)
+    if types is not None:
+        return types, True
+    raw = _fetch_createmeta_pages(f"/issue/createmeta/{quote(project_key.strip().upper())}/issuetypes")
+    return _meta.put(name, [{"id": str(t.get("id")), "name": t.get("name")} for t in raw], ttl=CREATEMETA_TTL), False
+
+
+def get_createmeta(project_key, issuetype, refresh=False):
+    """프로젝트·이슈 타입의 생성 화면 필드. 메타데이터 저장소에 JIRA_CREATEMETA_TTL 동안 캐시.
+    반환: {"project", "issuetype": {"id", "name"}, "fields": {필드 id: {"name", "required", "allowed", ...}},
+           "cached": 요청 없이 저장소에서 읽었는지}
+    """
+    project_key = project_key.strip().upper()
+    types, cached = get_createmeta_types(project_key, refresh)
+    itype = _pick_createmeta_type(project_key, issuetype, types)
+    fields_name = _createmeta_name(project_key, itype["id"])
+    fields = None if refresh else _meta.peek(fields_name)
+    if fields is None:
+        cached = False
+        raw = _fetch_createmeta_pages(f"/issue/createmeta/{quote(project_key)}/issuetypes/{itype['id']}")
+        fields = _meta.put(fields_name, [_compact_createmeta_field(f) for f in raw], ttl=CREATEMETA_TTL)
+        _createmeta_checked[(project_key, itype["id"])] = time.time()
+    return {"project": project_key, "issuetype": itype, "fields": {f["id"]: f for f in fields}, "cached": cached}
+
+
+def _option_label(allowed, limit=15):
+    shown = ", ".join(f"{o['id']}={o['name']}" for o in allowed[:limit])
+    return shown + (f" 외 {len(allowed) - limit}개" if len(allowed) > limit else "")
+
+
+def _check_field_value(meta_field, value):
+    """허용 옵션·배열 여부 검사. 반환: 문제 설명 또는 None."""
+    if meta_field["type"] == "array" and not isinstance(value, list):
+        return "배열([...])로 지정해야 합니다."
+    if meta_field["type"] not in ("array", None) and isinstance(value, list):
+        return "배열이 아닌 단일 값으로 지정해야 합니다."
+    allowed = meta_field.get("allowed")
+    if not allowed:
+        return None
+    ids = {o["id"] for o in allowed}
+    names = {o["name"] for o in allowed}
+    for v in value if isinstance(value, list) else [value]:
+        if not isinstance(v, dict):
+            continue
+        if "id" in v and str(v["id"]) not in ids:
+            return f"허용되지 않는 옵션 id {v['id']}."
+        label = v.get("value", v.get("name"))
+        if "id" not in v and label is not None and label not in names:
+            return f"허용되지 않는 옵션 '{label}'."
+    return None
+
+
+def validate_create_fields(fields, meta):
+    """생성할 fields를 createmeta와 대조. 반환: 문제 목록 (비었으면 통과)."""
+    problems = []
+    known = meta["fields"]
+    for fid, f in known.items():
+        if f["required"] and not f["default"] and fid not in fields and fid not in _ALWAYS_SETTABLE:
+            hint = f" 허용: {_option_label(f['allowed'])}" if f.get("allowed") else ""
+            problems.append(f"{fid} ({f['name']}): 필수 필드가 없습니다.{hint}")
+    for fid, value in fields.items():
+        if fid in _ALWAYS_SETTABLE:
+            continue
+        f = known.get(fid)
+        if f is None:
+            problems.append(f"{fid}: 이 프로젝트·이슈 타입의 생성 화면에 없는 필드입니다.")
+            continue
+        issue = _check_field_value(f, value)
+        if issue:
+            hint = f" 허용: {_option_label(f['allowed'])}" if f.get("allowed") else ""
+            problems.append(f"{fid} ({f['name']}): {issue}{hint}")
+    return problems
+
+
+def _validation_error(meta, problems):
+    head = f"{meta['project']} {meta['issuetype']['name']} 생성 전 검증 실패 (요청을 보내지 않았습니다):"
+    tail = f"허용 값 확인: jira fields {meta['project']} \"{meta['issuetype']['name']}\""
+    return CreateValidationError("\n".join([head] + [f"  - {p}" for p in problems] + [tail]), problems)
+
+
+def _needs_recheck(meta):
+    """캐시된 createmeta로 검증에 실패했을 때 새로 받아 볼지 (화면 설정이 바뀌었을 수 있음).
+    같은 타입은 _CREATEMETA_RECHECK초에 한 번만 (일괄 생성에서 실패 행마다 다시 받지 않도록).
+    """
+    last = _createmeta_checked.get((meta["project"], meta["issuetype"]["id"]), 0)
+    return meta["cached"] and time.time() - last > _CREATEMETA_RECHECK
 
 
-def update_issue(issue_key, summary=None, description=None, assign_to_self=False):
+def preflight_create(fields):
+    """create_issue 요청 전에 fields를 로컬 검증. 문제가 있으면 CreateValidationError.
+    createmeta를 가져오지 못하면(권한·네트워크) 검증을 건너뛰고 Jira에 맡긴다.
+    """
+    if not CREATE_PREFLIGHT:
+        return
+    project = fields["project"]["key"]
+    issuetype = fields["issuetype"]["name"]
+    try:
+        meta = get_createmeta(project, issuetype)
+    except (requests.RequestException, ValueError) as e:
+        if isinstance(e, CreateValidationError):
+            raise
+        log.debug("createmeta 조회 실패, 생성 전 검증 생략: %s", e)
+        return
+    problems = validate_create_fields(fields, meta)
+    if problems and _needs_recheck(meta):
+        meta = get_createmeta(project, issuetype, refresh=True)
+        problems = validate_create_fields(fields, meta)
+    if problems:
+        raise _validation_error(meta, problems)
+
+
+def format_createmeta(meta, config=None):
+    """jira fields 출력: 필드별 필수 여부·타입·허용 옵션·config 기본값."""
+    config = _load_required_fields_config() if config is None else config
+    defaults = config.get(meta["project"], {}).get(meta["issuetype"]["name"], {})
+    lines = [f"\n{meta['project']} / {meta['issuetype']['name']} (id {meta['issuetype']['id']})", ""]
+    ordered = sorted(meta["fields"].values(), key=lambda f: (not f["required"], f["id"] not in defaults, f["id"]))
+    for f in ordered:
+        mark = "필수" if f["required"] and not f["default"] else ("필수*" if f["required"] else "    ")
+        typ = f["type"] + (f"<{f['items']}>" if f.get("items") else "") if f["type"] else "?"
+        line = f"  {mark:4} {f['id']:20} {typ:16} {f['name']}"
+        if f["id"] in defaults:
+            line += f"  [config 기본값: {json.dumps(defaults[f['id']], ensure_ascii=False)}]"
+        lines.append(line)
+        if f.get("allowed"):
+            lines.append(f"  {'':4} {'':20} 허용: {_option_label(f['allowed'], limit=50)}")
+    lines.append("\n필수* = Jira 기본값이 있는 필수 필드")
+    return "\n".join(lines)
+
+
+# --- 일괄 생성 ---
+BULK_CREATE_CHUNK = 50  # /issue/bulk 요청당 최대 이슈 수 (Jira 제한)
+_ROW_TRUE = frozenset({"1", "true", "yes", "y", "o"})
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in _ROW_TRUE
+
+
+def _normalize_row(raw):
+    """입력 행(dict)을 create_issue 인자 형태로 정리. 필수 값이 없으면 ValueError."""
+    project = (raw.get("project") or raw.get("project_key") or "").strip()
+    summary = (raw.get("summary") or "").strip()
+    if not project or not summary:
+        raise ValueError("project와 summary는 필수입니다.")
+    custom_fields = dict(raw.get("custom_fields") or {})
+    for k, v in raw.items():
+        if k.startswith("customfield_") and v not in (None, ""):
+            if isinstance(v, str):
+                try:
+                    v = json.loads(v)
+                except ValueError:
+                    pass
+            custom_fields[k] = v
+    return {
+        "project_key": project,
+        "summary": summary,
+        "issuetype": (raw.get("issuetype") or raw.get("type") or "Task").strip(),
+        "description": raw.get("description") or None,
+        "assign_to_self": _parse_bool(raw.get("assign_to_self", raw.get("assign_me"))),
+        "assignee": str(raw.get("assignee") or "").strip() or None,
+        "custom_fields": custom_fields or None,
+    }
+
+
+def iter_issue_rows(fp, fmt="jsonl"):
+    """JSONL 또는 CSV 파일에서 생성할 이슈 행을 하나씩 읽음.
+    반환: (행 번호, 정리된 dict 또는 None, 오류 메시지 또는 None)
+    CSV 열: project, summary, issuetype, description, assign_me, assignee(이름·이메일), customfield_XXXXX(값은 JSON이면 파싱)
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(fp)
+        for raw in reader:
+            try:
+                yield reader.line_num, _normalize_row(raw), None
+            except ValueError as e:
+                yield reader.line_num, None, str(e)
+        return
+    for line_no, line in enumerate(fp, 1):
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+            if not isinstance(raw, dict):
+                raise ValueError("JSON 객체가 아닙니다.")
+            yield line_no, _normalize_row(raw), None
+        except ValueError as e:
+            yield line_no, None, str(e)
+
+
+def _bulk_error_message(err):
+    element = err.get("elementErrors") or {}
+    msgs = list(element.get("errorMessages") or [])
+    msgs += [f"{k}: {v}" for k, v in (element.get("errors") or {}).items()]
+    return "; ".join(msgs) or f"HTTP {err.get('status', '?')}"
+
+
+def _post_bulk_create(chunk):
+    """chunk: [(행 번호, summary, fields)] → 행별 결과 목록. 부분 실패 시 실패한 행만 오류로 표시."""
+    try:
+        data = api_post("/issue/bulk", json_data={"issueUpdates": [{"fields": f} for _, _, f in chunk]})
+    except requests.HTTPError as e:
+        # 전부 실패하면 400과 함께 같은 형태(errors)의 본문이 옴
+        try:
+            data = e.response.json()
+        except ValueError:
+            data = None
+        if not isinstance(data, dict) or "errors" not in data:
+            return [{"row": row, "ok": False, "summary": summary, "error": str(e)} for row, summary, _ in chunk]
+    failed = {err.get("failedElementNumber"): _bulk_error_message(err) for err in data.get("errors") or []}
+    created = iter(data.get("issues") or [])
+    out = []
+    for idx, (row, summary, _) in enumerate(chunk):
+        if idx in failed:
+            out.append({"row": row, "ok": False, "summary": summary, "error": failed[idx]})
+            continue
+        issue = next(created, None)
+        if issue is None:
+            out.append({"row": row, "ok": False, "summary": summary, "error": "응답에 생성 결과가 없습니다."})
+        else:
+            key = issue.get("key")
+            out.append({"row": row, "ok": True, "summary": summary, "key": key, "url": f"{JIRA_BASE_URL}/browse/{key}"})
+    return out
+
+
+def create_issues_bulk(rows, chunk_size=BULK_CREATE_CHUNK, assignee=None):
+    """iter_issue_rows의 행을 최대 chunk_size건씩 /issue/bulk로 생성. 결과를 행별 dict로 순서대로 yield.
+    결과: {"row", "ok", "summary", "key", "url"} 또는 {"row", "ok": False, "error"}
+    assignee: 담당자를 정하지 않은 행(assign_me·assignee 없음)에 쓸 기본 담당자 이름
+    필수 필드 설정(config/required_fields.json)은 한 번만 읽고, accountId는 메타데이터 저장소·사용자 디렉터리를 사용
+    (같은 담당자 이름은 한 번만 찾음). 행마다 캐시된 createmeta로 먼저 검증해, 실패한 행은 보내지 않고 바로 오류로 돌려준다.
+    """
+    chunk_size = max(1, min(chunk_size, BULK_CREATE_CHUNK))
+    config = _load_required_fields_config()
+    account_ids = {}  # (assign_to_self, 담당자 이름) → accountId
+    chunk = []
+    for row, args, error in rows:
+        if error:
+            yield {"row": row, "ok": False, "error": error}
+            continue
+        who = (args["assign_to_self"], args.get("assignee") or (None if args["assign_to_self"] else assignee))
+        try:
+            if who not in account_ids:
+                account_ids[who] = _assignee_account_id(*who)
+        except ValueError as e:
+            yield {"row": row, "ok": False, "summary": args["summary"], "error": str(e)}
+            continue
+        fields = _build_create_fields(
+            args["project_key"],
+            args["summary"],
+            args["issuetype"],
+            args["description"],
+            args["custom_fields"],
+            account_ids[who],
+            config=config,
+        )
+        try:
+            preflight_create(fields)
+        except CreateValidationError as e:
+            yield {"row": row, "ok": False, "summary": args["summary"], "error": "생성 전 검증 실패: " + "; ".join(e.problems)}
+            continue
+        chunk.append((row, args["summary"], fields))
+        if len(chunk) >= chunk_size:
+            yield from _post_bulk_create(chunk)
+            chunk = []
+    if chunk:
+        yield from _post_bulk_create(chunk)
+
+
+def format_create_result(result):
+    """create_issues_bulk 결과 한 건을 한 줄로 포맷."""
+    if result["ok"]:
+        return f"  {result['row']:>5}행  {result['key']:12} {result.get('summary', '')[:50]}"
+    return f"  {result['row']:>5}행  실패  {result.get('error', '')}"
+
+
+_UPDATE_NO_FIELDS_MSG = "변경할 필드를 지정해주세요. (--summary, --description, --assign-me, --assignee 중 하나 이상)"
+
+
+def update_issue(issue_key, summary=None, description=None, assign_to_self=False, assignee=None):
     """티켓 필드를 수정합니다. 지정한 필드만 변경됩니다.
     summary: 제목 (None이면 변경 안 함)
-    description: 본문 플레인 텍스트 (None이면 변경 안 함)
+    description: 본문 텍스트, Markdown 해석 (None이면 변경 안 함)
     assign_to_self: True면 담당자를 현재 사용자로 설정
+    assignee: 담당자 이름·이메일·accountId (사용자 디렉터리에서 찾음, None이면 변경 안 함)
     """
+    account_id = _assignee_account_id(assign_to_self, assignee)
+    fields = _build_update_fields(summary, description, account_id)
+    if not fields:
+        return False, _UPDATE_NO_FIELDS_MSG
+    api_put(f"/issue/{issue_key}", json_data={"fields": fields})
+    return True, f"{issue_key} 수정되었습니다."
+
+
+def _build_update_fields(summary=None, description=None, account_id=None):
+    """update_issue 요청 본문의 fields 구성 (동기/비동기 공용)."""
     fields = {}
     if summary is not None:
         fields["summary"] = summary.strip()
@@ -257,63 +2751,189 @@ def update_issue(issue_key, summary=None, description=None, assign_to_self=False
         adf = _description_to_adf(description)
         if adf:
             fields["description"] = adf
-    if assign_to_self:
-        me = api_get("/myself")
-        fields["assignee"] = {"accountId": me.get("accountId")}
-    if not fields:
-        return False, "변경할 필드를 지정해주세요. (--summary, --description, --assign-me 중 하나 이상)"
-    api_put(f"/issue/{issue_key}", json_data={"fields": fields})
-    return True, f"{issue_key} 수정되었습니다."
+    if account_id:
+        fields["assignee"] = {"accountId": account_id}
+    return fields
 
 
-def print_issue_list(issues):
-    if not issues:
+def print_issue_list(issues, extra=None):
+    """이슈 목록 출력. 제너레이터(iter_search 등)를 넘기면 페이지가 도착하는 대로 한 줄씩 출력.
+    반환: 출력한 건수
+    """
+    count = 0
+    for i in issues:
+        print(format_issue_row(i, extra))
+        count += 1
+    if not count:
         print("결과 없음.")
-        return
-    print(format_issue_list(issues))
+    return count
+
+
+def format_issue_row(issue, extra=None):
+    """이슈 한 건을 목록용 한 줄로 포맷. extra: 뒤에 덧붙일 추가 필드 이름 목록."""
+    f = issue.get("fields", {})
+    summary = (f.get("summary") or "")[:50]
+    status = (f.get("status") or {}).get("name", "?")
+    typ = (f.get("issuetype") or {}).get("name", "?")
+    line = f"  {issue['key']:12} {status:12} {typ:10} {summary}"
+    if issue.get("site"):
+        line = f"  {issue['site']:8}" + line
+    for name in extra or []:
+        line += f"  | {name}={format_field_value(f.get(name), 40)}"
+    return line
+
+
+def format_field_value(value, limit=200):
+    """임의 필드 값을 짧은 텍스트로 (옵션·사용자·ADF·목록 등)."""
+    if value is None:
+        return "—"
+    if isinstance(value, dict):
+        if value.get("type") == "doc":
+            text = adf_to_text(value, budget=limit).strip().replace("\n", " ")
+        else:
+            text = str(next((value[k] for k in ("displayName", "name", "value", "key") if value.get(k)), "")) or json.dumps(value, ensure_ascii=False)
+    elif isinstance(value, list):
+        text = ", ".join(format_field_value(v, limit) for v in value)
+    else:
+        text = str(value)
+    return text if len(text) <= limit else text[: limit - 1] + "…"
 
 
-def format_issue_list(issues):
-    """이슈 목록을 문자열로 포맷 (MCP 등에서 재사용)."""
+def format_issue_list(issues, extra=None):
+    """이슈 목록을 문자열로 포맷 (MCP 등에서 재사용). extra: 행마다 덧붙일 추가 필드."""
     if not issues:
         return "결과 없음."
-    lines = []
-    for i in issues:
-        key = i["key"]
-        f = i.get("fields", {})
-        summary = (f.get("summary") or "")[:50]
-        status = (f.get("status") or {}).get("name", "?")
-        typ = (f.get("issuetype") or {}).get("name", "?")
-        lines.append(f"  {key:12} {status:12} {typ:10} {summary}")
-    return "\n".join(lines)
+    return "\n".join(format_issue_row(i, extra) for i in issues)
+
+
+def _issue_params(fields=None, expand=None):
+    params = {}
+    fields = resolve_fields(fields)
+    if fields:
+        params["fields"] = ",".join(fields)
+    if expand:
+        params["expand"] = expand
+    return params or None
+
+
+def get_issue(issue_key, fields=None, expand=None):
+    """티켓 한 건 raw 데이터 조회 (출력 없음, MCP 등에서 재사용).
+    fields: 필드 목록 또는 프리셋 이름 (minimal, detail, full). 없으면 Jira 기본(전체 필드).
+    expand: Jira expand 값 (예: "changelog")
+    """
+    data = api_get(f"/issue/{issue_key}", params=_issue_params(fields, expand))
+    _transitions.remember(data)
+    return data
+
+
+# --- 여러 이슈 한 번에 조회 ---
+# 키마다 /issue/{key}를 부르는 대신 key in (...) JQL 하나로 JIRA_SHOW_BATCH건씩 가져온다 (N건 → ceil(N/묶음)회).
+SHOW_BATCH = min(int(os.getenv("JIRA_SHOW_BATCH", "50")), 100)  # /search/jql maxResults 상한 100
+
+
+def _key_chunks(keys):
+    return [keys[i:i + SHOW_BATCH] for i in range(0, len(keys), SHOW_BATCH)]
 
 
-def get_issue(issue_key):
-    """티켓 한 건 raw 데이터 조회 (출력 없음, MCP 등에서 재사용)."""
-    return api_get(f"/issue/{issue_key}")
+def _keys_jql(keys):
+    return "key in (" + ", ".join(f'"{k}"' for k in keys) + ")"
 
 
-def format_issue_detail(data):
-    """이슈 상세를 문자열로 포맷 (MCP 등에서 재사용)."""
+def _missing_keys(response, keys):
+    """400 응답 오류 메시지에 나온 키. key in (...)에 없거나 볼 권한이 없는 키가 있으면 Jira는 쿼리 전체를 거부한다."""
+    if response is None or response.status_code != 400:
+        return set()
+    try:
+        data = response.json()
+    except ValueError:
+        return set()
+    text = " ".join(list(data.get("errorMessages") or []) + [str(v) for v in (data.get("errors") or {}).values()]).upper()
+    return {k for k in keys if f"'{k}'" in text or f'"{k}"' in text}
+
+
+def _fetch_key_chunk(keys, fields, expand):
+    """키 한 묶음을 key in (...)로 조회. 없는 키 때문에 거부되면 그 키를 빼고 다시. 반환: (이슈 목록, 없는 키 집합)"""
+    missing = set()
+    while keys:
+        try:
+            data = _search_page(_keys_jql(keys), fields, len(keys), expand=expand)
+        except requests.HTTPError as e:
+            bad = _missing_keys(e.response, keys)
+            if not bad:
+                raise
+            missing |= bad
+            keys = [k for k in keys if k not in bad]
+            continue
+        return data.get("issues", []), missing
+    return [], missing
+
+
+def _match_requested(keys, chunks):
+    """묶음 조회 결과를 요청한 키에 맞춤. 반환: (키 → 이슈, 없는 키 집합, 결과에 없던 키 — 이동된 이슈 등)"""
+    by_key, missing = {}, set()
+    for issues, gone in chunks:
+        missing |= gone
+        for issue in issues:
+            _transitions.remember(issue)
+            by_key[issue["key"].upper()] = issue
+    unmatched = [k for k in keys if k not in by_key and k not in missing]
+    return by_key, missing, unmatched
+
+
+def get_issues(issue_keys, fields=None, expand=None):
+    """여러 티켓을 key in (...) 묶음으로 조회 (출력 없음, MCP 등에서 재사용). 키는 중복 제거·대문자화.
+    fields: 필드 목록 또는 프리셋 이름 (기본: detail)
+    반환: (요청 키 → 이슈 dict, 요청 순서), 없거나 볼 권한이 없는 키 목록(요청 순서))
+    결과에 없던 키(다른 프로젝트로 이동된 이슈 등)만 /issue/{key}로 한 번 더 확인한다.
+    """
+    keys = parse_issue_keys(" ".join(issue_keys))
+    fields = resolve_fields(fields, FIELD_PRESETS["detail"])
+    chunks = _key_chunks(keys)
+    if len(chunks) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(len(chunks), BULK_WORKERS)) as executor:
+            ctx = contextvars.copy_context()
+            results = list(executor.map(lambda c: ctx.copy().run(_fetch_key_chunk, c, fields, expand), chunks))
+    else:
+        results = [_fetch_key_chunk(c, fields, expand) for c in chunks]
+    by_key, missing, unmatched = _match_requested(keys, results)
+    for key in unmatched:
+        try:
+            by_key[key] = get_issue(key, fields=fields, expand=expand)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            missing.add(key)
+    return {k: by_key[k] for k in keys if k in by_key}, [k for k in keys if k in missing]
+
+
+def adf_to_text(raw_desc, budget=None, markdown=False):
+    """설명 필드(ADF 또는 문자열)를 텍스트로 변환 (목록·코드 블록·표·멘션 등 전체 노드).
+    budget: 최대 문자 수. 넘으면 거기서 순회를 멈추고 끝에 …를 붙임.
+    markdown: True면 Markdown 문법으로 (제목, 목록 기호, ``` 코드 블록, 표, 강조, 링크).
+    """
+    return jira_adf.to_text(raw_desc, budget=budget, markdown=markdown)
+
+
+# 상세 보기(show, MCP jira_show)에서 설명을 보여줄 최대 문자 수. 0이면 제한 없음
+DESCRIPTION_MAX_CHARS = int(os.getenv("JIRA_DESCRIPTION_MAX_CHARS", "4000"))
+
+
+def format_issue_detail(data, extra=None, max_chars=None):
+    """이슈 상세를 문자열로 포맷 (MCP 등에서 재사용). extra: 상세 아래에 덧붙일 추가 필드 이름 목록.
+    설명은 Markdown으로 렌더링하고 max_chars(기본 JIRA_DESCRIPTION_MAX_CHARS, 0이면 제한 없음)에서 자른다.
+    """
     fields = data.get("fields", {})
-    status = fields.get("status", {}).get("name", "?")
+    status = (fields.get("status") or {}).get("name", "?")
     summary = fields.get("summary", "")
-    issue_type = fields.get("issuetype", {}).get("name", "?")
-    priority = fields.get("priority", {}).get("name", "—")
+    issue_type = (fields.get("issuetype") or {}).get("name", "?")
+    priority = (fields.get("priority") or {}).get("name", "—")
     assignee = (fields.get("assignee") or {}).get("displayName", "—")
-    updated = fields.get("updated", "")[:10]
-    raw_desc = fields.get("description")
-    desc_text = ""
-    if isinstance(raw_desc, str):
-        desc_text = raw_desc
-    elif isinstance(raw_desc, dict):
-        desc = raw_desc.get("content", [])
-        for block in desc:
-            if block.get("type") == "paragraph":
-                for c in block.get("content", []):
-                    if c.get("type") == "text":
-                        desc_text += c.get("text", "")
-                desc_text += "\n"
+    updated = (fields.get("updated") or "")[:10]
+    if max_chars is None:
+        max_chars = DESCRIPTION_MAX_CHARS
+    desc_text, truncated = jira_adf.render(fields.get("description"), budget=max_chars or None, markdown=True)
     lines = [
         f"[{data['key']}] {summary}",
         f"  타입: {issue_type}  |  상태: {status}  |  우선순위: {priority}",
@@ -323,26 +2943,191 @@ def format_issue_detail(data):
     if desc_text.strip():
         lines.append("\n--- 설명 ---")
         lines.append(desc_text.strip())
+        if truncated:
+            lines.append(f"{jira_adf.TRUNCATED} (설명이 길어 앞 {max_chars:,}자만 표시)")
+    if extra:
+        lines.append("\n--- 필드 ---")
+        for name in extra:
+            lines.append(f"  {name}: {format_field_value(fields.get(name))}")
     return "\n".join(lines)
 
 
-def main():
+def _add_fields_args(p, default=None, expand=True):
+    """--fields / --expand 옵션 추가 (필드 프로젝션)."""
+    presets = ", ".join(FIELD_PRESETS)
+    p.add_argument(
+        "--fields",
+        default=default,
+        help=f"요청할 필드 (쉼표 구분) 또는 프리셋: {presets}" + (f" (기본: {default})" if default else ""),
+    )
+    if expand:
+        p.add_argument("--expand", help="Jira expand 값 (예: changelog,renderedFields)")
+
+
+def _add_site_args(p):
+    p.add_argument(
+        "--site", help="검색할 사이트 프로필 (쉼표 구분, 예: default,oss). 동시에 검색해 ORDER BY 순으로 합쳐 스트리밍 출력",
+    )
+
+
+def _print_site_search(parser, args, jql, title):
+    """--site: 여러 사이트 결과를 병합 순서대로 도착하는 대로 출력."""
+    try:
+        sites = parse_sites(args.site)
+    except ValueError as e:
+        parser.error(str(e))
+    fields, extra = field_projection(args.fields, LIST_FIELDS, "minimal")
+    issues = iter_search_sites(
+        jql, sites, fields=fields, limit=None if args.all else args.max, expand=getattr(args, "expand", None),
+    )
+    print(f"\n{title} ({', '.join(s.name for s in sites)})")
+    count = print_issue_list(issues, extra)
+    print(f"\n({count}건)\n")
+
+
+def _add_mirror_args(p):
+    p.add_argument("--offline", action="store_true", help="로컬 미러(jira sync)에서만 조회")
+    p.add_argument("--cached", action="store_true", help="로컬 미러가 --max-age 이내로 최신이면 미러에서, 아니면 온라인 조회")
+    p.add_argument("--max-age", type=float, default=None, help="미러 허용 최대 경과 시간(초). 기본: JIRA_MIRROR_MAX_AGE 또는 900")
+
+
+def _use_mirror(args, projects=None):
+    """--offline/--cached 처리. --offline은 항상 미러(오래됐으면 경고), --cached는 미러가 최신일 때만."""
+    if not (args.offline or args.cached):
+        return False
+    import jira_mirror
+    max_age = args.max_age if args.max_age is not None else jira_mirror.MIRROR_MAX_AGE
+    age = jira_mirror.age(projects)
+    if age is not None and age <= max_age:
+        return True
+    if args.offline:
+        note = "동기화한 적 없음" if age is None else f"{int(age)}초 전 동기화"
+        print(f"[mirror] 경고: 로컬 미러가 최신이 아닙니다 ({note}). `jira sync`로 갱신하세요.", file=sys.stderr)
+        return True
+    return False
+
+
+def _print_mirror_search(parser, args):
+    """search --offline/--cached: JQL을 미러로 답할 수 있고(jira_mirror.plan_jql) 미러를 쓸 수 있으면 미러 결과를 출력하고 True,
+    아니면 False (온라인 검색). --offline인데 미러로 답할 수 없는 JQL이면 사용법 오류.
+    """
+    if not (args.offline or args.cached):
+        return False
+    import jira_mirror
+    me = _meta.peek("myself") or {}
+    plan = jira_mirror.plan_jql(args.jql, account_id=me.get("accountId"))
+    extra = field_projection(args.fields, LIST_FIELDS, "minimal")[1]
+    if plan is None or extra or args.expand:
+        if args.offline:
+            parser.error(
+                "--offline 검색은 미러로 답할 수 있는 JQL만 지원합니다 "
+                f"({jira_mirror.JQL_SUBSET}; --fields·--expand 제외). 제목·설명 전문 검색은 --text"
+            )
+        return False
+    if not plan["projects"]:
+        # project = / in 조건이 없으면 Jira는 전체 프로젝트를 검색하지만 미러에는 동기화한 프로젝트만 있다
+        if not args.offline:
+            return False
+        print("[mirror] 경고: JQL에 project 조건이 없어 동기화한 프로젝트만 검색합니다.", file=sys.stderr)
+    elif not _use_mirror(args, plan["projects"]):
+        return False
+    issues = jira_mirror.search_jql(plan, max_results=None if args.all else args.max)
+    print(f"\n검색 결과 ({len(issues)}건, 미러)")
+    print_issue_list(issues)
+    print()
+    return True
+
+
+class _CurrentStderr:
+    """그때그때의 sys.stderr로 쓰는 스트림 (데몬에서는 요청마다 stderr가 바뀌므로 로그 핸들러가 이것을 씀)."""
+
+    def write(self, text):
+        return sys.stderr.write(text)
+
+    def flush(self):
+        sys.stderr.flush()
+
+
+def main(argv=None):
+    """CLI 진입점. argv를 생략하면(명령행 실행) 실행 중인 데몬이 있을 때 명령을 데몬에 전달한다."""
+    global _profile
+    if argv is None and not os.getenv("JIRA_NO_DAEMON") and os.path.exists(DAEMON_SOCKET):
+        import jira_daemon
+
+        code = jira_daemon.forward(sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
     parser = argparse.ArgumentParser(description="Jira 티켓 관리 CLI")
+    parser.add_argument("--http-stats", action="store_true", help="종료 시 HTTP 연결 재사용 통계를 stderr로 출력")
+    parser.add_argument("-v", "--verbose", action="store_true", help="요청마다 메서드·경로·응답 크기를 stderr로 출력")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="종료 시 단계별 시간(함수 → 요청)과 엔드포인트별 지연·바이트·상태 코드·재시도·캐시 적중을 stderr로 출력",
+    )
     sub = parser.add_subparsers(dest="cmd", help="명령")
 
     # 내 이슈 목록
     p_list = sub.add_parser("list", help="내게 할당된 티켓 목록 (미완료)")
     p_list.add_argument("--status", choices=["open", "done", "all"], default="open", help="open=미완료, done=완료, all=전체")
     p_list.add_argument("-n", "--max", type=int, default=20, help="최대 개수")
+    p_list.add_argument("--all", action="store_true", help="개수 제한 없이 모든 페이지를 스트리밍 출력")
+    _add_fields_args(p_list, expand=False)
+    _add_mirror_args(p_list)
+    _add_site_args(p_list)
 
     # 티켓 상세
-    p_show = sub.add_parser("show", help="티켓 상세 보기 (예: show PROJ-123)")
-    p_show.add_argument("issue_key", help="이슈 키 (예: PROJ-123)")
+    p_show = sub.add_parser("show", help="티켓 상세 보기 (예: show PROJ-123, 여러 건: show PROJ-1 PROJ-2)")
+    p_show.add_argument("issue_keys", nargs="+", help="이슈 키 (예: PROJ-123). 여러 개면 key in (...) 묶음으로 한 번에 조회")
+    _add_fields_args(p_show, default="detail")
+    p_show.add_argument("--max-chars", type=int, default=None, help="설명 최대 문자 수 (기본: JIRA_DESCRIPTION_MAX_CHARS 또는 4000, 0이면 전체)")
+    _add_mirror_args(p_show)
 
     # JQL 검색
-    p_search = sub.add_parser("search", help="JQL로 검색")
-    p_search.add_argument("jql", help='JQL (예: "project = MYPROJ AND status = In Progress")')
+    p_search = sub.add_parser("search", help="JQL로 검색 (--text면 로컬 미러 전문 검색)")
+    p_search.add_argument("jql", nargs="?", help='JQL (예: "project = MYPROJ AND status = \'In Progress\'")')
     p_search.add_argument("-n", "--max", type=int, default=20)
+    p_search.add_argument("--all", action="store_true", help="개수 제한 없이 모든 페이지를 스트리밍 출력")
+    p_search.add_argument("--text", metavar="검색어", help="JQL 대신 로컬 미러에서 제목·설명 전문 검색 (네트워크 없음)")
+    p_search.add_argument("--project", "-p", help="--text 검색을 이 프로젝트로 제한")
+    _add_mirror_args(p_search)
+    _add_fields_args(p_search)
+    _add_site_args(p_search)
+
+    # 로컬 미러 동기화
+    p_sync = sub.add_parser("sync", help="프로젝트 이슈를 로컬 미러(SQLite)로 동기화 (증분)")
+    p_sync.add_argument("projects", nargs="*", help="프로젝트 키 (기본: 이전에 동기화한 프로젝트)")
+    p_sync.add_argument("--full", action="store_true", help="전체를 다시 받고 사라진 이슈 삭제")
+    p_sync.add_argument("--status", action="store_true", help="동기화 현황만 출력")
+
+    # 파일로 내보내기
+    p_export = sub.add_parser("export", help="JQL 결과를 CSV/JSONL/Parquet 파일로 내보내기 (중단되면 이어서)")
+    p_export.add_argument("jql", help='JQL (예: "project = MYPROJ ORDER BY created")')
+    p_export.add_argument("-o", "--output", required=True, help="출력 파일 (체크포인트: <출력>.checkpoint.json)")
+    p_export.add_argument("--format", choices=["csv", "jsonl", "parquet"], help="출력 형식 (기본: 확장자로 추정, 모르면 csv)")
+    p_export.add_argument("--fields", help="내보낼 필드 (쉼표 구분) 또는 프리셋. 기본: summary,status,issuetype,priority,assignee,reporter,created,updated,resolutiondate,labels")
+    p_export.add_argument("-n", "--max", type=int, default=None, help="최대 건수 (기본: 전체)")
+    p_export.add_argument("--page-size", type=int, default=None, help="페이지당 요청 건수 (기본: JIRA_PAGE_SIZE)")
+    p_export.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+
+    # 건수·그룹별 건수
+    p_count = sub.add_parser("count", help="JQL 결과 건수 (근사치, 이슈를 받지 않음)")
+    p_count.add_argument("jql", help='JQL (예: "project = MYPROJ AND type = Bug AND resolution = Unresolved")')
+    p_stats = sub.add_parser("stats", help="JQL 결과를 상태·담당자·우선순위·이슈 타입별로 집계")
+    p_stats.add_argument("jql", help="JQL")
+    p_stats.add_argument(
+        "-g", "--group-by", choices=list(GROUP_BY_FIELDS), default="status", help="집계 기준 필드 (기본: status)",
+    )
+    p_stats.add_argument("-n", "--max", type=int, default=None, help="최대 건수 (기본: 전체)")
+
+    # 흐름 분석 (리드·사이클 타임, 상태별 체류 시간)
+    p_analytics = sub.add_parser("analytics", help="JQL 결과의 리드 타임·사이클 타임·상태별 체류 시간 (changelog 일괄 조회)")
+    p_analytics.add_argument("jql", help='JQL (예: "project = MYPROJ AND resolved >= -90d")')
+    p_analytics.add_argument("--format", choices=["table", "csv"], default="table", help="출력 형식 (기본: table, 기간은 일 단위)")
+    p_analytics.add_argument("-o", "--output", help="결과를 파일로 저장 (기본: 표준 출력)")
+    p_analytics.add_argument("-n", "--max", type=int, default=None, help="최대 건수 (기본: 전체)")
+    p_analytics.add_argument("--start-status", help="착수로 볼 상태 (쉼표 구분, 기본: 진행 중 분류의 첫 상태)")
+    p_analytics.add_argument("--done-status", help="완료로 볼 상태 (쉼표 구분, 기본: 완료 분류 상태와 해결일)")
+    p_analytics.add_argument("--workers", type=int, default=None, help="동시 changelog 묶음 요청 수 (기본: JIRA_ANALYTICS_WORKERS 또는 4)")
 
     # 티켓 착수 (In Progress)
     p_start = sub.add_parser("start", help="티켓을 착수(In Progress) 상태로 전환")
@@ -353,43 +3138,251 @@ def main():
     p_transition.add_argument("issue_key", help="이슈 키 (예: PROJ-123)")
     p_transition.add_argument("target_status", help="목표 상태 (예: In Progress, Resolved, Closed)")
 
+    # 여러 티켓 일괄 상태 전환
+    p_tbulk = sub.add_parser(
+        "transition-bulk",
+        help="여러 티켓 일괄 상태 변경 (키: --jql, --file, 또는 표준입력)",
+    )
+    p_tbulk.add_argument("target_status", help="목표 상태 (예: Resolved, Closed)")
+    p_tbulk.add_argument("--jql", help="대상 이슈를 고를 JQL")
+    p_tbulk.add_argument("--file", "-f", help="이슈 키 목록 파일 (공백·쉼표·줄바꿈 구분, '-'는 표준입력)")
+    p_tbulk.add_argument("--workers", "-w", type=int, default=BULK_WORKERS, help=f"동시 작업 수 (기본: {BULK_WORKERS})")
+    p_tbulk.add_argument("--dry-run", action="store_true", help="실제로 바꾸지 않고 전환 가능 여부만 확인")
+    p_tbulk.add_argument("--no-bulk-api", action="store_true", help="Jira 일괄 전환 API 대신 건별로 전환")
+    p_tbulk.add_argument("--jsonl", action="store_true", help="결과를 한 줄에 하나씩 JSON으로 출력")
+
+    # 메타데이터 저장소
+    p_meta = sub.add_parser("meta", help="로컬 메타데이터(내 계정, 프로젝트, 이슈 타입, 우선순위, 상태) 관리")
+    p_meta.add_argument("action", choices=["refresh", "show", "clear"], help="refresh=다시 가져오기, show=현황, clear=삭제")
+    p_meta.add_argument("names", nargs="*", help=f"대상: {', '.join(META_TTLS)} (기본: 전체)")
+
     # 티켓 생성
     p_create = sub.add_parser("create", help="티켓 생성 (예: create PROJ '제목' [옵션])")
     p_create.add_argument("project", help="프로젝트 키 (예: PROJ)")
     p_create.add_argument("summary", help="티켓 제목")
     p_create.add_argument("--type", dest="issuetype", default="Task", help="이슈 타입 (기본: Task)")
-    p_create.add_argument("--description", "-d", help="설명 (플레인 텍스트)")
-    p_create.add_argument("--assign-me", action="store_true", help="나에게 담당자 지정")
+    p_create.add_argument("--description", "-d", help="설명 (Markdown: 목록, 제목, ``` 코드 블록, 표, **굵게**, [링크](url))")
+    p_create_who = p_create.add_mutually_exclusive_group()
+    p_create_who.add_argument("--assign-me", action="store_true", help="나에게 담당자 지정")
+    p_create_who.add_argument("--assignee", metavar="NAME", help="담당자 이름·이메일 (로컬 사용자 디렉터리에서 찾음)")
     p_create.add_argument(
         "--custom-fields",
         metavar="JSON|@파일경로",
         help="커스텀 필드 덮어쓰기 (JSON 문자열 또는 @path). 예: '{\"customfield_10648\":{\"id\":\"12601\"}}'",
     )
 
+    # 생성 화면 필드 (createmeta)
+    p_fields = sub.add_parser("fields", help="프로젝트·이슈 타입의 생성 필드와 허용 옵션 (예: fields PROJ Bug)")
+    p_fields.add_argument("project", help="프로젝트 키 (예: PROJ)")
+    p_fields.add_argument("issuetype", nargs="?", help="이슈 타입 (생략하면 타입 목록만)")
+    p_fields.add_argument("--refresh", action="store_true", help="캐시를 무시하고 Jira에서 다시 가져오기")
+
+    # 티켓 일괄 생성
+    p_cbulk = sub.add_parser("create-bulk", help="JSONL/CSV 파일로 티켓 일괄 생성 (50건씩 /issue/bulk)")
+    p_cbulk.add_argument("file", help="입력 파일 (.jsonl 또는 .csv, '-'는 표준입력)")
+    p_cbulk.add_argument("--format", choices=["jsonl", "csv"], help="입력 형식 (기본: 확장자로 판단, 표준입력은 jsonl)")
+    p_cbulk.add_argument("--assignee", metavar="NAME", help="담당자가 없는 행(assign_me·assignee 열 없음)의 기본 담당자")
+    p_cbulk.add_argument("--jsonl", action="store_true", help="결과를 한 줄에 하나씩 JSON으로 출력")
+
     # 티켓 수정
     p_edit = sub.add_parser("edit", help="티켓 수정 (제목·설명·담당자)")
     p_edit.add_argument("issue_key", help="이슈 키 (예: PROJ-123)")
     p_edit.add_argument("--summary", "-s", help="새 제목")
-    p_edit.add_argument("--description", "-d", help="새 설명 (플레인 텍스트)")
-    p_edit.add_argument("--assign-me", action="store_true", help="나에게 담당자 지정")
-
-    args = parser.parse_args()
+    p_edit.add_argument("--description", "-d", help="새 설명 (Markdown)")
+    p_edit_who = p_edit.add_mutually_exclusive_group()
+    p_edit_who.add_argument("--assign-me", action="store_true", help="나에게 담당자 지정")
+    p_edit_who.add_argument("--assignee", metavar="NAME", help="담당자 이름·이메일 (로컬 사용자 디렉터리에서 찾음)")
+
+    # 사용자 디렉터리
+    p_users = sub.add_parser("users", help="로컬 사용자 디렉터리 조회·갱신 (--assignee 이름 확인용)")
+    p_users.add_argument("query", nargs="?", help="이름·이메일 (생략하면 디렉터리 현황)")
+    p_users.add_argument("--refresh", action="store_true", help="Jira에서 사용자 목록 다시 받기")
+
+    # 백그라운드 데몬
+    p_daemon = sub.add_parser("daemon", help="백그라운드 데몬: 연결·캐시를 유지하고 CLI 명령을 Unix 소켓으로 받아 실행")
+    p_daemon.add_argument(
+        "action", nargs="?", default="run", choices=["run", "start", "stop", "status"],
+        help="run=포그라운드 실행(기본), start=백그라운드 시작, stop=종료, status=상태",
+    )
 
-    if args.cmd == "list":
-        issues = my_issues(status=args.status, max_results=args.max)
-        print(f"\n내 티켓 ({len(issues)}건)")
+    args = parser.parse_args(argv)
+    exit_code = 0
+    if args.profile:
+        instrument()
+        _profile = Metrics()
+        profile_started = time.perf_counter()
+        if argv is None:  # 명령행 실행: 이 프로세스의 설정 로드도 포함 (데몬에서는 시작할 때 한 번)
+            _profile.phase(("load_config",), _CONFIG_LOAD_SECONDS)
+            profile_started -= _CONFIG_LOAD_SECONDS
+    if args.verbose:
+        logging.basicConfig(stream=_CurrentStderr(), format="[%(name)s] %(message)s")
+        log.setLevel(logging.DEBUG)
+
+    if args.cmd == "list" and args.site:
+        _print_site_search(parser, args, _my_issues_jql(args.status), "내 티켓")
+
+    elif args.cmd == "list" and _use_mirror(args):
+        import jira_mirror
+        issues = jira_mirror.my_issues(status=args.status, max_results=args.max)
+        print(f"\n내 티켓 ({len(issues)}건, 미러)")
         print_issue_list(issues)
         print()
 
+    elif args.cmd == "list":
+        fields, extra = field_projection(args.fields, LIST_FIELDS, "minimal")
+        if args.all:
+            print("\n내 티켓")
+            count = print_issue_list(iter_my_issues(status=args.status, fields=fields), extra)
+            print(f"\n({count}건)\n")
+        else:
+            issues = my_issues(status=args.status, max_results=args.max, fields=fields)
+            print(f"\n내 티켓 ({len(issues)}건)")
+            print_issue_list(issues, extra)
+            print()
+
     elif args.cmd == "show":
-        show_issue(args.issue_key)
+        keys = parse_issue_keys(" ".join(args.issue_keys))
+        found, missing, note = {}, [], "없거나 볼 권한이 없는 이슈"
+        if _use_mirror(args, sorted({k.rsplit("-", 1)[0] for k in keys})):
+            import jira_mirror
+            for key in keys:
+                data = jira_mirror.get_issue(key)
+                if data:
+                    found[key] = data
+            if args.offline:
+                missing, note = [k for k in keys if k not in found], "로컬 미러에 없습니다"
+        online = [k for k in keys if k not in found and k not in missing]
+        if len(keys) == 1 and online:
+            show_issue(online[0], fields=args.fields, expand=args.expand, max_chars=args.max_chars)
+        else:
+            wanted, extra = field_projection(args.fields, FIELD_PRESETS["detail"], "detail")
+            if online:
+                fetched, missing = get_issues(online, fields=wanted, expand=args.expand)
+                found.update(fetched)
+            for key in keys:
+                if key in found:
+                    print("\n" + format_issue_detail(found[key], extra=extra, max_chars=args.max_chars))
+            if missing:
+                print(f"\n{note}: {', '.join(missing)}")
+                exit_code = 1
+            print()
 
-    elif args.cmd == "search":
-        issues = search(args.jql, max_results=args.max)
-        print(f"\n검색 결과 ({len(issues)}건)")
+    elif args.cmd == "search" and not (args.jql or args.text):
+        parser.error("JQL 또는 --text 검색어를 지정해주세요.")
+
+    elif args.cmd == "search" and args.text is not None:
+        if args.jql:
+            parser.error("--text는 JQL 대신 쓰는 검색어입니다. 둘 중 하나만 지정해주세요.")
+        import jira_mirror
+        issues = jira_mirror.search_text(args.text, project=args.project, max_results=args.max)
+        print(f"\n검색 결과 ({len(issues)}건, 미러)")
         print_issue_list(issues)
         print()
 
+    elif args.cmd == "search" and not args.site and _print_mirror_search(parser, args):
+        pass
+
+    elif args.cmd == "sync":
+        import jira_mirror
+        if not args.status:
+            try:
+                results = jira_mirror.sync(
+                    args.projects,
+                    full=args.full,
+                    on_progress=lambda project, n: print(f"\r  {project}: {n}건", end="", file=sys.stderr, flush=True),
+                )
+            except ValueError as e:
+                parser.error(str(e))
+            print(file=sys.stderr)
+            for project, n in results.items():
+                print(f"  {project:12} {n}건 동기화")
+        print(f"\n{jira_mirror.MIRROR_DB}")
+        for st in jira_mirror.status():
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(st["last_sync"]))
+            print(f"  {st['project']:12} {st['issues']:>7}건  마지막 동기화 {when}")
+
+    elif args.cmd == "export":
+        import jira_export
+
+        def progress(n):
+            print(f"\r  {n:,}건", end="", file=sys.stderr, flush=True)
+
+        try:
+            result = jira_export.export(
+                args.jql, args.output, fmt=args.format, fields=args.fields, limit=args.max,
+                page_size=args.page_size, restart=args.restart, on_progress=progress,
+            )
+        except jira_export.ExportError as e:
+            print(f"오류: {e}", file=sys.stderr)
+            exit_code = 1
+        except KeyboardInterrupt:
+            print(
+                f"\n중단됨. 같은 명령을 다시 실행하면 이어서 받습니다 ({jira_export.checkpoint_path(args.output)})",
+                file=sys.stderr,
+            )
+            exit_code = 130
+        else:
+            print(file=sys.stderr)
+            resumed = f" ({result['resumed_from']:,}건부터 이어서)" if result["resumed_from"] else ""
+            print(f"내보냄: {result['rows']:,}건{resumed} → {result['path']} ({result['format']}, {result['seconds']}초)")
+
+    elif args.cmd == "count":
+        print(f"{count_issues(args.jql):,}건 (근사치)")
+
+    elif args.cmd == "stats":
+        rows = group_counts(args.jql, group_by=args.group_by, limit=args.max)
+        if rows:
+            print(f"\n{format_group_counts(rows, args.group_by)}\n")
+        else:
+            print("\n결과 없음\n")
+
+    elif args.cmd == "analytics":
+        import jira_analytics
+
+        def statuses(value):
+            return [s.strip() for s in value.split(",") if s.strip()] if value else None
+
+        def progress(searched, analyzed):
+            print(f"\r  검색 {searched:,}건 / 분석 {analyzed:,}건", end="", file=sys.stderr, flush=True)
+
+        started = time.monotonic()
+        try:
+            stats = jira_analytics.analyze(
+                args.jql, limit=args.max, start_statuses=statuses(args.start_status),
+                done_statuses=statuses(args.done_status), workers=args.workers, on_progress=progress,
+            )
+        except jira_analytics.AnalyticsError as e:
+            print(f"\n오류: {e}", file=sys.stderr)
+            exit_code = 1
+        else:
+            print(f"\n  {stats.issues:,}건 (완료 {stats.done:,}건), {time.monotonic() - started:.1f}초", file=sys.stderr)
+            rows = stats.summary()
+            if args.format == "csv":
+                out = jira_analytics.summary_csv(rows)
+            else:
+                out = jira_analytics.format_summary(rows) + "\n"
+            if args.output:
+                with open(args.output, "w", encoding="utf-8", newline="") as f:
+                    f.write(out)
+                print(f"저장: {args.output}", file=sys.stderr)
+            else:
+                print("\n" + out if args.format == "table" else out, end="")
+
+    elif args.cmd == "search" and args.site:
+        _print_site_search(parser, args, args.jql, "검색 결과")
+
+    elif args.cmd == "search":
+        fields, extra = field_projection(args.fields, LIST_FIELDS, "minimal")
+        if args.all:
+            print("\n검색 결과")
+            count = print_issue_list(iter_search(args.jql, fields=fields, expand=args.expand), extra)
+            print(f"\n({count}건)\n")
+        else:
+            issues = search(args.jql, max_results=args.max, fields=fields, expand=args.expand)
+            print(f"\n검색 결과 ({len(issues)}건)")
+            print_issue_list(issues, extra)
+            print()
+
     elif args.cmd == "start":
         new_status = start_issue(args.issue_key)
         if new_status:
@@ -397,7 +3390,7 @@ def main():
         else:
             print(f"\n오류: {args.issue_key}에서 'In Progress'로 전환할 수 있는 전환이 없습니다.")
             print("  가능한 전환: ", end="")
-            for t in get_transitions(args.issue_key):
+            for t in cached_transitions(args.issue_key):
                 to_name = (t.get("to") or {}).get("name", "?")
                 print(f" {t['name']}→{to_name}", end="")
             print()
@@ -406,6 +3399,63 @@ def main():
         ok, msg = transition_to_status(args.issue_key, args.target_status)
         print(f"\n{msg}")
 
+    elif args.cmd == "transition-bulk":
+        if args.jql:
+            keys = [i["key"] for i in iter_search(args.jql, fields=["status", "issuetype"])]
+        elif args.file and args.file != "-":
+            with open(args.file, encoding="utf-8") as f:
+                keys = parse_issue_keys(f.read())
+        else:
+            keys = parse_issue_keys(sys.stdin.read())
+        if not keys:
+            print("\n대상 이슈가 없습니다.")
+        else:
+            if not args.jsonl:
+                print(f"\n{len(keys)}건 → {args.target_status}" + (" (dry-run)" if args.dry_run else ""))
+            ok_count = fail_count = 0
+            for r in transition_bulk(
+                keys,
+                args.target_status,
+                workers=args.workers,
+                dry_run=args.dry_run,
+                use_bulk_api=not args.no_bulk_api,
+            ):
+                if r["ok"]:
+                    ok_count += 1
+                else:
+                    fail_count += 1
+                if args.jsonl:
+                    print(json.dumps(r, ensure_ascii=False), flush=True)
+                else:
+                    print(format_bulk_result(r), flush=True)
+            if not args.jsonl:
+                print(f"\n성공 {ok_count}건 / 실패 {fail_count}건")
+            if fail_count:
+                exit_code = 1
+
+    elif args.cmd == "meta":
+        names = args.names or list(META_TTLS)
+        unknown = [n for n in names if n not in META_TTLS]
+        if unknown:
+            parser.error(f"알 수 없는 메타데이터: {', '.join(unknown)} (가능: {', '.join(META_TTLS)})")
+        if args.action == "refresh":
+            for name, n in refresh_metadata(names).items():
+                print(f"  {name:12} {n}건 갱신")
+        elif args.action == "clear":
+            _meta.clear()
+            print(f"\n메타데이터를 삭제했습니다. ({_meta.path})")
+        else:
+            print(f"\n{_meta.path}")
+            for name in names:
+                entry = _meta.entry(name)
+                if not entry:
+                    print(f"  {name:12} (없음)")
+                    continue
+                value = entry["value"]
+                size = f"{len(value)}건" if isinstance(value, list) else value.get("displayName", "")
+                until = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["expires"]))
+                print(f"  {name:12} {size:20} 만료 {until}")
+
     elif args.cmd == "create":
         custom_fields = None
         if getattr(args, "custom_fields", None):
@@ -415,25 +3465,93 @@ def main():
                     custom_fields = json.load(f)
             else:
                 custom_fields = json.loads(raw)
-        key, url = create_issue(
-            project_key=args.project,
-            summary=args.summary,
-            issuetype=args.issuetype,
-            description=args.description,
-            assign_to_self=args.assign_me,
-            custom_fields=custom_fields,
-        )
-        print(f"\n생성됨: {key}")
-        print(f"  {url}")
+        try:
+            key, url = create_issue(
+                project_key=args.project,
+                summary=args.summary,
+                issuetype=args.issuetype,
+                description=args.description,
+                assign_to_self=args.assign_me,
+                custom_fields=custom_fields,
+                assignee=args.assignee,
+            )
+        except (CreateValidationError, UserLookupError) as e:
+            print(f"\n{e}", file=sys.stderr)
+            exit_code = 1
+        else:
+            print(f"\n생성됨: {key}")
+            print(f"  {url}")
+
+    elif args.cmd == "fields":
+        try:
+            if args.issuetype:
+                print(format_createmeta(get_createmeta(args.project, args.issuetype, refresh=args.refresh)))
+            else:
+                types, _ = get_createmeta_types(args.project, refresh=args.refresh)
+                print(f"\n{args.project.upper()} 이슈 타입")
+                for t in types:
+                    print(f"  {t['id']:>8}  {t['name']}")
+        except CreateValidationError as e:
+            print(f"\n{e}", file=sys.stderr)
+            exit_code = 1
+        print()
+
+    elif args.cmd == "create-bulk":
+        fmt = args.format or ("csv" if args.file.lower().endswith(".csv") else "jsonl")
+        fp = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8-sig", newline="")
+        ok_count = fail_count = 0
+        try:
+            for r in create_issues_bulk(iter_issue_rows(fp, fmt), assignee=args.assignee):
+                if r["ok"]:
+                    ok_count += 1
+                else:
+                    fail_count += 1
+                print(json.dumps(r, ensure_ascii=False) if args.jsonl else format_create_result(r), flush=True)
+        finally:
+            if fp is not sys.stdin:
+                fp.close()
+        if not args.jsonl:
+            print(f"\n생성 {ok_count}건 / 실패 {fail_count}건")
+        if fail_count:
+            exit_code = 1
 
     elif args.cmd == "edit":
-        ok, msg = update_issue(
-            issue_key=args.issue_key,
-            summary=args.summary,
-            description=args.description,
-            assign_to_self=args.assign_me,
-        )
-        print(f"\n{msg}")
+        try:
+            ok, msg = update_issue(
+                issue_key=args.issue_key,
+                summary=args.summary,
+                description=args.description,
+                assign_to_self=args.assign_me,
+                assignee=args.assignee,
+            )
+        except UserLookupError as e:
+            print(f"\n{e}", file=sys.stderr)
+            exit_code = 1
+        else:
+            print(f"\n{msg}")
+
+    elif args.cmd == "users":
+        if args.refresh:
+            print(f"\n사용자 {refresh_users()}명 갱신 ({_users.path})")
+        if args.query:
+            matches = find_users(args.query)
+            print()
+            for u in matches[:50]:
+                print(f"  {u['accountId']:28} {u['displayName'][:24]:24} {u['emailAddress']}")
+            print(f"\n({len(matches)}명)" if matches else "결과 없음. (로컬 디렉터리 기준, --refresh로 갱신)")
+        elif not args.refresh:
+            fetched, index = _users.cached()
+            print(f"\n{_users.path}")
+            if fetched:
+                at = time.strftime("%Y-%m-%d %H:%M", time.localtime(fetched))
+                print(f"  사용자 {len(index.users)}명, {at} 갱신 (유효 {USERS_TTL // 3600}시간)")
+            else:
+                print("  (없음) — 'users --refresh' 또는 첫 --assignee 사용 시 받아 옴")
+
+    elif args.cmd == "daemon":
+        import jira_daemon
+
+        exit_code = jira_daemon.command(args.action)
 
     else:
         parser.print_help()
@@ -444,7 +3562,31 @@ def main():
         print('  python jira_cli.py search "project = MYPROJ"  # JQL 검색')
         print("  python jira_cli.py create PROJ '제목' --assign-me  # 티켓 생성")
         print("  python jira_cli.py edit PROJ-123 -s '새 제목' -d '새 설명'  # 티켓 수정")
+        print("  python jira_cli.py edit PROJ-123 --assignee 'Jiwon Park'  # 담당자 지정 (이름·이메일)")
+        print('  python jira_cli.py transition-bulk Closed --jql "sprint in openSprints()" --dry-run  # 일괄 전환')
+        print("  python jira_cli.py sync PROJ && python jira_cli.py list --offline  # 로컬 미러")
+        print('  python jira_cli.py export "project = MYPROJ" -o proj.csv  # 파일로 내보내기 (중단 시 이어서)')
+        print('  python jira_cli.py stats "project = MYPROJ AND resolution = Unresolved" -g assignee  # 담당자별 건수')
+        print('  python jira_cli.py analytics "project = MYPROJ AND resolved >= -90d"  # 리드·사이클 타임')
+        print("  python jira_cli.py daemon start       # 백그라운드 데몬 (이후 명령은 데몬에서 실행)")
+
+    if args.profile:
+        print(format_profile(_profile, wall=time.perf_counter() - profile_started), file=sys.stderr)
+        _profile = None
+    write_metrics()
+    if args.http_stats:
+        st = connection_stats()
+        print(
+            f"[http] 요청 {st['requests']}회 / 새 연결 {st['connections']}개 / 재사용 {st['reused']}회 / 재시도 {st['retries']}회"
+            f" / 수신 {st['bytes_in']:,} bytes"
+            f" / 429 {st['throttled']}회 / 속도 제한 대기 {st['throttle_wait']:.1f}초",
+            file=sys.stderr,
+        )
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
+    # 스크립트로 실행해도 jira_mirror 등 보조 모듈이 같은 jira_cli 모듈(세션·캐시)을 쓰도록 등록
+    sys.modules.setdefault("jira_cli", sys.modules[__name__])
     main()
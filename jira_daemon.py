@@ -0,0 +1,341 @@
+"""
+jira 데몬 - Unix 소켓으로 CLI 명령을 받아 오래 사는 프로세스에서 실행.
+연결 풀(TLS 세션)·메타데이터·전환 캐시를 메모리에 유지하므로, 쉘 루프나 에디터 연동에서 반복 호출할 때
+매번 import·설정 로드·TLS 핸드셰이크를 하지 않는다.
+
+jira_cli.main()은 데몬 소켓이 있으면 명령을 전달하고(설정이 같을 때만), 없거나 연결할 수 없으면 직접 실행한다.
+명령은 한 번에 하나씩 실행한다 (요청마다 클라이언트의 작업 디렉터리로 이동하므로). 다른 명령을 실행 중이면 기다리게 하지 않고
+거절해 클라이언트가 직접 실행하며, 오래 걸리는 일괄 명령(export, sync 등)은 처음부터 전달하지 않는다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+import jira_cli
+
+DAEMON_SOCKET = jira_cli.DAEMON_SOCKET
+DAEMON_IDLE = int(os.getenv("JIRA_DAEMON_IDLE", "3600"))  # 이 시간(초) 동안 요청이 없으면 종료. 0이면 계속 실행
+DAEMON_LOG = os.path.expanduser(os.getenv("JIRA_DAEMON_LOG", "~/.config/jira-helper/daemon.log"))
+
+# 데몬 설정 비교에서 제외 (데몬 자체 설정·전달 여부)
+_FINGERPRINT_SKIP = frozenset({"JIRA_DAEMON_SOCKET", "JIRA_DAEMON_IDLE", "JIRA_DAEMON_LOG", "JIRA_NO_DAEMON"})
+# 전달하지 않고 직접 실행할 명령: 오래 걸리는 일괄 작업은 데몬을 붙잡아 다른 호출을 막고, 클라이언트가 Ctrl-C로 끊어도
+# 데몬에서는 멈추지 않으므로 (연결 재사용 이득도 작업 시간에 비하면 작음)
+_DIRECT_COMMANDS = frozenset({"daemon", "export", "sync", "analytics", "stats", "transition-bulk", "create-bulk"})
+
+
+def config_fingerprint():
+    """JIRA_* 설정(.env 로드 후)의 해시. 클라이언트와 데몬이 같은 사이트·설정일 때만 전달하기 위함."""
+    import hashlib
+
+    items = sorted((k, v) for k, v in os.environ.items() if k.startswith("JIRA_") and k not in _FINGERPRINT_SKIP)
+    return hashlib.sha256(json.dumps(items).encode()).hexdigest()
+
+
+def _wants_stdin(argv):
+    """표준입력을 읽는 명령은 전달하지 않음 (데몬은 클라이언트의 stdin을 읽을 수 없음)."""
+    if "-" in argv:
+        return True
+    cmd = next((a for a in argv if not a.startswith("-")), None)
+    return cmd == "transition-bulk" and not {"--jql", "--file", "-f"} & set(argv)
+
+
+def _connect(path=DAEMON_SOCKET, timeout=None):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _send(fp, message):
+    fp.write(json.dumps(message, ensure_ascii=False).encode() + b"\n")
+    fp.flush()
+
+
+# --- 클라이언트 ---
+
+
+def forward(argv):
+    """명령을 실행 중인 데몬에 전달하고 출력을 그대로 옮김.
+    반환: 종료 코드, 또는 전달하지 않았으면 None (데몬 없음·설정 다름·실행 중·stdin 필요·일괄 명령 → 직접 실행).
+    """
+    cmd = next((a for a in argv if not a.startswith("-")), None)
+    if not hasattr(socket, "AF_UNIX") or cmd is None or cmd in _DIRECT_COMMANDS or _wants_stdin(argv):
+        return None
+    try:
+        sock = _connect(timeout=1.0)
+    except OSError:
+        return None
+    with sock:
+        sock.settimeout(None)
+        fp = sock.makefile("rwb")
+        try:
+            _send(fp, {
+                "argv": argv,
+                "prog": os.path.basename(sys.argv[0]),
+                "cwd": os.getcwd(),
+                "config": config_fingerprint(),
+            })
+            first = fp.readline()
+        except OSError:
+            return None
+        if not first:
+            return None
+        message = json.loads(first)
+        if message.get("reject"):
+            return None
+        outputs = {1: sys.stdout, 2: sys.stderr}
+        line = fp.readline()
+        message = json.loads(line) if line else None
+        try:
+            while message is not None:
+                if "exit" in message:
+                    return message["exit"]
+                stream = outputs[message["fd"]]
+                stream.write(message["data"])
+                stream.flush()
+                line = fp.readline()
+                message = json.loads(line) if line else None
+        except BrokenPipeError:  # 출력을 받던 쪽이 먼저 닫힘 (| head 등)
+            sys.stdout = open(os.devnull, "w")
+            return 1
+    print("오류: 데몬 연결이 끊겼습니다.", file=sys.stderr)
+    return 1
+
+
+def _control(action):
+    """데몬에 제어 요청(status, stop). 반환: 응답 dict 또는 None(실행 중 아님)."""
+    try:
+        sock = _connect(timeout=5.0)
+    except OSError:
+        return None
+    with sock:
+        fp = sock.makefile("rwb")
+        _send(fp, {"control": action})
+        line = fp.readline()
+    return json.loads(line) if line else None
+
+
+# --- 서버 ---
+
+
+class _SocketStream:
+    """요청 처리 중 sys.stdout/sys.stderr 대신 쓰는 스트림. 줄 단위로 클라이언트에 전달."""
+
+    def __init__(self, fp, fd):
+        self.fp = fp
+        self.fd = fd
+        self.buf = []
+        self.encoding = "utf-8"
+
+    def write(self, text):
+        self.buf.append(text)
+        if "\n" in text:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self.buf:
+            data, self.buf = "".join(self.buf), []
+            _send(self.fp, {"fd": self.fd, "data": data})
+
+    def isatty(self):
+        return False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        server.touch()
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line)
+        if "control" in request:
+            self._control(request["control"])
+            return
+        if request.get("config") != server.fingerprint:
+            _send(self.wfile, {"reject": "config"})
+            return
+        if not server.run_lock.acquire(blocking=False):
+            _send(self.wfile, {"reject": "busy"})  # 앞 명령 뒤에 줄 세우지 않고 클라이언트가 직접 실행
+            return
+        try:
+            _send(self.wfile, {"accept": True})
+            code = self._run(request["argv"], request.get("cwd"), request.get("prog"))
+            server.served += 1
+        except OSError:
+            return  # 수락 응답을 보내기 전에 클라이언트가 끊음
+        finally:
+            server.run_lock.release()
+        server.touch()
+        try:
+            _send(self.wfile, {"exit": code})
+        except OSError:
+            pass
+
+    def _run(self, argv, cwd, prog):
+        out, err = _SocketStream(self.wfile, 1), _SocketStream(self.wfile, 2)
+        saved = sys.stdout, sys.stderr, os.getcwd(), sys.argv
+        sys.stdout, sys.stderr = out, err
+        sys.argv = [prog or "jira"] + list(argv)  # argparse 사용법의 프로그램 이름
+        code = 0
+        try:
+            if cwd:
+                os.chdir(cwd)
+            jira_cli.main(argv)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            if not isinstance(e.code, (int, type(None))):
+                print(e.code, file=err)
+        except (BrokenPipeError, ConnectionResetError):
+            code = 1  # 클라이언트가 먼저 끊음 (Ctrl-C 등)
+        except Exception as e:  # 데몬은 계속 살아 있어야 하므로 명령 실패를 클라이언트에 돌려줌
+            print(f"오류: {type(e).__name__}: {e}", file=err)
+            code = 1
+        finally:
+            for stream in (out, err):
+                try:
+                    stream.flush()
+                except OSError:
+                    pass
+            sys.stdout, sys.stderr, sys.argv = saved[0], saved[1], saved[3]
+            os.chdir(saved[2])
+            jira_cli.log.setLevel(logging.NOTSET)  # -v는 요청 단위
+        return code
+
+    def _control(self, action):
+        server = self.server
+        if action == "status":
+            _send(self.wfile, {
+                "pid": os.getpid(),
+                "uptime": round(time.time() - server.started),
+                "served": server.served,
+                "idle_timeout": DAEMON_IDLE,
+                "http": jira_cli.connection_stats(),
+            })
+        elif action == "stop":
+            _send(self.wfile, {"stopping": True})
+            threading.Thread(target=server.shutdown, daemon=True).start()
+        else:
+            _send(self.wfile, {"error": f"알 수 없는 요청: {action}"})
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path):
+        self.fingerprint = config_fingerprint()
+        self.run_lock = threading.Lock()
+        self.started = self.last_active = time.time()
+        self.served = 0
+        super().__init__(path, _Handler)
+
+    def touch(self):
+        self.last_active = time.time()
+
+
+def _watch_idle(server):
+    while True:
+        time.sleep(min(DAEMON_IDLE, 30))
+        if not server.run_lock.locked() and time.time() - server.last_active > DAEMON_IDLE:
+            server.shutdown()
+            return
+
+
+def serve(path=DAEMON_SOCKET):
+    """데몬을 포그라운드로 실행. 이미 실행 중이면 1을 반환."""
+    import signal
+
+    jira_cli.get_auth()  # 설정이 없으면 여기서 종료
+    if _control("status") is not None:
+        print(f"이미 실행 중입니다: {path}", file=sys.stderr)
+        return 1
+    if os.path.exists(path):
+        os.unlink(path)  # 이전 데몬이 남긴 소켓
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    old_umask = os.umask(0o077)  # 소켓은 본인만 접근 (API 토큰으로 명령을 실행하므로)
+    try:
+        server = _Server(path)
+    finally:
+        os.umask(old_umask)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    if DAEMON_IDLE > 0:
+        threading.Thread(target=_watch_idle, args=(server,), daemon=True).start()
+    print(f"jira 데몬 시작: {path} (pid {os.getpid()})", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    print("jira 데몬 종료", file=sys.stderr, flush=True)
+    return 0
+
+
+def start():
+    """데몬을 백그라운드 프로세스로 띄우고 소켓이 열릴 때까지 기다림. 반환: 종료 코드."""
+    import subprocess
+
+    if _control("status") is not None:
+        print(f"이미 실행 중입니다: {DAEMON_SOCKET}")
+        return 0
+    os.makedirs(os.path.dirname(DAEMON_LOG) or ".", exist_ok=True)
+    with open(DAEMON_LOG, "ab") as log:
+        proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve())],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+            start_new_session=True,
+        )
+    for _ in range(100):
+        if _control("status") is not None:
+            print(f"jira 데몬 시작: {DAEMON_SOCKET} (pid {proc.pid})")
+            return 0
+        if proc.poll() is not None:
+            break
+        time.sleep(0.05)
+    print(f"데몬을 시작하지 못했습니다. 로그: {DAEMON_LOG}", file=sys.stderr)
+    return 1
+
+
+def command(action):
+    """jira daemon [run|start|stop|status]. 반환: 종료 코드."""
+    if not hasattr(socket, "AF_UNIX"):
+        print("이 플랫폼은 Unix 소켓을 지원하지 않습니다.", file=sys.stderr)
+        return 1
+    if action == "run":
+        return serve()
+    if action == "start":
+        return start()
+    status = _control(action)
+    if status is None:
+        print("데몬이 실행 중이 아닙니다.")
+        return 1 if action == "status" else 0
+    if action == "stop":
+        print("데몬을 종료합니다.")
+        return 0
+    http = status["http"]
+    print(f"\n{DAEMON_SOCKET}")
+    print(f"  pid {status['pid']}  가동 {status['uptime']}초  처리 {status['served']}건  유휴 종료 {status['idle_timeout']}초")
+    print(f"  HTTP 요청 {http['requests']}회 / 새 연결 {http['connections']}개 / 재사용 {http['reused']}회")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(serve())
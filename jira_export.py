@@ -0,0 +1,269 @@
+"""
+JQL 검색 결과를 파일로 내보내기 (CSV / JSONL / Parquet).
+
+페이지를 받는 대로 파일에 쓰므로 메모리에는 한두 페이지만 유지한다. 페이지(Parquet은 파트)를 쓸 때마다
+체크포인트(<출력>.checkpoint.json: 다음 nextPageToken, 누적 건수, 파일 크기)를 남기고, 중단된 내보내기는
+같은 명령을 다시 실행하면 마지막 체크포인트부터 이어서 받는다. 끝까지 받으면 체크포인트를 지운다.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import jira_cli
+
+FORMATS = ("csv", "jsonl", "parquet")
+# 기본 내보내기 필드 (보고용 스냅샷)
+EXPORT_FIELDS = [
+    "summary", "status", "issuetype", "priority", "assignee", "reporter",
+    "created", "updated", "resolutiondate", "labels",
+]
+# Parquet 파트 하나에 모을 최대 행 수 (재개 시 최대 이만큼 다시 받음)
+PARQUET_PART_ROWS = int(os.getenv("JIRA_EXPORT_PART_ROWS", "5000"))
+
+
+class ExportError(ValueError):
+    """내보내기를 시작·재개할 수 없음 (형식·필드·체크포인트 불일치 등)."""
+
+
+def guess_format(path):
+    """확장자로 형식 추정. 모르면 csv."""
+    ext = Path(path).suffix.lower().lstrip(".")
+    return {"ndjson": "jsonl", "json": "jsonl", "pq": "parquet"}.get(ext, ext if ext in FORMATS else "csv")
+
+
+def cell(value):
+    """필드 값을 표 한 칸의 문자열로 (옵션·사용자는 이름, 목록은 '; ' 구분, ADF는 플레인 텍스트). 없으면 None."""
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        if value.get("type") == "doc":
+            return jira_cli.adf_to_text(value).strip()
+        for k in ("displayName", "name", "value", "key"):
+            if value.get(k):
+                return str(value[k])
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, list):
+        return "; ".join(c for c in (cell(v) for v in value) if c)
+    return str(value)
+
+
+def _row(issue, fields):
+    f = issue.get("fields") or {}
+    return [issue.get("key")] + [cell(f.get(name)) for name in fields]
+
+
+# --- 출력 형식별 작성기 ---
+# 공통: open(resume) → write(issues) 반복 → (checkpoint()로 재개 위치 저장) → close()
+
+
+class _LineWriter:
+    """CSV·JSONL: 한 파일에 이어 쓰기. 재개 시 마지막 체크포인트 이후 쓰인 부분은 잘라냄."""
+
+    def __init__(self, path, fmt, fields):
+        self.path = path
+        self.fmt = fmt
+        self.fields = fields
+        self.fp = None
+
+    def open(self, state):
+        if state:
+            self.fp = open(self.path, "r+b")
+            self.fp.truncate(state["bytes"])
+            self.fp.seek(state["bytes"])
+        else:
+            self.fp = open(self.path, "wb")
+            if self.fmt == "csv":
+                self.fp.write("\ufeff".encode())  # Excel에서 한글이 깨지지 않도록 BOM
+                self._write_csv([["key"] + self.fields])
+
+    def _write_csv(self, rows):
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        self.fp.write(buf.getvalue().encode())
+
+    def write(self, issues):
+        if self.fmt == "csv":
+            self._write_csv(["" if v is None else v for v in _row(i, self.fields)] for i in issues)
+        else:
+            self.fp.write("".join(
+                json.dumps({"key": i.get("key"), "id": i.get("id"), "fields": i.get("fields") or {}}, ensure_ascii=False) + "\n"
+                for i in issues
+            ).encode())
+
+    def checkpoint(self, force=False):
+        """디스크에 반영하고 재개 위치를 반환 (페이지마다)."""
+        self.fp.flush()
+        os.fsync(self.fp.fileno())
+        return {"bytes": self.fp.tell()}
+
+    def close(self, done):
+        if self.fp:
+            self.fp.close()
+
+
+class _ParquetWriter:
+    """Parquet: 파일 끝(footer)을 써야 읽을 수 있어 이어 쓰기가 안 되므로, PARQUET_PART_ROWS행마다
+    <출력>.parts/ 아래 파트 파일로 저장하고 끝나면 하나로 합친다. 열은 모두 문자열."""
+
+    def __init__(self, path, fmt, fields):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ExportError("parquet 형식에는 pyarrow가 필요합니다: pip install pyarrow") from None
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.fields = fields
+        self.parts_dir = Path(f"{path}.parts")
+        self.schema = pyarrow.schema([(name, pyarrow.string()) for name in ["key"] + fields])
+        self.rows = []
+        self.parts = 0
+        self.merged = False
+
+    def _part(self, n):
+        return self.parts_dir / f"part-{n:05d}.parquet"
+
+    def open(self, state):
+        if state:
+            self.parts = state["parts"]
+            if state.get("complete") and Path(self.path).exists() and not all(self._part(n).exists() for n in range(self.parts)):
+                self.merged = True  # 합친 파일을 쓰고 파트를 지우던 중 중단됨 → 남은 파트만 정리
+                return
+            for extra in self.parts_dir.glob("part-*.parquet"):  # 체크포인트 이후에 쓰다 만 파트
+                if int(extra.stem.split("-")[1]) >= self.parts:
+                    extra.unlink()
+        else:
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(self, issues):
+        self.rows.extend(_row(i, self.fields) for i in issues)
+
+    def checkpoint(self, force=False):
+        """모인 행이 PARQUET_PART_ROWS 이상이면(force면 항상) 파트로 저장. 반환: 재개 위치 또는 None(아직 안 씀)."""
+        if not self.rows or (len(self.rows) < PARQUET_PART_ROWS and not force):
+            return None if self.rows else {"parts": self.parts}
+        columns = list(zip(*self.rows))
+        table = self.pa.table(
+            [self.pa.array(col, type=self.pa.string()) for col in columns], schema=self.schema,
+        )
+        part = self._part(self.parts)
+        tmp = part.with_suffix(".tmp")
+        self.pq.write_table(table, tmp)
+        os.replace(tmp, part)
+        self.parts += 1
+        self.rows = []
+        return {"parts": self.parts}
+
+    def close(self, done):
+        if not done:
+            return
+        if not self.merged:
+            tmp = Path(f"{self.path}.tmp")
+            with self.pq.ParquetWriter(tmp, self.schema) as writer:
+                for n in range(self.parts):  # 파트 하나씩 읽어 row group으로 (메모리는 파트 하나 분량)
+                    writer.write_table(self.pq.read_table(self._part(n), schema=self.schema))
+            os.replace(tmp, self.path)
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+
+
+# --- 체크포인트 ---
+
+
+def checkpoint_path(path):
+    return Path(f"{path}.checkpoint.json")
+
+
+def _load_checkpoint(path, job, restart):
+    """같은 작업(사이트·JQL·필드·형식)의 체크포인트가 있으면 반환. 다른 작업이면 ExportError."""
+    cp = checkpoint_path(path)
+    if restart or not cp.exists():
+        return None
+    try:
+        state = json.loads(cp.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if {k: state.get(k) for k in job} != job:
+        raise ExportError(
+            f"{path}에 다른 내보내기의 체크포인트가 있습니다 ({cp}). "
+            "처음부터 다시 받으려면 --restart, 아니면 다른 출력 파일을 지정하세요."
+        )
+    if not Path(path if job["format"] != "parquet" else f"{path}.parts").exists():
+        if state.get("complete") and Path(path).exists():
+            return state  # parquet 파트를 합치고 정리까지 끝났고 체크포인트만 남음
+        return None  # 체크포인트만 남고 출력이 지워짐 → 처음부터
+    return state
+
+
+def export(jql, path, fmt=None, fields=None, limit=None, page_size=None, restart=False, on_progress=None):
+    """JQL 결과를 path에 내보냄. 중단된 같은 작업의 체크포인트가 있으면 이어서 받는다 (restart=True면 처음부터).
+    fmt: csv, jsonl, parquet (없으면 확장자로 추정)
+    fields: 필드 목록·쉼표 구분 문자열·프리셋 (기본: EXPORT_FIELDS). 'full'(*all)은 jsonl에서만.
+    limit: 최대 건수 (재개 시 이미 받은 건수 포함)
+    on_progress(rows): 페이지를 쓸 때마다 호출
+    반환: {"rows", "resumed_from", "path", "format", "seconds"}
+    """
+    fmt = (fmt or guess_format(path)).lower()
+    if fmt not in FORMATS:
+        raise ExportError(f"지원하지 않는 형식: {fmt} ({', '.join(FORMATS)} 중 하나)")
+    fields = jira_cli.resolve_fields(fields, EXPORT_FIELDS)
+    if fmt != "jsonl" and any(f.startswith("*") for f in fields):
+        raise ExportError(f"{fmt} 형식은 열을 미리 정해야 하므로 '*all' 같은 필드 묶음은 jsonl에서만 쓸 수 있습니다.")
+    job = {"site": jira_cli.JIRA_BASE_URL, "jql": jql, "fields": fields, "format": fmt}
+    state = _load_checkpoint(path, job, restart)
+    writer = (_ParquetWriter if fmt == "parquet" else _LineWriter)(path, fmt, fields)
+    started = time.monotonic()
+    rows = resumed = state["rows"] if state else 0
+    cp = checkpoint_path(path)
+
+    def save(position, token, complete=False):
+        jira_cli._atomic_write_json(
+            cp, dict(job, next_page_token=token, rows=rows, complete=complete, updated=time.time(), **position),
+        )
+
+    writer.open(state)
+    done = False
+    try:
+        if not state:
+            save(writer.checkpoint(force=True), None)
+        # complete: 끝까지 받았지만 마무리(Parquet 파트 합치기, 체크포인트 삭제) 전에 중단됨 → 받지 않고 마무리만
+        if not (state and state.get("complete")) and (limit is None or limit > rows):
+            pages = jira_cli.iter_search_pages(
+                jql, fields=fields, page_size=page_size,
+                limit=None if limit is None else limit - rows,
+                start_token=state["next_page_token"] if state else None,
+            )
+            try:
+                for issues, next_token in pages:
+                    writer.write(issues)
+                    rows += len(issues)
+                    # 파일에 반영된 뒤에만 체크포인트를 옮김 (Parquet은 파트를 쓸 때마다)
+                    position = writer.checkpoint(force=next_token is None)
+                    if position is not None:
+                        save(position, next_token)
+                    if on_progress:
+                        on_progress(rows)
+            except jira_cli.requests.HTTPError as e:
+                if state and rows == resumed and e.response is not None and e.response.status_code == 400:
+                    raise ExportError(
+                        "체크포인트의 nextPageToken을 Jira가 받지 않습니다 (만료 등). --restart로 처음부터 다시 받으세요."
+                    ) from e
+                raise
+        if not (state and state.get("complete")):
+            # 마지막 페이지의 체크포인트도 next_page_token이 None이라 시작 전과 구분되지 않으므로 완료를 따로 표시
+            save(writer.checkpoint(force=True), None, complete=True)
+        done = True
+    finally:
+        writer.close(done)
+    cp.unlink(missing_ok=True)
+    return {
+        "rows": rows, "resumed_from": resumed, "path": str(path), "format": fmt,
+        "seconds": round(time.monotonic() - started, 1),
+    }
@@ -0,0 +1,426 @@
+"""
+로컬 SQLite 이슈 미러 - 선택한 프로젝트의 이슈를 내려받아 두고 네트워크 없이 목록·검색·상세를 조회.
+동기화는 증분(updated >= 마지막 동기화 시각)으로 jira_cli.iter_search를 통해 이뤄지고,
+제목·설명은 FTS5(trigram) 인덱스로 부분 문자열 검색이 가능하다.
+DB 위치: JIRA_MIRROR_DB (기본 ~/.config/jira-helper/mirror.db)
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime
+
+import jira_cli
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+    ZoneInfoNotFoundError = Exception
+
+MIRROR_DB = os.path.expanduser(os.getenv("JIRA_MIRROR_DB", "~/.config/jira-helper/mirror.db"))
+# 이보다 오래된 미러는 --cached에서 사용하지 않고, --offline에서는 경고를 출력 (초)
+MIRROR_MAX_AGE = float(os.getenv("JIRA_MIRROR_MAX_AGE", "900"))
+MIRROR_FIELDS = ["summary", "status", "issuetype", "priority", "updated", "assignee", "description"]
+# JQL 날짜는 분 단위이고 서버·클라이언트 시계가 다를 수 있으므로 앞 구간을 조금 겹쳐서 가져옴 (upsert라 중복 무해)
+SYNC_OVERLAP = 120
+_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    project TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    status TEXT,
+    issuetype TEXT,
+    priority TEXT,
+    assignee TEXT,
+    assignee_account_id TEXT,
+    updated TEXT,
+    updated_ts REAL,
+    description TEXT NOT NULL DEFAULT '',
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project_updated ON issues(project, updated_ts);
+CREATE INDEX IF NOT EXISTS issues_assignee_updated ON issues(assignee_account_id, updated_ts);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    last_sync REAL NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5(
+    summary, description, content='issues', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS issues_ai AFTER INSERT ON issues BEGIN
+    INSERT INTO issues_fts(rowid, summary, description) VALUES (new.rowid, new.summary, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS issues_ad AFTER DELETE ON issues BEGIN
+    INSERT INTO issues_fts(issues_fts, rowid, summary, description)
+    VALUES ('delete', old.rowid, old.summary, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS issues_au AFTER UPDATE ON issues BEGIN
+    INSERT INTO issues_fts(issues_fts, rowid, summary, description)
+    VALUES ('delete', old.rowid, old.summary, old.description);
+    INSERT INTO issues_fts(rowid, summary, description) VALUES (new.rowid, new.summary, new.description);
+END;
+"""
+
+# trigram 토크나이저는 3글자 이상 토큰만 색인하므로, 더 짧은 토큰은 LIKE로 찾음
+_FTS_MIN_TOKEN = 3
+
+
+def connect(path=None):
+    """미러 DB 연결 (없으면 스키마 생성). WAL 모드라 CLI와 MCP 서버가 동시에 읽을 수 있음."""
+    path = path or MIRROR_DB
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    try:
+        conn.executescript(_FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        pass  # FTS5/trigram 미지원 SQLite: LIKE 검색으로 대체
+    return conn
+
+
+def _has_fts(conn):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'issues_fts'").fetchone() is not None
+
+
+def _parse_updated(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _row(issue):
+    f = issue.get("fields") or {}
+    assignee = f.get("assignee") or {}
+    return (
+        issue["key"],
+        issue.get("id"),
+        issue["key"].rsplit("-", 1)[0],
+        f.get("summary") or "",
+        (f.get("status") or {}).get("name"),
+        (f.get("issuetype") or {}).get("name"),
+        (f.get("priority") or {}).get("name"),
+        assignee.get("displayName"),
+        assignee.get("accountId"),
+        f.get("updated"),
+        _parse_updated(f.get("updated")),
+        jira_cli.adf_to_text(f.get("description")).strip(),
+        json.dumps(issue, ensure_ascii=False),
+    )
+
+
+def _upsert(conn, rows):
+    if not rows:
+        return
+    conn.executemany(
+        """
+        INSERT INTO issues (key, id, project, summary, status, issuetype, priority, assignee,
+                            assignee_account_id, updated, updated_ts, description, raw)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET
+            id = excluded.id, project = excluded.project, summary = excluded.summary,
+            status = excluded.status, issuetype = excluded.issuetype, priority = excluded.priority,
+            assignee = excluded.assignee, assignee_account_id = excluded.assignee_account_id,
+            updated = excluded.updated, updated_ts = excluded.updated_ts,
+            description = excluded.description, raw = excluded.raw
+        """,
+        rows,
+    )
+    conn.commit()
+
+
+def _jql_datetime(ts):
+    """epoch 초를 JQL 날짜("yyyy/MM/dd HH:mm")로. JQL은 사용자 프로필 시간대로 해석하므로 그 시간대로 변환."""
+    tz = None
+    name = (jira_cli.get_metadata("myself") or {}).get("timeZone")
+    if name and ZoneInfo is not None:
+        try:
+            tz = ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            tz = None
+    return datetime.fromtimestamp(ts, tz).strftime("%Y/%m/%d %H:%M")
+
+
+def synced_projects(conn):
+    return [r["project"] for r in conn.execute("SELECT project FROM sync_state ORDER BY project")]
+
+
+def sync(projects=None, full=False, on_progress=None):
+    """프로젝트 이슈를 미러로 동기화. 이전 동기화 이후 변경분만 가져오고, full=True면 전체를 다시 받고
+    서버에서 사라진 이슈를 삭제한다.
+    projects: 프로젝트 키 목록 (없으면 이전에 동기화한 프로젝트 → JIRA_MIRROR_PROJECTS 순)
+    on_progress(project, count): 배치마다 호출
+    반환: {프로젝트: 받은 이슈 수}
+    """
+    conn = connect()
+    try:
+        if projects:
+            projects = [p.strip().upper() for p in projects if p.strip()]
+        else:
+            projects = synced_projects(conn) or jira_cli.parse_issue_keys(os.getenv("JIRA_MIRROR_PROJECTS", ""))
+        if not projects:
+            raise ValueError("동기화할 프로젝트를 지정해주세요. (예: jira sync PROJ 또는 JIRA_MIRROR_PROJECTS)")
+        results = {}
+        for project in projects:
+            started = time.time()
+            state = conn.execute("SELECT last_sync FROM sync_state WHERE project = ?", (project,)).fetchone()
+            jql = f'project = "{project}"'
+            if state and not full:
+                jql += f' AND updated >= "{_jql_datetime(state["last_sync"] - SYNC_OVERLAP)}"'
+            jql += " ORDER BY updated ASC"
+            if full:
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY)")
+                conn.execute("DELETE FROM seen")
+            count = 0
+            batch = []
+            for issue in jira_cli.iter_search(jql, fields=MIRROR_FIELDS):
+                batch.append(_row(issue))
+                count += 1
+                if len(batch) >= _BATCH:
+                    if full:
+                        conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", [(r[0],) for r in batch])
+                    _upsert(conn, batch)
+                    batch = []
+                    if on_progress:
+                        on_progress(project, count)
+            if full:
+                conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", [(r[0],) for r in batch])
+            _upsert(conn, batch)
+            if full:
+                conn.execute("DELETE FROM issues WHERE project = ? AND key NOT IN (SELECT key FROM seen)", (project,))
+            conn.execute(
+                "INSERT INTO sync_state (project, last_sync) VALUES (?, ?) "
+                "ON CONFLICT(project) DO UPDATE SET last_sync = excluded.last_sync",
+                (project, started),
+            )
+            conn.commit()
+            if on_progress:
+                on_progress(project, count)
+            results[project] = count
+        return results
+    finally:
+        conn.close()
+
+
+def status():
+    """동기화 현황: [{"project", "issues", "last_sync"}]"""
+    conn = connect()
+    try:
+        rows = conn.execute(
+            """
+            SELECT s.project, s.last_sync, (SELECT COUNT(*) FROM issues i WHERE i.project = s.project) AS issues
+            FROM sync_state s ORDER BY s.project
+            """
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def age(projects=None):
+    """지정 프로젝트(없으면 전체) 중 가장 오래된 동기화로부터 지난 시간(초). 동기화한 적 없으면 None."""
+    conn = connect()
+    try:
+        if projects:
+            marks = ",".join("?" * len(projects))
+            row = conn.execute(
+                f"SELECT MIN(last_sync) AS t, COUNT(*) AS n FROM sync_state WHERE project IN ({marks})",
+                [p.upper() for p in projects],
+            ).fetchone()
+            if row["n"] < len(set(projects)):
+                return None
+        else:
+            row = conn.execute("SELECT MIN(last_sync) AS t FROM sync_state").fetchone()
+        return None if row["t"] is None else time.time() - row["t"]
+    finally:
+        conn.close()
+
+
+def _as_issue(row):
+    """목록 출력(format_issue_row)에 필요한 최소 형태로 변환."""
+    return {
+        "key": row["key"],
+        "fields": {
+            "summary": row["summary"],
+            "status": {"name": row["status"]},
+            "issuetype": {"name": row["issuetype"]},
+            "priority": {"name": row["priority"]},
+            "updated": row["updated"],
+        },
+    }
+
+
+def my_issues(status=None, max_results=20):
+    """미러에서 내게 할당된 이슈 목록 (jira_cli.my_issues와 같은 조건)."""
+    me = jira_cli._meta.peek("myself")
+    if not me:
+        raise RuntimeError("내 계정 정보가 로컬에 없습니다. 온라인에서 `jira meta refresh myself`를 먼저 실행해주세요.")
+    # jira_cli._my_issues_jql과 같은 조건 (done 외에는 미완료)
+    if (status or "").lower() == "done":
+        cond = "status = 'Done' COLLATE NOCASE"
+    else:
+        cond = "status != 'Done' COLLATE NOCASE"
+    conn = connect()
+    try:
+        rows = conn.execute(
+            f"SELECT * FROM issues WHERE assignee_account_id = ? AND {cond} ORDER BY updated_ts DESC LIMIT ?",
+            (me.get("accountId"), max_results),
+        ).fetchall()
+        return [_as_issue(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def search_text(query, project=None, max_results=20):
+    """제목·설명 전문 검색. 공백으로 나눈 단어가 모두 포함된 이슈를 최근 수정 순으로 반환."""
+    conn = connect()
+    try:
+        tokens = query.split()
+        fts = _has_fts(conn)
+        where, params = [], []
+        long_tokens = [t for t in tokens if fts and len(t) >= _FTS_MIN_TOKEN]
+        if long_tokens:
+            where.append("rowid IN (SELECT rowid FROM issues_fts WHERE issues_fts MATCH ?)")
+            params.append(" ".join('"' + t.replace('"', '""') + '"' for t in long_tokens))
+        for t in tokens:
+            if t not in long_tokens:
+                where.append("(summary LIKE ? OR description LIKE ?)")
+                params += [f"%{t}%", f"%{t}%"]
+        if project:
+            where.append("project = ?")
+            params.append(project.strip().upper())
+        sql = "SELECT * FROM issues"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY updated_ts DESC LIMIT ?"
+        rows = conn.execute(sql, params + [max_results]).fetchall()
+        return [_as_issue(r) for r in rows]
+    finally:
+        conn.close()
+
+
+# --- JQL 부분 집합 ---
+# search --cached/--offline, MCP jira_search(cached=True)에서 미러로 답할 수 있는 JQL: AND로만 이은 아래 조건과
+# ORDER BY updated ASC/DESC. 그 밖의 JQL(OR, 괄호, 다른 필드·함수·정렬)은 plan_jql()이 None을 돌려주고 온라인으로 검색한다.
+JQL_SUBSET = (
+    "project·status·issuetype(type)·priority·key = / != / in / not in / is [not] EMPTY, "
+    "assignee = / != currentUser(), assignee is [not] EMPTY, AND로 연결, ORDER BY updated ASC|DESC"
+)
+_JQL_COLUMNS = {
+    "project": "project", "status": "status", "issuetype": "issuetype", "type": "issuetype",
+    "priority": "priority", "key": "key", "issuekey": "key", "assignee": "assignee_account_id",
+}
+_JQL_VALUE = r"""(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[^\s(),"'=!]+(?:\(\))?)"""
+_JQL_CLAUSE = re.compile(
+    rf"\s*(\w+)\s*(!=|=|not\s+in\b|in\b|is\s+not\b|is\b)\s*"
+    rf"(\(\s*{_JQL_VALUE}(?:\s*,\s*{_JQL_VALUE})*\s*\)|{_JQL_VALUE})\s*",
+    re.I,
+)
+_JQL_AND = re.compile(r"and\b\s*", re.I)
+_JQL_ORDER = re.compile(r"\border\s+by\s+(.*)$", re.I | re.S)
+_JQL_ORDER_UPDATED = re.compile(r"updated\s+(asc|desc)", re.I)
+
+
+def _jql_values(text):
+    """값 또는 (값, ...) → [(문자열, 따옴표 여부)]."""
+    text = text.strip()
+    if text.startswith("("):
+        return [_jql_values(v)[0] for v in re.findall(_JQL_VALUE, text[1:-1])]
+    if text[:1] in ("'", '"'):
+        return [(re.sub(r"\\(.)", r"\1", text[1:-1]), True)]
+    return [(text, False)]
+
+
+def plan_jql(jql, account_id=None):
+    """미러로 답할 수 있는 JQL이면 {"where", "params", "order", "projects"}, 아니면 None.
+    projects: project = / in 조건의 프로젝트 (미러 최신 여부 확인용, 없으면 None = 동기화한 전체)
+    account_id: currentUser()로 쓸 accountId (없으면 currentUser() 조건은 답할 수 없음)
+    """
+    text = jql.strip()
+    order = "updated_ts DESC"
+    m = _JQL_ORDER.search(text)
+    if m:
+        o = _JQL_ORDER_UPDATED.fullmatch(m.group(1).strip())
+        if not o:
+            return None
+        order = f"updated_ts {o.group(1).upper()}"
+        text = text[:m.start()]
+    where, params, projects = [], [], None
+    pos = 0
+    while text[pos:].strip():
+        c = _JQL_CLAUSE.match(text, pos)
+        column = _JQL_COLUMNS.get(c.group(1).lower()) if c else None
+        if column is None:
+            return None
+        op = " ".join(c.group(2).lower().split())
+        values = _jql_values(c.group(3))
+        empty = len(values) == 1 and not values[0][1] and values[0][0].upper() in ("EMPTY", "NULL")
+        if op in ("is", "is not") or empty:
+            if not empty or op in ("in", "not in"):
+                return None
+            where.append(f"{column} IS {'NOT ' if op in ('is not', '!=') else ''}NULL")
+        elif (op in ("in", "not in")) != c.group(3).strip().startswith("("):
+            return None
+        else:
+            names = []
+            for value, quoted in values:
+                if column == "assignee_account_id":
+                    if quoted or value.lower() != "currentuser()" or not account_id:
+                        return None  # 사용자 이름·accountId 조건은 미러에 이름 색인이 없으므로 온라인으로
+                    value = account_id
+                elif not quoted and (value.endswith("()") or (value.isdigit() and column != "key")):
+                    return None  # 함수, 숫자 id
+                names.append(value.upper() if column in ("project", "key") else value)
+            marks = ", ".join("?" * len(names))
+            negate = op in ("!=", "not in")
+            # 프로젝트·키는 대문자로 저장되어 있으므로 그대로 비교 (색인 사용), 이름은 Jira처럼 대소문자 무시
+            collate = " COLLATE NOCASE" if column in ("status", "issuetype", "priority") else ""
+            where.append(f"{column}{collate} {'NOT ' if negate else ''}IN ({marks})")
+            params += names
+            if column == "project" and not negate:
+                projects = sorted(set(names) & set(projects or names))
+        pos = c.end()
+        a = _JQL_AND.match(text, pos)
+        if a:
+            pos = a.end()
+            if not text[pos:].strip():
+                return None
+        elif text[pos:].strip():
+            return None
+    return {"where": " AND ".join(where) or "1", "params": params, "order": order, "projects": projects}
+
+
+def search_jql(plan, max_results=20):
+    """plan_jql()의 결과를 미러에서 실행. max_results가 None이면 전부."""
+    conn = connect()
+    try:
+        sql = f"SELECT * FROM issues WHERE {plan['where']} ORDER BY {plan['order']}"
+        params = list(plan["params"])
+        if max_results is not None:
+            sql += " LIMIT ?"
+            params.append(max_results)
+        return [_as_issue(r) for r in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def get_issue(issue_key):
+    """미러에 저장된 이슈 원본 데이터 (없으면 None)."""
+    conn = connect()
+    try:
+        row = conn.execute("SELECT raw FROM issues WHERE key = ?", (issue_key.strip().upper(),)).fetchone()
+        return json.loads(row["raw"]) if row else None
+    finally:
+        conn.close()
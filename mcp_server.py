@@ -5,7 +5,13 @@ Jira MCP Server - Cursor 등에서 "지라 티켓 조회해줘"처럼 도구로
 """
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+import logging
+import os
 import sys
+import time
 from pathlib import Path
 
 # 프로젝트 루트에서 jira_cli 로드 (pip install -e . 한 경우에도 동작)
@@ -17,7 +23,16 @@ except ImportError:
     print("mcp 패키지가 필요합니다: pip install mcp", file=sys.stderr)
     sys.exit(1)
 
+import jira_async
 import jira_cli
+import jira_mirror
+
+# 도구 호출마다 jira_async·jira_cli 함수 단계별 시간과 요청 지표를 남김 (jira_stats, JIRA_METRICS_FILE)
+jira_cli.instrument()
+jira_cli.instrument(jira_async)
+
+# httpx가 요청마다 남기는 INFO 로그는 도구 호출이 많을 때 stderr를 가득 채우므로 경고 이상만 남김
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 mcp = FastMCP(
     "jira-helper",
@@ -25,93 +40,365 @@ mcp = FastMCP(
 )
 
 
+def _mirror_fresh(projects=None):
+    """로컬 미러가 JIRA_MIRROR_MAX_AGE 이내로 동기화돼 있는지."""
+    age = jira_mirror.age(projects)
+    return age is not None and age <= jira_mirror.MIRROR_MAX_AGE
+
+
+# --- 검색 커서 (jira_list·jira_search → jira_search_next) ---
+# 응답마다 max_results건·max_chars자 안에서 행을 채우고, 멈춘 위치를 불투명한 cursor로 돌려준다.
+# cursor = JQL·필드·페이지 크기 + 멈춘 페이지의 nextPageToken + 그 페이지에서 이미 보낸 행 수 (base64 JSON).
+# 다음 호출은 그 페이지부터 이어서 받으므로 앞쪽 행을 다시 받지 않는다 (페이지 중간에서 끊겼다면 그 페이지만 한 번 더, 대개 응답 캐시 적중).
+# JIRA_MCP_MAX_CHARS: max_chars를 주지 않았을 때의 응답 문자 수 한도 (0이면 제한 없음)
+MCP_MAX_CHARS = int(os.getenv("JIRA_MCP_MAX_CHARS", "0"))
+_CURSOR_RESERVE = 120  # 머리글·다음 페이지 안내 문구 몫
+
+
+def _encode_cursor(state):
+    raw = json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.strip() + "=" * (-len(cursor.strip()) % 4))
+        state = json.loads(raw)
+    except ValueError:
+        raise ValueError("cursor가 올바르지 않습니다. jira_list·jira_search가 돌려준 값을 그대로 넘기세요.") from None
+    if not isinstance(state, dict) or not state.get("jql") or state.get("site") != jira_cli.JIRA_BASE_URL:
+        raise ValueError("cursor가 올바르지 않거나 다른 Jira 사이트의 것입니다.")
+    return state
+
+
+def _budget(state, max_chars):
+    """행에 쓸 수 있는 문자 수 (제한 없으면 None). 다음 cursor 몫까지 빼 둠 (nextPageToken 길이만큼 늘어날 수 있음)."""
+    max_chars = max_chars or MCP_MAX_CHARS
+    if not max_chars:
+        return None
+    tokens = len(state.get("sites") or {}) or 1
+    return max(1, max_chars - _CURSOR_RESERVE - len(_encode_cursor(state)) - 256 * tokens)
+
+
+async def _search_window(state, max_results, max_chars):
+    """state(cursor)의 위치부터 max_results건·max_chars자 안에서 목록 행을 채운다.
+    반환: (행 목록, 다음 cursor 또는 None)
+    """
+    if state.get("sites"):
+        return await _search_sites_window(state, max_results, max_chars)
+    max_results = max(1, max_results)
+    budget = _budget(state, max_chars)
+    token, skip = state.get("token"), state.get("skip", 0)
+    rows, used = [], 0
+
+    def next_cursor(at_token, at_skip):
+        return _encode_cursor(dict(state, token=at_token, skip=at_skip))
+
+    while True:
+        data = await jira_async._search_page(state["jql"], state["fields"], state["size"], token)
+        issues = data.get("issues", [])
+        more = data.get("nextPageToken") if not data.get("isLast") and issues else None
+        for i in range(skip, len(issues)):
+            jira_cli._transitions.remember(issues[i])
+            row = jira_cli.format_issue_row(issues[i], state["extra"])
+            # 한 건도 못 보내면 진행이 없으므로 첫 행은 예산과 무관하게 포함
+            if len(rows) >= max_results or (budget is not None and rows and used + len(row) + 1 > budget):
+                return rows, next_cursor(token, i)
+            rows.append(row)
+            used += len(row) + 1
+        if not more:
+            return rows, None
+        if len(rows) >= max_results:
+            return rows, next_cursor(more, 0)
+        token, skip = more, 0
+
+
+async def _search_sites_window(state, max_results, max_chars):
+    """여러 사이트 검색의 _search_window. cursor에는 사이트별 위치(멈춘 페이지 토큰·건너뛸 건수, 끝났으면 None)를 담는다."""
+    max_results = max(1, max_results)
+    budget = _budget(state, max_chars)
+    positions = dict(state["sites"])
+    rows, used = [], 0
+    merged = jira_async.iter_search_sites(
+        state["jql"], list(positions), fields=state["fields"], page_size=state["size"], positions=positions,
+    )
+    try:
+        async for issue, nxt in merged:
+            row = jira_cli.format_issue_row(issue, state["extra"])
+            if len(rows) >= max_results or (budget is not None and rows and used + len(row) + 1 > budget):
+                return rows, _encode_cursor(dict(state, sites=positions))  # 이 이슈의 사이트 위치는 그대로
+            rows.append(row)
+            used += len(row) + 1
+            positions[issue["site"]] = nxt
+    finally:
+        await merged.aclose()
+    return rows, None
+
+
+async def _search_response(title, state, max_results, max_chars):
+    rows, cursor = await _search_window(state, max_results, max_chars)
+    text = f"{title} ({len(rows)}건{', 더 있음' if cursor else ''})\n" + ("\n".join(rows) or "결과 없음.")
+    if cursor:
+        text += f'\n\n다음 페이지: jira_search_next(cursor="{cursor}")'
+    return text
+
+
+def _new_search(jql, fields, title, max_results, sites=""):
+    wanted, extra = jira_cli.field_projection(fields, jira_cli.LIST_FIELDS, "minimal")
+    state = {
+        "site": jira_cli.JIRA_BASE_URL, "jql": jql, "fields": wanted, "extra": extra, "title": title,
+        "size": max(1, min(max_results, jira_cli.SEARCH_PAGE_SIZE)), "token": None, "skip": 0,
+    }
+    if sites.strip():
+        chosen = jira_cli.parse_sites(sites)
+        state["fields"] = jira_cli.site_fields(jql, wanted)
+        state["sites"] = {s.name: {"token": None, "skip": 0} for s in chosen}
+        state["title"] = f"{title} ({', '.join(s.name for s in chosen)})"
+    return state
+
+
 @mcp.tool()
-def jira_list(
+async def jira_list(
     status: str = "open",
     max_results: int = 20,
+    cached: bool = False,
+    fields: str = "",
+    max_chars: int = 0,
+    sites: str = "",
 ) -> str:
-    """내게 할당된 Jira 티켓 목록을 조회합니다.
+    """내게 할당된 Jira 티켓 목록을 조회합니다. 더 있으면 끝에 jira_search_next용 cursor를 돌려줍니다.
     - status: open(미완료), done(완료), all(전체). 기본값 open.
-    - max_results: 최대 개수. 기본값 20.
+    - max_results: 이번 응답의 최대 개수. 기본값 20.
+    - cached: True면 로컬 미러(jira sync)가 최신일 때 네트워크 없이 미러에서 조회 (cursor 없음).
+    - fields: 행마다 덧붙여 볼 추가 필드 (쉼표 구분, 예: 'assignee,duedate'). 비우면 목록 출력에 쓰는 필드만 요청.
+    - max_chars: 응답 최대 문자 수 (컨텍스트 예산, 토큰 수의 약 2~4배). 넘치면 그 앞에서 끊고 cursor로 이어 받음. 0이면 기본값(JIRA_MCP_MAX_CHARS, 제한 없음).
+    - sites: 여러 Jira 사이트 프로필을 동시에 조회해 최근 수정 순으로 합침 (쉼표 구분, 예: 'default,oss'). 비우면 기본 사이트.
     """
     try:
-        issues = jira_cli.my_issues(status=status, max_results=max_results)
         label = {"open": "미완료", "done": "완료", "all": "전체"}.get(status, status)
-        return f"내 티켓 ({label}, {len(issues)}건)\n" + jira_cli.format_issue_list(issues)
+        state = _new_search(jira_cli._my_issues_jql(status), fields, f"내 티켓 ({label})", max_results, sites)
+        if cached and not state["extra"] and not sites.strip() and _mirror_fresh():
+            issues = jira_mirror.my_issues(status=status, max_results=max_results)
+            return f"내 티켓 ({label}, 미러, {len(issues)}건)\n" + jira_cli.format_issue_list(issues)
+        return await _search_response(state["title"], state, max_results, max_chars)
     except Exception as e:
         return f"오류: {e}"
 
 
 @mcp.tool()
-def jira_show(issue_key: str) -> str:
-    """Jira 티켓 한 건의 상세 정보를 조회합니다.
-    - issue_key: 이슈 키 (예: PROJ-123)
+async def jira_show(issue_key: str, cached: bool = False, fields: str = "", max_chars: int = 0) -> str:
+    """Jira 티켓 상세 정보를 조회합니다. 여러 건이면 한 번에 넘기세요 (요청 한 번에 최대 50건). 설명은 Markdown으로 반환합니다.
+    - issue_key: 이슈 키 (예: PROJ-123). 여러 개면 쉼표·공백 구분 (예: 'PROJ-1, PROJ-2, OTHER-7'). 요청한 순서대로 반환.
+    - cached: True면 로컬 미러(jira sync)가 최신일 때 미러에서 조회.
+    - fields: 상세 아래에 덧붙여 볼 추가 필드 (쉼표 구분, 예: 'labels,customfield_10016'). 'full'이면 전체 필드 요청.
+    - max_chars: 이슈별 설명 최대 문자 수. 0이면 기본값(JIRA_DESCRIPTION_MAX_CHARS, 4000). 잘린 경우 끝에 표시됨.
+    없거나 볼 권한이 없는 키는 마지막 줄에 따로 알려줍니다.
     """
     try:
-        data = jira_cli.get_issue(issue_key)
-        return jira_cli.format_issue_detail(data)
+        keys = jira_cli.parse_issue_keys(issue_key)
+        if not keys:
+            return "오류: issue_key를 지정해주세요."
+        wanted, extra = jira_cli.field_projection(fields or "detail", jira_cli.FIELD_PRESETS["detail"], "detail")
+        found, missing = {}, []
+        if cached and not extra and _mirror_fresh(sorted({k.rsplit("-", 1)[0] for k in keys})):
+            for key in keys:
+                data = jira_mirror.get_issue(key)
+                if data:
+                    found[key] = data
+        online = [k for k in keys if k not in found]
+        if len(online) == 1:
+            found[online[0]] = await jira_async.get_issue(online[0], fields=wanted)
+        elif online:
+            fetched, missing = await jira_async.get_issues(online, fields=wanted)
+            found.update(fetched)
+        parts = [jira_cli.format_issue_detail(found[k], extra, max_chars=max_chars or None) for k in keys if k in found]
+        if missing:
+            parts.append(f"없거나 볼 권한이 없는 이슈: {', '.join(missing)}")
+        return "\n\n".join(parts)
     except Exception as e:
         return f"오류: {e}"
 
 
 @mcp.tool()
-def jira_search(jql: str, max_results: int = 20) -> str:
-    """JQL로 Jira 이슈를 검색합니다.
-    - jql: Jira Query Language (예: project = MYPROJ AND status = 'In Progress')
+async def jira_search_local(query: str, project: str = "", max_results: int = 20) -> str:
+    """로컬 미러(jira sync로 받아 둔 이슈)에서 제목·설명을 전문 검색합니다. 네트워크 요청 없음.
+    - query: 검색어 (공백으로 구분한 단어가 모두 포함된 이슈)
+    - project: 프로젝트 키로 제한 (선택)
     - max_results: 최대 개수. 기본값 20.
     """
     try:
-        issues = jira_cli.search(jql, max_results=max_results)
-        return f"검색 결과 ({len(issues)}건)\n" + jira_cli.format_issue_list(issues)
+        issues = jira_mirror.search_text(query, project=project or None, max_results=max_results)
+        age = jira_mirror.age([project] if project else None)
+        note = "동기화 안 됨" if age is None else f"{int(age // 60)}분 전 동기화"
+        return f"미러 검색 결과 ({len(issues)}건, {note})\n" + jira_cli.format_issue_list(issues)
+    except Exception as e:
+        return f"오류: {e}"
+
+
+@mcp.tool()
+async def jira_sync(projects: str = "", full: bool = False) -> str:
+    """Jira 프로젝트 이슈를 로컬 미러로 동기화합니다 (기본: 변경분만).
+    - projects: 프로젝트 키 목록 (공백·쉼표 구분). 비우면 이전에 동기화한 프로젝트.
+    - full: True면 전체를 다시 받고 삭제된 이슈를 정리.
+    """
+    try:
+        keys = jira_cli.parse_issue_keys(projects)
+        results = await asyncio.to_thread(jira_mirror.sync, keys, full)
+        return "\n".join(f"{p}: {n}건 동기화" for p, n in results.items())
+    except Exception as e:
+        return f"오류: {e}"
+
+
+@mcp.tool()
+async def jira_search(
+    jql: str, max_results: int = 20, fields: str = "", max_chars: int = 0, sites: str = "", cached: bool = False,
+) -> str:
+    """JQL로 Jira 이슈를 검색합니다. 더 있으면 끝에 cursor를 돌려주므로, 더 볼 때는 jira_search_next에 넘기세요 (같은 검색을 더 큰 max_results로 다시 부르지 말 것).
+    - jql: Jira Query Language (예: project = MYPROJ AND status = 'In Progress')
+    - max_results: 이번 응답의 최대 개수. 기본값 20.
+    - fields: 행마다 덧붙여 볼 추가 필드 (쉼표 구분, 예: 'assignee,labels'). 비우면 기본 목록 필드만 요청.
+    - max_chars: 응답 최대 문자 수 (컨텍스트 예산, 토큰 수의 약 2~4배). 넘치면 그 앞에서 끊고 cursor로 이어 받음. 0이면 기본값(JIRA_MCP_MAX_CHARS, 제한 없음).
+    - sites: 여러 Jira 사이트 프로필을 동시에 검색해 JQL의 ORDER BY 순으로 합침 (쉼표 구분, 예: 'default,oss'). 비우면 기본 사이트.
+    - cached: True면 로컬 미러(jira sync)가 최신이고 JQL이 단순할 때(project·status·issuetype·priority·key 조건,
+      assignee = currentUser(), AND, ORDER BY updated ASC|DESC; project 조건 필수) 네트워크 없이 미러에서 조회. 아니면 온라인 검색.
+    """
+    try:
+        state = _new_search(jql, fields, "검색 결과", max_results, sites)
+        if cached and not state["extra"] and not sites.strip():
+            me = await asyncio.to_thread(jira_cli._meta.peek, "myself") or {}
+            plan = jira_mirror.plan_jql(jql, account_id=me.get("accountId"))
+            if plan is not None and plan["projects"] and _mirror_fresh(plan["projects"]):
+                issues = jira_mirror.search_jql(plan, max_results=max_results)
+                return f"검색 결과 (미러, {len(issues)}건)\n" + jira_cli.format_issue_list(issues)
+        return await _search_response(state["title"], state, max_results, max_chars)
     except Exception as e:
         return f"오류: {e}"
 
 
 @mcp.tool()
-def jira_transition(issue_key: str, target_status: str) -> str:
+async def jira_search_next(cursor: str, max_results: int = 20, max_chars: int = 0) -> str:
+    """jira_list·jira_search(또는 이전 jira_search_next)가 돌려준 cursor 다음부터 이어서 조회합니다. 앞쪽 결과는 다시 받지 않습니다.
+    - cursor: 이전 응답 끝의 cursor 값 그대로
+    - max_results: 이번 응답의 최대 개수. 기본값 20.
+    - max_chars: 응답 최대 문자 수. 0이면 기본값(JIRA_MCP_MAX_CHARS).
+    """
+    try:
+        state = _decode_cursor(cursor)
+        return await _search_response(state.get("title") or "검색 결과", state, max_results, max_chars)
+    except Exception as e:
+        return f"오류: {e}"
+
+
+@mcp.tool()
+async def jira_count(jql: str) -> str:
+    """JQL 결과 건수만 셉니다 (근사치). 이슈를 받지 않으므로 몇 건인지만 필요할 때 jira_search 대신 사용하세요.
+    - jql: Jira Query Language (예: project = MYPROJ AND type = Bug AND resolution = Unresolved)
+    """
+    try:
+        return f"{await jira_async.count_issues(jql):,}건 (근사치)"
+    except Exception as e:
+        return f"오류: {e}"
+
+
+@mcp.tool()
+async def jira_count_by(jql: str, group_by: str = "status", max_issues: int = 0) -> str:
+    """JQL 결과를 필드 값별 건수로 집계합니다 (예: 상태별·담당자별 미해결 버그 수). 이슈 목록은 반환하지 않습니다.
+    - jql: Jira Query Language
+    - group_by: status, assignee, priority, issuetype 중 하나. 기본값 status.
+    - max_issues: 집계할 최대 이슈 수. 0이면 전체.
+    """
+    try:
+        rows = await jira_async.group_counts(jql, group_by=group_by, limit=max_issues or None)
+        if not rows:
+            return "결과 없음"
+        return jira_cli.format_group_counts(rows, group_by)
+    except Exception as e:
+        return f"오류: {e}"
+
+
+@mcp.tool()
+async def jira_transition(issue_key: str, target_status: str) -> str:
     """Jira 티켓의 상태를 변경합니다.
     - issue_key: 이슈 키 (예: PROJ-123)
     - target_status: 목표 상태명. 예: In Progress(착수), Resolved(해결), Closed(완료).
       부분 일치 지원 (예: 'progress'로 In Progress 전환 가능).
     """
     try:
-        ok, msg = jira_cli.transition_to_status(issue_key, target_status)
+        ok, msg = await jira_async.transition_to_status(issue_key, target_status)
         return msg
     except Exception as e:
         return f"오류: {e}"
 
 
 @mcp.tool()
-def jira_create(
+async def jira_transition_bulk(
+    target_status: str,
+    issue_keys: str = "",
+    jql: str = "",
+    dry_run: bool = False,
+    max_workers: int = 8,
+) -> str:
+    """여러 Jira 티켓의 상태를 한 번에 변경합니다. 이슈별 성공/실패를 함께 반환합니다.
+    - target_status: 목표 상태명 (예: Resolved, Closed). 부분 일치 지원.
+    - issue_keys: 대상 이슈 키 목록 (공백·쉼표 구분, 예: "PROJ-1, PROJ-2")
+    - jql: 대상 이슈를 고를 JQL. issue_keys 대신 사용.
+    - dry_run: True면 실제로 바꾸지 않고 전환 가능 여부만 확인.
+    - max_workers: 동시 작업 수. 기본값 8.
+    """
+    try:
+        def run():
+            if jql.strip():
+                keys = [i["key"] for i in jira_cli.iter_search(jql.strip(), fields=["status", "issuetype"])]
+            else:
+                keys = jira_cli.parse_issue_keys(issue_keys)
+            return keys, list(jira_cli.transition_bulk(keys, target_status, workers=max_workers, dry_run=dry_run))
+
+        # 일괄 전환은 스레드 풀 기반이므로 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+        keys, results = await asyncio.to_thread(run)
+        if not keys:
+            return "대상 이슈가 없습니다."
+        ok = sum(1 for r in results if r["ok"])
+        head = f"{len(keys)}건 → {target_status}" + (" (dry-run)" if dry_run else "")
+        body = "\n".join(jira_cli.format_bulk_result(r) for r in results)
+        return f"{head}\n{body}\n성공 {ok}건 / 실패 {len(results) - ok}건"
+    except Exception as e:
+        return f"오류: {e}"
+
+
+@mcp.tool()
+async def jira_create(
     project_key: str,
     summary: str,
     issuetype: str = "Task",
     description: str = "",
     assign_to_self: bool = False,
     custom_fields_json: str = "",
+    assignee: str = "",
 ) -> str:
     """Jira 티켓을 생성합니다.
     - project_key: 프로젝트 키 (예: PROJ, CLOSET)
     - summary: 티켓 제목
     - issuetype: 이슈 타입 (예: Task, Bug, Story). 기본값 Task.
-    - description: 설명(플레인 텍스트). Bug 시 필수 커스텀 필드(재현 방법/기대 결과)에 사용됨.
+    - description: 설명(Markdown: 목록, 제목, ``` 코드 블록, 표, **굵게**, [링크](url) 지원). Bug 시 필수 커스텀 필드(재현 방법/기대 결과)에 사용됨.
     - assign_to_self: True면 현재 사용자를 담당자로 지정.
+    - assignee: 담당자 이름 또는 이메일 (예: 'Jiwon Park', 'jiwon@example.com'). 로컬 사용자 디렉터리에서 찾고, 여러 명이면 후보와 함께 오류.
     - custom_fields_json: 커스텀 필드 덮어쓰기(JSON 문자열). 비우면 config/required_fields.json 기본값 사용.
       CLOSET Bug 필수 필드: Issue Category, Live/Staging/Both, 기대 결과, 작업 내용/재현 방법, 기능 영향 범위.
       자세한 옵션은 docs/MCP_REQUIRED_FIELDS.md 참고.
+    보내기 전에 생성 화면 정보(createmeta, 캐시)로 필수 필드·옵션 id를 검사해, 문제가 있으면 허용 값과 함께 바로 오류를 반환.
     """
     try:
         custom_fields = None
         if custom_fields_json and custom_fields_json.strip():
-            import json
             custom_fields = json.loads(custom_fields_json.strip())
-        key, url = jira_cli.create_issue(
+        key, url = await jira_async.create_issue(
             project_key=project_key,
             summary=summary,
             issuetype=issuetype,
             description=description or None,
             assign_to_self=assign_to_self,
             custom_fields=custom_fields,
+            assignee=assignee.strip() or None,
         )
         return f"생성됨: {key}\n{url}"
     except Exception as e:
@@ -119,31 +406,118 @@ def jira_create(
 
 
 @mcp.tool()
-def jira_edit(
+async def jira_fields(project_key: str, issuetype: str = "", refresh: bool = False) -> str:
+    """프로젝트·이슈 타입의 생성 필드(필수 여부, 타입, 허용 옵션 id)를 조회합니다. jira_create의 custom_fields_json 작성용.
+    - project_key: 프로젝트 키 (예: CLOSET)
+    - issuetype: 이슈 타입 (예: Bug). 비우면 생성 가능한 이슈 타입 목록.
+    - refresh: True면 캐시를 무시하고 Jira에서 다시 가져옴.
+    """
+    try:
+        if issuetype.strip():
+            meta = await asyncio.to_thread(jira_cli.get_createmeta, project_key, issuetype, refresh)
+            return jira_cli.format_createmeta(meta).strip()
+        types, _ = await asyncio.to_thread(jira_cli.get_createmeta_types, project_key, refresh)
+        return f"{project_key.upper()} 이슈 타입\n" + "\n".join(f"  {t['id']:>8}  {t['name']}" for t in types)
+    except Exception as e:
+        return f"오류: {e}"
+
+
+@mcp.tool()
+async def jira_create_bulk(rows_jsonl: str = "", file_path: str = "") -> str:
+    """여러 Jira 티켓을 한 번에 생성합니다 (50건씩 /issue/bulk). 행별 생성 키 또는 오류를 반환합니다.
+    - rows_jsonl: 한 줄에 하나씩 JSON 객체. 키: project, summary, issuetype(기본 Task), description,
+      assign_me(true/false), assignee(담당자 이름·이메일), custom_fields({...}) 또는 customfield_XXXXX. 필수 커스텀 필드 기본값은 jira_create와 동일하게 적용.
+    - file_path: rows_jsonl 대신 읽을 .jsonl/.csv 파일 경로.
+    """
+    try:
+        def run():
+            if file_path.strip():
+                path = file_path.strip()
+                fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+                with open(path, encoding="utf-8-sig", newline="") as fp:
+                    return list(jira_cli.create_issues_bulk(jira_cli.iter_issue_rows(fp, fmt)))
+            return list(jira_cli.create_issues_bulk(jira_cli.iter_issue_rows(rows_jsonl.splitlines())))
+
+        results = await asyncio.to_thread(run)
+        if not results:
+            return "생성할 행이 없습니다."
+        ok = sum(1 for r in results if r["ok"])
+        body = "\n".join(jira_cli.format_create_result(r) for r in results)
+        return f"{body}\n생성 {ok}건 / 실패 {len(results) - ok}건"
+    except Exception as e:
+        return f"오류: {e}"
+
+
+@mcp.tool()
+async def jira_edit(
     issue_key: str,
     summary: str = "",
     description: str = "",
     assign_to_self: bool = False,
+    assignee: str = "",
 ) -> str:
     """Jira 티켓을 수정합니다. 지정한 필드만 변경됩니다.
     - issue_key: 이슈 키 (예: PROJ-123)
     - summary: 새 제목. 비우면 변경 안 함.
-    - description: 새 설명(플레인 텍스트). 비우면 변경 안 함.
+    - description: 새 설명(Markdown). 비우면 변경 안 함.
     - assign_to_self: True면 현재 사용자를 담당자로 지정.
+    - assignee: 담당자 이름 또는 이메일. 로컬 사용자 디렉터리에서 찾고, 여러 명이면 후보와 함께 오류. 비우면 변경 안 함.
     """
     try:
-        ok, msg = jira_cli.update_issue(
+        ok, msg = await jira_async.update_issue(
             issue_key=issue_key,
             summary=summary or None,
             description=description or None,
             assign_to_self=assign_to_self,
+            assignee=assignee.strip() or None,
         )
         return msg
     except Exception as e:
         return f"오류: {e}"
 
 
+@mcp.tool()
+async def jira_cache_stats(clear: bool = False) -> str:
+    """이 서버의 응답 캐시(jira_show·jira_search 결과) 사용 현황: 크기, 적중/실패, LRU 제거, 만료, 무효화.
+    - clear: True면 통계를 보여 준 뒤 캐시를 비움 (Jira에서 직접 바뀐 내용을 바로 보고 싶을 때).
+    """
+    cache = jira_cli._responses
+    st = cache.stats()
+    ttl = ", ".join(f"{k}={v:g}s" for k, v in st["ttl"].items())
+    text = (
+        f"응답 캐시: {st['entries']}건 / {st['bytes'] / 1048576:.1f} MB (한도 {st['max_bytes'] / 1048576:.1f} MB)\n"
+        f"적중 {st['hits']} / 실패 {st['misses']} (적중률 {st['hit_rate']:.0%})"
+        f" / LRU 제거 {st['evictions']} / 만료 {st['expired']} / 무효화 {st['invalidated']}\n"
+        f"TTL: {ttl}"
+    )
+    if clear:
+        cache.clear()
+        text += "\n캐시를 비웠습니다."
+    return text
+
+
+@mcp.tool()
+async def jira_stats(output: str = "text", reset: bool = False) -> str:
+    """이 서버가 시작된 뒤(또는 마지막 reset 뒤) 보낸 Jira 요청과 처리 단계의 통계.
+    단계 트리(예: create_issue → get_account_id → GET /myself)별 호출 수·시간, 엔드포인트별 p50/p99 지연·송수신 바이트·상태 코드·재시도, 캐시 적중.
+    - output: text(표), json, prometheus
+    - reset: True면 보여 준 뒤 통계를 0으로 (응답 캐시 내용은 유지)
+    """
+    metrics = jira_cli._metrics
+    if output == "json":
+        text = json.dumps(metrics.snapshot(), ensure_ascii=False, indent=1)
+    elif output == "prometheus":
+        text = jira_cli.metrics_prometheus(metrics)
+    else:
+        uptime = time.time() - metrics.started
+        text = f"통계 ({uptime:.0f}초 동안)\n" + jira_cli.format_profile(metrics)
+    if reset:
+        metrics.reset()
+    return text
+
+
 def main() -> None:
+    jira_cli.start_metrics_writer()
     # Cursor는 기본적으로 stdio로 MCP 서버를 실행함
     mcp.run(transport="stdio")
 